@@ -20,9 +20,14 @@
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict, Counter, OrderedDict, deque
+from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+
 
 # =============================================================================
 # 1️⃣ List - Java ArrayList / Go slice
@@ -350,22 +355,31 @@ def performance_comparison() -> None:
     * 평균 케이스, 해시 충돌 시 O(n)
     """)
     
-    # 실제 벤치마크
-    import timeit
-    
-    # 리스트에서 검색 vs Set에서 검색
-    n = 10000
-    test_list = list(range(n))
-    test_set = set(range(n))
-    
-    # 존재하는 요소 검색
-    list_time = timeit.timeit(lambda: 9999 in test_list, number=1000)
-    set_time = timeit.timeit(lambda: 9999 in test_set, number=1000)
+    # 실제 벤치마크 (워밍업 + 반복 측정, 아래 @register 참고)
+    results = {r.name: r for r in run_group("collections")}
+    list_time = results["collections.search.list"].median
+    set_time = results["collections.search.set"].median
     
-    print(f"\n검색 성능 (n={n}, 1000회):")
-    print(f"  list: {list_time:.4f}초")
-    print(f"  set:  {set_time:.4f}초")
-    print(f"  차이: {list_time/set_time:.1f}배 빠름")
+    print(f"\n검색 성능 (n={SEARCH_N}, 호출 1회당 중앙값):")
+    print(format_table(results.values()))
+    print(f"  차이: set이 {list_time/set_time:.1f}배 빠름")
+
+
+SEARCH_N = 10000
+
+
+@register("collections.search.list", group="collections",
+          setup=lambda: list(range(SEARCH_N)), number=1000)
+def bench_list_search(data: list[int]) -> None:
+    """리스트 멤버십 검색 - O(n)."""
+    9999 in data
+
+
+@register("collections.search.set", group="collections",
+          setup=lambda: set(range(SEARCH_N)), number=1000)
+def bench_set_search(data: set[int]) -> None:
+    """Set 멤버십 검색 - O(1)."""
+    9999 in data
 
 
 # =============================================================================
@@ -227,6 +227,8 @@ def closure_demo() -> None:
     print(f"\n클로저의 자유 변수: {counter1.__code__.co_freevars}")
     
     # 실용적인 예: 캐싱 데코레이터
+    # ⚠️ 클로저 설명용 최소 구현 (dict가 무제한으로 커지고 스레드 안전하지 않음)
+    #    실무에서는 functools.lru_cache 또는 10-performance/05_memoize_cache.py의 memoize 사용
     def memoize(func: Callable[..., Any]) -> Callable[..., Any]:
         """결과를 캐싱하는 데코레이터."""
         cache: dict[tuple[Any, ...], Any] = {}
@@ -250,6 +252,7 @@ def closure_demo() -> None:
     print("\n메모이제이션 피보나치:")
     result = fibonacci(5)
     print(f"  결과: {result}")
+    print("  💡 크기 제한/TTL/통계가 필요하면 → 10-performance/05_memoize_cache.py")
 
 
 # =============================================================================
@@ -20,8 +20,13 @@
 
 from __future__ import annotations
 
+import sys
+from pathlib import Path
 from typing import Iterator
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+
 
 # =============================================================================
 # 1️⃣ List Comprehension 기초
@@ -305,38 +310,34 @@ def comprehension_performance() -> None:
     """
     Comprehension vs for문 성능 비교.
     """
-    import timeit
-    
-    n = 10000
-    
-    # List Comprehension
-    comp_time = timeit.timeit(
-        "[x**2 for x in range(1000)]",
-        number=n
-    )
+    results = {r.name: r for r in run_group("comprehension")}
+    comp_time = results["comprehension.list_comp"].median
+    loop_time = results["comprehension.for_append"].median
     
-    # 일반 for문
-    loop_code = """
-result = []
-for x in range(1000):
-    result.append(x**2)
-"""
-    loop_time = timeit.timeit(loop_code, number=n)
-    
-    # map + lambda
-    map_time = timeit.timeit(
-        "list(map(lambda x: x**2, range(1000)))",
-        number=n
-    )
-    
-    print(f"성능 비교 ({n}회 반복):")
-    print(f"  List Comprehension: {comp_time:.3f}초")
-    print(f"  for문 + append:     {loop_time:.3f}초")
-    print(f"  map + lambda:       {map_time:.3f}초")
+    print("성능 비교 (range(1000) 제곱, 호출 1회당 중앙값):")
+    print(format_table(results.values()))
     print(f"\n💡 Comprehension이 {loop_time/comp_time:.1f}배 빠름!")
     print("   (내부 최적화 덕분)")
 
 
+@register("comprehension.list_comp", group="comprehension", number=1000)
+def bench_list_comp() -> list[int]:
+    return [x**2 for x in range(1000)]
+
+
+@register("comprehension.for_append", group="comprehension", number=1000)
+def bench_for_append() -> list[int]:
+    result = []
+    for x in range(1000):
+        result.append(x**2)
+    return result
+
+
+@register("comprehension.map_lambda", group="comprehension", number=1000)
+def bench_map_lambda() -> list[int]:
+    return list(map(lambda x: x**2, range(1000)))
+
+
 # =============================================================================
 # 메인 실행
 # =============================================================================
@@ -119,6 +119,8 @@ def deep_copy_demo() -> None:
     print(f"\n  deep[0].append(999) 후:")
     print(f"  original = {original}")  # [[1, 2], ...] - 변경 없음!
     print(f"  deep = {deep}")  # [[1, 2, 999], ...]
+    print("\n  💡 큰 트리를 '값 몇 개만 바꾼 새 버전'으로 자주 만든다면 deepcopy 대신")
+    print("     구조 공유 → 10-performance/09_persistent_structures.py")
 
 
 # =============================================================================
@@ -151,6 +153,8 @@ def dict_copy_demo() -> None:
     deep["user"]["age"] = 31
     print(f"  deep['user']['age'] = 31 후:")
     print(f"  original['user']['age'] = {original['user']['age']}")  # 30
+    print("\n  💡 복사본을 대부분 읽고 몇 군데만 쓴다면 deepcopy 대신 쓸 때만 그 경로를 복사")
+    print("     → 10-performance/10_copy_on_write.py (cow_copy)")
 
 
 # =============================================================================
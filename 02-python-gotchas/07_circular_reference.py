@@ -139,6 +139,7 @@ def parent_child_demo() -> None:
     
     # 순환: parent → children → child → parent
     print("  ⚠️ 순환 참조 발생: parent → children → child → parent")
+    print("  💡 이런 순환이 전역 목록 등에 붙잡혀 쌓이면 → 03-memory-and-gc/05_leak_detector.py")
 
 
 # =============================================================================
@@ -225,6 +226,8 @@ def weakref_patterns_demo() -> None:
     del obj1
     gc.collect()
     print(f"    del obj1 후 cache[1]: {cache.get(1)}")  # None
+    print("    💡 참조를 놓자마자 사라짐 → 자주 쓰는 객체는 재생성 반복")
+    print("       (강한 참조 LRU를 앞에 두는 2단계 캐시: 10-performance/07_two_tier_cache.py)")
     
     # 2. 콜백 (weakref.finalize)
     print("\n  2. 정리 콜백 (weakref.finalize):")
@@ -111,6 +111,9 @@ def gc_stats_demo() -> None:
         print(f"    collected: {stat['collected']}")
         print(f"    uncollectable: {stat['uncollectable']}")
 
+    print("\n  💡 수집 한 번에 얼마나 멈추는지 / 튜닝은 → 02_gc_module.py (gc.callbacks)")
+    print("  💡 어디서 메모리가 늘었는지는 → 03_memory_profiling.py (tracemalloc)")
+
 
 def main() -> None:
     """메인 실행."""
@@ -0,0 +1,364 @@
+"""
+02_gc_module.py - gc 모듈: 수집 비용 측정과 튜닝
+
+📌 핵심 개념:
+    01_reference_counting.py의 gc_stats_demo()는 gc.get_threshold()와 횟수만 보여줍니다.
+    정작 궁금한 것은 "수집 한 번에 얼마나 멈추는가"입니다.
+
+    측정: gc.callbacks
+        - 수집 시작/끝에 callback(phase, info) 호출 ("start" / "stop", info["generation"])
+        - GCPauseRecorder가 세대별로 멈춘 시간을 기록
+
+    튜닝 (GCPolicy):
+        - freeze     : 시작 시 만든 객체(설정, 캐시, 모듈)를 gc.freeze()로 영구 세대로
+                       → 2세대 수집이 그 객체들을 다시 훑지 않음
+        - thresholds : gc.set_threshold(50_000, ...)로 0세대 수집 빈도를 낮춤
+        - batch      : 배치 처리 중 gc.disable(), 배치 사이에만 수집 (gc_paused)
+
+🔄 다른 언어 비교:
+    - Java: -Xlog:gc 로 pause 기록, G1/ZGC 선택과 -XX:MaxGCPauseMillis
+    - Go: GODEBUG=gctrace=1, GOGC / debug.SetGCPercent, GOMEMLIMIT
+    - Python: gc.callbacks + gc.set_threshold / gc.freeze / gc.disable
+
+⚠️ 주의사항:
+    - 참조 카운팅은 gc와 무관하게 계속 동작합니다. gc를 꺼도 순환이 아닌 객체는 즉시 해제
+    - gc를 끈 동안 생긴 순환 쓰레기는 쌓입니다 → 반드시 구간을 짧게, 끝나면 수집
+    - gc.freeze()는 fork 전 메모리 공유(copy-on-write) 개선에도 쓰입니다 (3.7+)
+
+📚 참고: https://docs.python.org/3/library/gc.html#gc.callbacks
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.core import percentile  # noqa: E402
+
+
+# =============================================================================
+# 1️⃣ 수집 시간 측정 (gc.callbacks)
+# =============================================================================
+
+@dataclass
+class GenerationPauses:
+    """한 세대의 수집 시간들 (초)."""
+    pauses: list[float] = field(default_factory=list)
+    collected: int = 0
+
+    @property
+    def total(self) -> float:
+        return sum(self.pauses)
+
+    def summary(self) -> str:
+        if not self.pauses:
+            return "0회"
+        ordered = sorted(self.pauses)
+        return (f"{len(ordered):>5,}회  합계 {self.total * 1e3:7.1f}ms"
+                f"  p50 {percentile(ordered, 50) * 1e3:6.2f}ms  max {ordered[-1] * 1e3:6.2f}ms"
+                f"  회수 {self.collected:,}개")
+
+
+class GCPauseRecorder:
+    """
+    gc.callbacks로 모든 수집의 소요 시간을 세대별로 기록.
+
+    사용 예:
+        with GCPauseRecorder() as rec:
+            workload()
+        for gen, pauses in rec.generations.items():
+            print(gen, pauses.summary())
+    """
+
+    def __init__(self) -> None:
+        self.generations = {gen: GenerationPauses() for gen in range(3)}
+        self._started: float | None = None
+
+    def _callback(self, phase: str, info: dict[str, Any]) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            gen = self.generations[info["generation"]]
+            gen.pauses.append(time.perf_counter() - self._started)
+            gen.collected += info["collected"]
+            self._started = None
+
+    def install(self) -> None:
+        gc.callbacks.append(self._callback)
+
+    def uninstall(self) -> None:
+        if self._callback in gc.callbacks:
+            gc.callbacks.remove(self._callback)
+
+    def __enter__(self) -> GCPauseRecorder:
+        self.install()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.uninstall()
+
+    @property
+    def total(self) -> float:
+        return sum(g.total for g in self.generations.values())
+
+
+# =============================================================================
+# 2️⃣ 튜닝 유틸리티
+# =============================================================================
+
+def collect_due() -> int:
+    """
+    자동 수집이었다면 골랐을 세대를 수집하고 그 세대를 반환.
+
+    gc.get_count()가 임계값을 넘은 가장 오래된 세대 (2세대의 "25% 승격" 조건은 생략).
+    gc.collect(0)만 반복하면 1·2세대는 영영 수집되지 않으므로 필요합니다.
+    """
+    counts, thresholds = gc.get_count(), gc.get_threshold()
+    generation = next((g for g in (2, 1) if counts[g] >= thresholds[g]), 0)
+    gc.collect(generation)
+    return generation
+
+
+@contextmanager
+def gc_paused(collect: bool = True) -> Iterator[None]:
+    """
+    블록 동안 gc를 끄고, 끝나면 원래 상태로 + collect_due()로 밀린 수집.
+
+    사용 예:
+        for batch in batches:
+            with gc_paused():          # 배치 안에서는 수집으로 멈추지 않음
+                handle(batch)
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+        if collect:
+            collect_due()
+
+
+@contextmanager
+def gc_thresholds(gen0: int, gen1: int | None = None, gen2: int | None = None) -> Iterator[None]:
+    """블록 동안 gc.set_threshold 변경 (None이면 기존 값 유지)."""
+    old = gc.get_threshold()
+    gc.set_threshold(gen0, old[1] if gen1 is None else gen1, old[2] if gen2 is None else gen2)
+    try:
+        yield
+    finally:
+        gc.set_threshold(*old)
+
+
+@contextmanager
+def gc_frozen() -> Iterator[None]:
+    """
+    지금까지 살아 있는 객체를 영구 세대로 (시작 직후, 요청 처리 전에 사용).
+
+    gc.collect() 후 freeze → 쓰레기까지 얼리지 않도록.
+    """
+    gc.collect()
+    gc.freeze()
+    try:
+        yield
+    finally:
+        gc.unfreeze()
+
+
+@dataclass(frozen=True)
+class GCPolicy:
+    """벤치마크용 정책 묶음."""
+    name: str
+    freeze: bool = False
+    threshold0: int | None = None
+    batch_pause: bool = False
+
+    @contextmanager
+    def process(self) -> Iterator[None]:
+        """프로세스 전체(요청 루프 전체)에 적용할 설정."""
+        with (gc_frozen() if self.freeze else _nothing()), \
+             (gc_thresholds(self.threshold0) if self.threshold0 else _nothing()):
+            yield
+
+    def batch(self) -> Any:
+        """배치 하나에 적용할 설정."""
+        return gc_paused() if self.batch_pause else _nothing()
+
+
+@contextmanager
+def _nothing() -> Iterator[None]:
+    yield
+
+
+POLICIES = (
+    GCPolicy("default"),
+    GCPolicy("freeze", freeze=True),
+    GCPolicy("thresholds", threshold0=50_000),
+    GCPolicy("batch", batch_pause=True),
+    GCPolicy("freeze+batch", freeze=True, batch_pause=True),
+)
+
+
+# =============================================================================
+# 3️⃣ 벤치마크: 오래 사는 객체가 많은 프로세스 + 할당이 많은 요청
+# =============================================================================
+
+STARTUP_OBJECTS = 300_000  # 설정/캐시/모듈 등 시작 시 만들어져 끝까지 사는 객체
+REQUESTS = 6_000
+BATCH = 50                 # 배치당 요청 수
+NODES_PER_REQUEST = 200
+RETAINED_PER_REQUEST = 20  # 요청마다 결과 일부가 캐시/세션에 남음 → 2세대로 승격
+
+
+class Node:
+    __slots__ = ("value", "peer", "__weakref__")
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.peer: Node | None = None
+
+
+def build_startup_state(n: int = STARTUP_OBJECTS) -> list[dict[str, Any]]:
+    """오래 사는 컨테이너 n개 (2세대 수집마다 전부 훑어야 하는 대상)."""
+    return [{"id": i, "tags": [i]} for i in range(n // 2)]
+
+
+def handle_request(i: int, retained: list[Node]) -> int:
+    """노드를 만들고 짝끼리 순환시킴 → 대부분 요청이 끝나면 순환 쓰레기, 일부는 retained에 남음."""
+    nodes = [Node(i + j) for j in range(NODES_PER_REQUEST)]
+    for a, b in zip(nodes[::2], nodes[1::2]):
+        a.peer, b.peer = b, a
+    retained.extend(nodes[:RETAINED_PER_REQUEST])
+    return sum(n.value for n in nodes)
+
+
+@dataclass
+class PolicyResult:
+    name: str
+    latencies: list[float]
+    elapsed: float
+    recorder: GCPauseRecorder
+
+    def row(self) -> str:
+        lat = sorted(self.latencies)
+        gen = self.recorder.generations
+        return (f"  {self.name:<13} p50 {percentile(lat, 50) * 1e6:6.0f}µs"
+                f"  p99 {percentile(lat, 99) * 1e6:7.0f}µs  max {lat[-1] * 1e3:6.1f}ms"
+                f"  GC {len(gen[0].pauses):>3}/{len(gen[1].pauses):>2}/{len(gen[2].pauses):>2}회"
+                f" {self.recorder.total * 1e3:6.1f}ms  전체 {self.elapsed:5.2f}s")
+
+
+def run_policy(policy: GCPolicy, requests: int = REQUESTS) -> PolicyResult:
+    """
+    시작 상태를 만든 뒤 정책을 적용하고 요청별 지연을 잽니다.
+
+    요청은 쉬지 않고 도착한다고 보고, 각 요청의 지연은 직전 요청이 끝난 시점부터 잽니다.
+    batch 정책의 배치 사이 수집은 다음 배치 첫 요청에 포함됩니다
+    (마지막 배치 뒤 수집은 기다리는 요청이 없으므로 전체 시간에만 들어감).
+    """
+    state = build_startup_state()
+    gc.collect()  # 시작 상태는 이미 2세대 (오래 돈 프로세스처럼)
+    retained: list[Node] = []
+    latencies: list[float] = []
+    recorder = GCPauseRecorder()
+    start = time.perf_counter()
+    with policy.process(), recorder:
+        ready = time.perf_counter()
+        for b in range(0, requests, BATCH):
+            with policy.batch():
+                for i in range(b, min(b + BATCH, requests)):
+                    handle_request(i, retained)
+                    # 직전 요청이 끝난 시점부터 잼 → 배치 사이 수집(gc_paused 종료)은
+                    # 그동안 대기한 다음 요청의 지연으로 잡힘
+                    done = time.perf_counter()
+                    latencies.append(done - ready)
+                    ready = done
+    elapsed = time.perf_counter() - start
+    del state, retained
+    gc.collect()
+    return PolicyResult(policy.name, latencies, elapsed, recorder)
+
+
+# =============================================================================
+# 4️⃣ 데모
+# =============================================================================
+
+def callbacks_demo() -> None:
+    """gc.callbacks가 받는 정보."""
+    print("\n📌 gc.callbacks: 수집마다 (phase, info)")
+    print("-" * 50)
+    events: list[tuple[str, dict[str, Any]]] = []
+
+    def callback(phase: str, info: dict[str, Any]) -> None:
+        events.append((phase, dict(info)))
+
+    gc.callbacks.append(callback)
+    try:
+        gc.collect(1)
+    finally:
+        gc.callbacks.remove(callback)
+    for phase, info in events:
+        print(f"  {phase:<5} {info}")
+
+
+def recorder_demo() -> None:
+    """GCPauseRecorder로 세대별 수집 시간."""
+    print(f"\n📌 시작 객체 {STARTUP_OBJECTS:,}개 + 요청 {REQUESTS:,}개 (기본 설정)")
+    print("-" * 50)
+    print(f"  threshold: {gc.get_threshold()}")
+    result = run_policy(POLICIES[0])
+    for gen, pauses in result.recorder.generations.items():
+        print(f"  gen{gen}: {pauses.summary()}")
+    print("  💡 2세대 수집은 드물지만, 살아 있는 객체 전체를 훑어서 한 번이 김 (max 지연)")
+
+
+def policy_benchmark() -> None:
+    """정책별 요청 지연 p50/p99/max와 GC 시간 (GC 횟수는 gen0/gen1/gen2)."""
+    print(f"\n📌 정책별 요청 지연 (요청 {REQUESTS:,}개, 배치 {BATCH}개, 요청당 순환 노드 {NODES_PER_REQUEST})")
+    print("-" * 50)
+    for policy in POLICIES:
+        print(run_policy(policy).row())
+    print("\n  💡 freeze: 시작 객체가 2세대 수집 대상에서 빠짐 → 한 번의 긴 멈춤이 짧아짐")
+    print("     (2세대 기준 크기도 작아져서 더 자주 돌 수 있음)")
+    print("     thresholds: 수집 횟수↓ p99↓, 대신 한 번이 길어짐 (max)")
+    print("     batch: 요청 중에는 멈추지 않음 → 비용은 배치 사이로 이동 (전체 시간은 비슷)")
+    print("            배치 사이 수집은 그동안 기다린 다음 요청의 지연에 포함 (p99/max에 반영)")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🧹 gc 모듈: 수집 비용 측정과 튜닝")
+    print("=" * 60)
+
+    callbacks_demo()
+    recorder_demo()
+    policy_benchmark()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   gc 튜닝 정리                                 ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  측정 먼저: gc.callbacks로 세대별 멈춤 시간                   ║
+    ║                                                               ║
+    ║  gc.freeze()          시작 객체를 수집 대상에서 제외          ║
+    ║  gc.set_threshold()   0세대 수집 빈도 조절                    ║
+    ║  gc.disable() 구간    배치 중 멈춤 없음, 끝나면 collect       ║
+    ║                                                               ║
+    ║  ⚠️ 끄기만 하고 수집하지 않으면 순환 쓰레기가 계속 쌓임       ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,395 @@
+"""
+03_memory_profiling.py - tracemalloc으로 메모리 프로파일링
+
+📌 핵심 개념:
+    01_reference_counting.py의 sys.getrefcount / gc.get_stats()는
+    "객체가 언제 해제되는가"를 보여줄 뿐, "메모리가 어디서 늘었는가"는 알려주지 않습니다.
+
+    tracemalloc은 할당마다 호출 위치(파일:줄)를 기록합니다.
+        - take_snapshot().statistics("lineno") → 줄별 할당 크기 상위 N개
+        - get_traced_memory() → (현재, peak)
+        - snapshot2.compare_to(snapshot1) → 두 시점 사이에 늘어난 줄
+
+    이 예제의 도구:
+        - track_memory()     : with 블록의 peak / 상위 할당 위치 / 전후 diff
+        - @profile_memory    : 함수 호출마다 같은 보고서 출력
+        - SnapshotTracker    : 오래 도는 워커에서 주기적으로 snapshot → 기준점 대비 증가한 줄
+
+🔄 다른 언어 비교:
+    - Java: JFR allocation profiling, heap dump 비교 (Eclipse MAT)
+    - Go: pprof heap profile (-base로 두 프로파일 비교)
+    - Python: tracemalloc (표준 라이브러리), 서드파티 memray / memory-profiler
+
+⚠️ 주의사항:
+    - 추적 중에는 할당이 느려지고 메모리도 더 씁니다 (프레임 수에 비례)
+    - tracemalloc.start() 이전에 할당된 객체는 보이지 않습니다
+    - C 확장이 직접 malloc한 메모리는 보이지 않습니다 (Python 할당자 경유분만)
+
+📚 참고: https://docs.python.org/3/library/tracemalloc.html
+"""
+
+from __future__ import annotations
+
+import functools
+import linecache
+import threading
+import tracemalloc
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# tracemalloc 자신과 import 기계의 할당은 보고서에서 제외
+NOISE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def format_bytes(size: float) -> str:
+    """바이트 수를 사람이 읽는 단위로."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:,.1f} {unit}" if unit != "B" else f"{size:,.0f} {unit}"
+        size /= 1024
+    return f"{size:,.1f} GiB"
+
+
+# =============================================================================
+# 1️⃣ 보고서
+# =============================================================================
+
+@dataclass
+class AllocationSite:
+    """할당 위치 하나 (파일:줄)."""
+    location: str
+    size: int
+    count: int
+    size_diff: int = 0
+    count_diff: int = 0
+
+    @classmethod
+    def from_stat(cls, stat: tracemalloc.Statistic | tracemalloc.StatisticDiff) -> AllocationSite:
+        frame = stat.traceback[0]
+        return cls(
+            location=f"{frame.filename}:{frame.lineno}",
+            size=stat.size,
+            count=stat.count,
+            size_diff=getattr(stat, "size_diff", 0),
+            count_diff=getattr(stat, "count_diff", 0),
+        )
+
+    def source(self) -> str:
+        filename, _, lineno = self.location.rpartition(":")
+        return linecache.getline(filename, int(lineno)).strip()
+
+
+@dataclass
+class MemoryReport:
+    """track_memory()가 채워주는 결과."""
+    label: str = ""
+    current: int = 0           # 블록 끝에서 추적 중인 메모리
+    peak: int = 0              # 블록 안에서의 최대값
+    growth: int = 0            # 블록 전후 차이
+    top: list[AllocationSite] = field(default_factory=list)   # 끝 시점 상위 할당 위치
+    diff: list[AllocationSite] = field(default_factory=list)  # 전후 비교 상위 증가 위치
+
+    def format(self) -> str:
+        lines = [f"  [{self.label}] peak {format_bytes(self.peak)},"
+                 f" 증가 {format_bytes(self.growth)}, 현재 {format_bytes(self.current)}"]
+        if self.diff:
+            lines.append("    증가한 줄 (전후 diff):")
+            for site in self.diff:
+                lines.append(f"      {format_bytes(site.size_diff):>12} {site.count_diff:>+8,}개"
+                             f"  {_short(site.location)}  {site.source()}")
+        if self.top:
+            lines.append("    상위 할당 위치 (끝 시점):")
+            for site in self.top:
+                lines.append(f"      {format_bytes(site.size):>12} {site.count:>8,}개"
+                             f"  {_short(site.location)}  {site.source()}")
+        return "\n".join(lines)
+
+
+def _short(location: str) -> str:
+    """경로는 파일 이름만."""
+    path, _, lineno = location.rpartition(":")
+    return f"{path.replace(chr(92), '/').rsplit('/', 1)[-1]}:{lineno}"
+
+
+def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+    return snapshot.filter_traces(NOISE_FILTERS)
+
+
+def top_sites(snapshot: tracemalloc.Snapshot, limit: int = 10) -> list[AllocationSite]:
+    """snapshot의 줄별 할당 상위 limit개."""
+    return [AllocationSite.from_stat(s) for s in _filtered(snapshot).statistics("lineno")[:limit]]
+
+
+def diff_sites(new: tracemalloc.Snapshot, old: tracemalloc.Snapshot,
+               limit: int = 10) -> list[AllocationSite]:
+    """old → new 사이에 늘어난 줄 상위 limit개 (줄어든 줄은 제외)."""
+    stats = _filtered(new).compare_to(_filtered(old), "lineno")
+    return [AllocationSite.from_stat(s) for s in stats if s.size_diff > 0][:limit]
+
+
+# =============================================================================
+# 2️⃣ 컨텍스트 매니저 / 데코레이터
+# =============================================================================
+
+# 열린 track_memory 블록(모든 스레드)의 peak 하한. reset_peak()는 프로세스 전역이라
+# 어느 블록이 리셋하든 다른 열린 블록의 peak가 지워지므로, 리셋 직전 peak를 모두에게 남김.
+# 블록마다 자기 칸(list 1개)을 가지고 끝날 때 identity로 제거 → 스레드가 섞여도 안전
+_open_floors: list[list[int]] = []
+_floors_lock = threading.Lock()
+
+
+def _raise_floors(peak: int) -> None:
+    for floor in _open_floors:
+        floor[0] = max(floor[0], peak)
+
+
+@contextmanager
+def track_memory(label: str = "block", *, top: int = 5, frames: int = 1) -> Iterator[MemoryReport]:
+    """
+    with 블록의 메모리 사용을 측정.
+
+    사용 예:
+        with track_memory("load", top=5) as report:
+            data = load()
+        print(report.format())
+
+    이미 tracemalloc이 켜져 있으면 그대로 두고(중첩 가능), 직접 켰을 때만 끕니다.
+    중첩되면 안쪽 블록이 reset_peak()로 지운 바깥 peak를 하한으로 넘겨받아 보고합니다.
+    ⚠️ tracemalloc은 프로세스 전역이라 여러 스레드에서 동시에 쓰면 peak에 다른 스레드의
+       할당도 섞입니다 (서로의 peak를 지우지는 않음).
+    """
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(frames)
+    report = MemoryReport(label=label)
+    before = tracemalloc.take_snapshot()
+    floor = [0]
+    with _floors_lock:
+        base, outer_peak = tracemalloc.get_traced_memory()
+        _raise_floors(outer_peak)
+        tracemalloc.reset_peak()
+        _open_floors.append(floor)
+    try:
+        yield report
+    finally:
+        with _floors_lock:
+            current, peak = tracemalloc.get_traced_memory()
+            _open_floors[:] = [f for f in _open_floors if f is not floor]
+            _raise_floors(peak)
+            peak = max(peak, floor[0])
+        after = tracemalloc.take_snapshot()
+        if started_here:
+            tracemalloc.stop()
+        report.current = current
+        report.peak = peak - base
+        report.growth = current - base
+        report.top = top_sites(after, top)
+        report.diff = diff_sites(after, before, top)
+
+
+def profile_memory(
+    func: F | None = None,
+    *,
+    top: int = 5,
+    frames: int = 1,
+    report: Callable[[MemoryReport], None] | None = None,
+) -> Any:
+    """
+    호출마다 track_memory 보고서를 만드는 데코레이터.
+
+    사용 예:
+        @profile_memory(top=3)
+        def build_index(rows): ...
+
+        build_index(rows)              # 보고서 출력
+        build_index.last_report        # 마지막 MemoryReport
+    """
+    def decorator(f: F) -> F:
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with track_memory(f.__qualname__, top=top, frames=frames) as result:
+                value = f(*args, **kwargs)
+            wrapper.last_report = result  # type: ignore[attr-defined]
+            if report is not None:
+                report(result)
+            else:
+                print(result.format())
+            return value
+
+        wrapper.last_report = None  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator(func) if func is not None else decorator
+
+
+# =============================================================================
+# 3️⃣ 오래 도는 워커용: 주기적 snapshot 비교
+# =============================================================================
+
+class SnapshotTracker:
+    """
+    기준 snapshot을 잡아 두고, 주기적으로 찍어서 "계속 늘어나는 줄"을 찾습니다.
+
+    사용 예:
+        tracker = SnapshotTracker()
+        tracker.start()
+        while True:
+            handle(request)
+            if n % 1000 == 0:
+                for site in tracker.check(top=3): print(site)
+        tracker.stop()
+
+    check()는 기준점 대비 diff를 돌려주므로, 워밍업 후(캐시 등이 찬 뒤) start()하면
+    정상적인 1회성 할당은 빠지고 누수만 남습니다.
+    """
+
+    def __init__(self, frames: int = 1) -> None:
+        self.frames = frames
+        self.baseline: tracemalloc.Snapshot | None = None
+        self.previous: tracemalloc.Snapshot | None = None
+        self.history: list[int] = []  # check()마다 추적 중인 메모리
+        self._started_here = False
+
+    def start(self) -> None:
+        self._started_here = not tracemalloc.is_tracing()
+        if self._started_here:
+            tracemalloc.start(self.frames)
+        self.baseline = self.previous = tracemalloc.take_snapshot()
+        self.history = [tracemalloc.get_traced_memory()[0]]
+
+    def check(self, top: int = 5, *, since_previous: bool = False) -> list[AllocationSite]:
+        """기준점(또는 직전 check) 대비 늘어난 줄."""
+        if self.baseline is None:
+            raise RuntimeError("start()를 먼저 호출하세요")
+        snapshot = tracemalloc.take_snapshot()
+        old = self.previous if since_previous else self.baseline
+        self.previous = snapshot
+        self.history.append(tracemalloc.get_traced_memory()[0])
+        return diff_sites(snapshot, old, top)
+
+    def growing(self) -> bool:
+        """check()마다 메모리가 단조 증가했는지."""
+        return len(self.history) > 2 and all(b > a for a, b in zip(self.history, self.history[1:]))
+
+    def stop(self) -> None:
+        if self._started_here and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.baseline = self.previous = None
+
+
+# =============================================================================
+# 4️⃣ 데모
+# =============================================================================
+
+def track_memory_demo() -> None:
+    """with 블록: peak vs 남은 메모리, 상위 할당 위치."""
+    print("\n📌 track_memory: peak와 남은 메모리는 다르다")
+    print("-" * 50)
+
+    with track_memory("temp list", top=3) as report:
+        squares = [i * i for i in range(200_000)]   # 잠깐 쓰고 버림 → peak에만 보임
+        total = sum(squares)
+        del squares
+        kept = {i: str(i) for i in range(20_000)}   # 블록 뒤에도 남음 → diff에 보임
+    print(report.format())
+    print(f"  (total={total:,}, kept={len(kept):,}개)")
+
+    with track_memory("outer", top=0) as outer:
+        big = [i * i for i in range(200_000)]
+        del big                                      # 바깥 peak는 여기서 생김
+        with track_memory("inner", top=0) as inner:  # 안쪽의 reset_peak()가 지워도
+            small = list(range(1_000))
+    print(f"  중첩: outer peak {format_bytes(outer.peak)} ≥ inner peak {format_bytes(inner.peak)}"
+          f" (small={len(small)}개)")
+
+
+@profile_memory(top=3)
+def build_records(n: int) -> list[dict[str, Any]]:
+    """데코레이터 데모: 레코드 n개 생성."""
+    return [{"id": i, "name": f"user-{i}", "tags": ["a", "b"]} for i in range(n)]
+
+
+def decorator_demo() -> None:
+    """@profile_memory: 호출마다 보고서."""
+    print("\n📌 @profile_memory")
+    print("-" * 50)
+    records = build_records(10_000)
+    report = build_records.last_report
+    print(f"  레코드 1개당 약 {report.growth / len(records):,.0f} B")
+
+
+_request_log: list[bytes] = []  # 누수 원인: 요청마다 쌓이고 비워지지 않음
+
+
+def handle_request(i: int) -> int:
+    """가짜 요청 처리: 임시 할당은 해제되지만 로그는 계속 쌓임."""
+    payload = bytes(1024)                     # 임시 (해제됨)
+    parsed = [payload[j:j + 64] for j in range(0, len(payload), 64)]
+    _request_log.append(payload[:256])        # 누수
+    return len(parsed)
+
+
+def long_running_worker_demo(rounds: int = 5, per_round: int = 2_000) -> None:
+    """오래 도는 워커: 어느 줄이 계속 늘어나는가."""
+    print(f"\n📌 SnapshotTracker: 요청 {per_round:,}개마다 snapshot ({rounds}번)")
+    print("-" * 50)
+    for i in range(100):  # 워밍업 (1회성 할당은 기준점 이전에)
+        handle_request(i)
+
+    tracker = SnapshotTracker()
+    tracker.start()
+    try:
+        for r in range(1, rounds + 1):
+            for i in range(per_round):
+                handle_request(i)
+            sites = tracker.check(top=1, since_previous=True)
+            top = f"{_short(sites[0].location)} +{format_bytes(sites[0].size_diff)}" if sites else "-"
+            print(f"  round {r}: 추적 중 {format_bytes(tracker.history[-1]):>10}  직전 대비 1위 {top}")
+        print(f"  단조 증가: {tracker.growing()}")
+        print("  기준점 대비 증가한 줄:")
+        for site in tracker.check(top=3):
+            print(f"    {format_bytes(site.size_diff):>12} {site.count_diff:>+8,}개"
+                  f"  {_short(site.location)}  {site.source()}")
+    finally:
+        tracker.stop()
+        _request_log.clear()
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🔬 tracemalloc 메모리 프로파일링")
+    print("=" * 60)
+
+    track_memory_demo()
+    decorator_demo()
+    long_running_worker_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   메모리 프로파일링 정리                       ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  with track_memory() as r:  → peak / 증가량 / 상위 할당 줄    ║
+    ║  @profile_memory            → 호출마다 같은 보고서            ║
+    ║  SnapshotTracker            → 기준점 대비 계속 늘어나는 줄    ║
+    ║                                                               ║
+    ║  💡 peak ≠ 남은 메모리 (임시 할당은 peak에만 보임)            ║
+    ║  💡 워밍업 후 기준점을 잡아야 1회성 할당이 빠짐               ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+"""
+05_leak_detector.py - 타입별 객체 수 증가로 누수 찾기
+
+📌 핵심 개념:
+    02-python-gotchas/07_circular_reference.py의 gc_module_demo()와
+    01_reference_counting.py의 gc_stats_demo()는 "한 번" 세어 볼 뿐입니다.
+    오래 도는 워커가 천천히 부푸는 원인은 보통 "어딘가에 계속 붙잡힌 객체"이고,
+    그 타입의 살아 있는 개수가 시간에 따라 계속 늘어납니다.
+
+    LeakWatch:
+        1. sample(): gc.get_objects()를 타입별로 셈 (Counter(map(type, ...)))
+        2. suspects(): 최근 window번의 샘플에서 매번 늘어난 타입 = 누수 의심
+        3. referrer_chains(): 의심 타입 객체 몇 개를 골라 gc.get_referrers()로
+           "누가 붙잡고 있는지" 거슬러 올라감 (모듈 전역에 닿으면 멈춤)
+
+    저부하 모드 (운영용):
+        - stride=N: N개 중 1개만 세고 N배 (타입 판별 비용 1/N)
+        - start(interval): 백그라운드 스레드가 interval초마다 샘플
+        generation=2로 거르는 것은 비용을 줄이지 못합니다 (오래 사는 객체는 거의 다
+        2세대라 훑는 양이 비슷). overhead_demo()에서 직접 비교합니다.
+
+🔄 다른 언어 비교:
+    - Java: jmap -histo 를 주기적으로 떠서 비교, JFR Old Object Sample
+    - Go: pprof heap (inuse_objects) 두 시점 비교
+    - Python: gc.get_objects() 히스토그램 (이 예제), 서드파티 objgraph / guppy3
+
+⚠️ 주의사항:
+    - gc가 추적하는 객체(컨테이너, 인스턴스)만 보입니다.
+      int / str / 원자값만 담은 tuple·dict는 추적되지 않습니다
+    - gc.get_referrers()는 힙 전체를 훑습니다 → 의심 타입에 대해서만, 가끔
+    - 캐시처럼 "차오르다 멈추는" 증가도 window 동안은 누수처럼 보입니다
+
+📚 참고: https://docs.python.org/3/library/gc.html#gc.get_objects
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import time
+import types
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+def type_name(tp: type) -> str:
+    module = tp.__module__
+    return tp.__qualname__ if module == "builtins" else f"{module}.{tp.__qualname__}"
+
+
+# =============================================================================
+# 1️⃣ 샘플링
+# =============================================================================
+
+def count_types(*, generation: int | None = None, stride: int = 1) -> Counter[str]:
+    """
+    살아 있는 (gc 추적) 객체 수를 타입 이름별로.
+
+    stride > 1이면 stride개마다 1개만 세고 stride배로 추정합니다.
+    generation은 세대 필터일 뿐 저부하 수단이 아닙니다 (2세대 ≈ 힙 대부분).
+    """
+    objects = gc.get_objects() if generation is None else gc.get_objects(generation)
+    try:
+        by_type = Counter(map(type, objects[::stride] if stride > 1 else objects))
+    finally:
+        del objects  # 객체 목록을 오래 들고 있지 않기
+    return Counter({type_name(tp): n * stride for tp, n in by_type.items()})
+
+
+@dataclass
+class LeakSuspect:
+    """window 동안 매 샘플마다 늘어난 타입."""
+    type_name: str
+    counts: list[int]
+
+    @property
+    def growth(self) -> int:
+        return self.counts[-1] - self.counts[0]
+
+    def __str__(self) -> str:
+        trend = " → ".join(f"{c:,}" for c in self.counts)
+        return f"{self.type_name:<32} +{self.growth:,}  ({trend})"
+
+
+class LeakWatch:
+    """
+    타입별 객체 수를 주기적으로 샘플해서 계속 늘어나는 타입을 찾습니다.
+
+    사용 예 (수동):
+        watch = LeakWatch(window=5)
+        for batch in batches:
+            process(batch)
+            watch.sample()
+        for s in watch.suspects():
+            print(s)
+            print(watch.referrer_chains(s.type_name))
+
+    사용 예 (운영, 저부하):
+        watch = LeakWatch(stride=16)
+        watch.start(interval=60, on_suspects=log_warning)
+        ...
+        watch.stop()
+    """
+
+    def __init__(self, window: int = 5, *, min_growth: int = 100,
+                 generation: int | None = None, stride: int = 1, collect: bool = False) -> None:
+        if window < 3:
+            raise ValueError("window는 3 이상이어야 합니다 (증가 추세 판단)")
+        self.window = window
+        self.min_growth = min_growth
+        self.generation = generation
+        self.stride = stride
+        self.collect = collect  # True면 샘플 전 gc.collect() (아직 안 치운 순환 쓰레기 제외, 비용 큼)
+        self.samples: deque[Counter[str]] = deque(maxlen=window)
+        self.sample_seconds: deque[float] = deque(maxlen=window)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def sample(self) -> Counter[str]:
+        start = time.perf_counter()
+        if self.collect:
+            gc.collect()
+        counts = count_types(generation=self.generation, stride=self.stride)
+        self.sample_seconds.append(time.perf_counter() - start)
+        self.samples.append(counts)
+        return counts
+
+    def suspects(self) -> list[LeakSuspect]:
+        """최근 window개 샘플에서 매번 늘었고, 총 min_growth 이상 늘어난 타입 (증가량 순)."""
+        if len(self.samples) < self.window:
+            return []
+        result = []
+        for name in self.samples[-1]:
+            counts = [s.get(name, 0) for s in self.samples]
+            if counts[-1] - counts[0] >= self.min_growth and all(b > a for a, b in zip(counts, counts[1:])):
+                result.append(LeakSuspect(name, counts))
+        return sorted(result, key=lambda s: s.growth, reverse=True)
+
+    def referrer_chains(self, name: str, *, samples: int = 3, depth: int = 6) -> list[str]:
+        """name 타입 객체 samples개에 대해 '누가 붙잡고 있나' 체인."""
+        found = [o for o in gc.get_objects() if type_name(type(o)) == name]
+        picked = found[-samples:]  # 최근 생성분이 뒤쪽에 있는 경향
+        del found
+        chains = []
+        for i in range(len(picked)):
+            chains.append(referrer_chain(picked[i], depth=depth, ignore=(picked,)))
+        return chains
+
+    # -- 백그라운드 샘플링 --------------------------------------------------
+
+    def start(self, interval: float = 60.0,
+              on_suspects: Callable[[list[LeakSuspect]], None] | None = None) -> None:
+        """interval초마다 sample() → 의심 타입이 있으면 on_suspects 호출."""
+        if self._thread is not None:
+            raise RuntimeError("이미 실행 중입니다")
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                self.sample()
+                found = self.suspects()
+                if found and on_suspects is not None:
+                    on_suspects(found)
+
+        self._thread = threading.Thread(target=loop, name="leak-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+# =============================================================================
+# 2️⃣ referrer 체인
+# =============================================================================
+
+def _key_of(mapping: dict[Any, Any], value: Any) -> Any:
+    """mapping에서 value를 가리키는 키 (클로저를 만들지 않도록 일반 루프)."""
+    for k, v in mapping.items():
+        if v is value:
+            return k
+    return None
+
+
+def describe(obj: Any, child: Any = None) -> str:
+    """체인에 표시할 짧은 설명 (child를 가리키는 키/속성 이름 포함)."""
+    if isinstance(obj, dict):
+        key = _key_of(obj, child)
+        return f"dict[{key!r}]" if key is not None else "dict"
+    if isinstance(obj, (list, tuple, set, deque)):
+        return f"{type(obj).__name__}(len={len(obj)})"
+    attrs = getattr(obj, "__dict__", None)
+    if isinstance(attrs, dict):
+        attr = _key_of(attrs, child)
+        if attr is not None:
+            return f"{type_name(type(obj))}.{attr}"
+    return type_name(type(obj))
+
+
+def _module_of(namespace: dict[str, Any]) -> str | None:
+    """namespace가 어떤 모듈의 __dict__(전역)이면 모듈 이름."""
+    for module in list(sys.modules.values()):
+        if getattr(module, "__dict__", None) is namespace:
+            return module.__name__
+    return None
+
+
+def referrer_chain(obj: Any, *, depth: int = 6, ignore: tuple[Any, ...] = (),
+                   max_nodes: int = 5_000) -> str:
+    """
+    obj를 모듈 전역까지 붙잡고 있는 가장 짧은 경로 (referrer 방향 BFS).
+
+    프레임(지역 변수), 호출자가 넘긴 ignore 객체, 이 함수의 임시 자료구조는 건너뜁니다.
+    순환 안쪽(Child.parent → Parent → children → Child)을 맴돌지 않도록
+    한 칸씩 따라가지 않고 너비 우선으로 찾습니다.
+    """
+    held_by: dict[int, Any] = {}  # id(referrer) → 그 referrer가 붙잡은 객체 (경로 복원용)
+    visited = {id(obj)}
+    level = [obj]
+    skip = {id(o) for o in ignore} | {id(held_by), id(visited), id(level)}
+    root = None
+    for _ in range(depth):
+        next_level: list[Any] = []
+        skip.add(id(next_level))
+        for current in level:
+            referrers = gc.get_referrers(current)
+            for ref in referrers:
+                if (id(ref) in visited or id(ref) in skip or ref is referrers
+                        or isinstance(ref, types.FrameType)):
+                    continue
+                visited.add(id(ref))
+                held_by[id(ref)] = current
+                if isinstance(ref, dict) and _module_of(ref) is not None:
+                    root = ref
+                    break
+                next_level.append(ref)
+            del referrers
+            if root is not None or len(visited) > max_nodes:
+                break
+        if root is not None or not next_level or len(visited) > max_nodes:
+            break
+        level = next_level
+
+    if root is None:
+        return f"{describe(obj)} ← (depth {depth} 안에 전역 참조 없음: 지역 변수/순환 쓰레기)"
+    path = [root]
+    while path[-1] is not obj:
+        path.append(held_by[id(path[-1])])
+    path.reverse()  # obj, ..., root
+
+    chain = [describe(obj)]
+    for i in range(1, len(path) - 1):
+        holder, held = path[i], path[i - 1]
+        if isinstance(holder, dict) and getattr(path[i + 1], "__dict__", None) is holder:
+            continue  # 인스턴스 __dict__ → 다음 단계에서 "Type.attr"로 표시
+        if i >= 2 and isinstance(held, dict) and getattr(holder, "__dict__", None) is held:
+            held = path[i - 2]
+        chain.append(describe(holder, held))
+    chain.append(f"{_module_of(root)}.{_key_of(root, path[-2])} (전역)")
+    return " ← ".join(chain)
+
+
+# =============================================================================
+# 3️⃣ 데모: parent_child_demo 같은 순환이 워커에 쌓이는 경우
+# =============================================================================
+
+class Parent:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.children: list[Child] = []
+
+    def add_child(self, child: Child) -> None:
+        self.children.append(child)
+        child.parent = self  # 순환 (parent_child_demo와 같은 구조)
+
+
+class Child:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.parent: Parent | None = None
+
+
+_audit_log: list[Parent] = []  # 누수 원인: "나중에 보려고" 남긴 참조
+
+
+def handle_request(i: int) -> None:
+    """요청마다 부모-자식 순환 생성. 대부분은 gc가 치우지만 일부는 전역 로그에 남음."""
+    parent = Parent(f"req-{i}")
+    for j in range(3):
+        parent.add_child(Child(f"req-{i}-{j}"))
+    if i % 10 == 0:
+        _audit_log.append(parent)
+
+
+def leak_watch_demo(rounds: int = 6, per_round: int = 2_000) -> None:
+    """라운드마다 sample → 계속 늘어나는 타입 + referrer 체인."""
+    print(f"\n📌 요청 {per_round:,}개 × {rounds}라운드, 라운드마다 sample()")
+    print("-" * 50)
+    watch = LeakWatch(window=5, collect=True)
+    for r in range(rounds):
+        for i in range(per_round):
+            handle_request(r * per_round + i)
+        watch.sample()
+    suspects = watch.suspects()
+    print("  매 샘플마다 늘어난 타입:")
+    for s in suspects[:5]:
+        print(f"    {s}")
+    for s in suspects:
+        if s.type_name.endswith(("Parent", "Child")):
+            print(f"\n  {s.type_name.rsplit('.', 1)[-1]}를 붙잡고 있는 체인:")
+            for chain in watch.referrer_chains(s.type_name, samples=2):
+                print(f"    {chain}")
+    _audit_log.clear()
+    gc.collect()
+
+
+def overhead_demo(extra_objects: int = 300_000) -> None:
+    """전체 스캔 vs generation=2 vs stride의 샘플 비용."""
+    print(f"\n📌 샘플 1회 비용 (추가 객체 {extra_objects:,}개가 있는 힙)")
+    print("-" * 50)
+    heap = [[i] for i in range(extra_objects)]
+    gc.collect()  # 살아남은 객체를 2세대로
+    for label, watch in (
+        ("전체 스캔", LeakWatch()),
+        ("generation=2", LeakWatch(generation=2)),
+        ("stride=16", LeakWatch(stride=16)),
+        ("stride=64", LeakWatch(stride=64)),
+    ):
+        for _ in range(3):
+            counts = watch.sample()
+        best = min(watch.sample_seconds)
+        print(f"  {label:<24} {best * 1e3:7.1f}ms  list 추정 {counts['list']:>9,}개")
+    print("  💡 generation=2는 싸지지 않음 (살아남은 객체는 거의 다 2세대) → 줄이는 건 stride")
+    print("  💡 매분 1회라면 수십 ms도 운영에서 감당 가능 (1% 미만)")
+    del heap
+
+
+def background_demo() -> None:
+    """start(interval): 백그라운드 스레드가 주기적으로 샘플."""
+    print("\n📌 백그라운드 샘플링 (interval=0.05초)")
+    print("-" * 50)
+    reports: list[list[LeakSuspect]] = []
+    watch = LeakWatch(window=4, stride=4)
+    watch.start(interval=0.05, on_suspects=reports.append)
+    try:
+        deadline = time.perf_counter() + 0.5
+        i = 0
+        while time.perf_counter() < deadline:
+            handle_request(i)
+            i += 1
+    finally:
+        watch.stop()
+    names = sorted({s.type_name.rsplit(".", 1)[-1] for found in reports for s in found})
+    print(f"  요청 {i:,}개 처리, 경고 {len(reports)}번: {names}")
+    _audit_log.clear()
+    gc.collect()
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🕵️ 누수 탐지 (타입별 객체 수 추세)")
+    print("=" * 60)
+
+    leak_watch_demo()
+    overhead_demo()
+    background_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   누수 탐지 정리                               ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  1. 주기적으로 타입별 개수 (gc.get_objects)                   ║
+    ║  2. window 동안 매번 늘어난 타입 = 의심                       ║
+    ║  3. gc.get_referrers로 "누가 붙잡나" → 전역/캐시/로그         ║
+    ║                                                               ║
+    ║  운영: stride + 긴 interval (generation=2는 더 싸지 않음)     ║
+    ║  순환 자체는 gc가 치움 → 순환을 붙잡는 "바깥 참조"를 찾을 것  ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
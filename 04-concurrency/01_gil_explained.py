@@ -13,16 +13,31 @@
 ⚠️ 주의사항:
     - CPU 바운드: 멀티스레딩 비효율 → multiprocessing 사용
     - I/O 바운드: 멀티스레딩 효과적
+    - Python 3.13+ free-threaded 빌드(python3.13t)에서는 GIL을 끌 수 있음
+      → `python 01_gil_explained.py --free-threading`으로 GIL on/off 스레드 확장성 비교
 
 📚 참고: https://wiki.python.org/moin/GlobalInterpreterLock
 """
 
 from __future__ import annotations
 
+import json
 import threading
 import multiprocessing
+import subprocess
+import sys
+import sysconfig
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import register, registry, run_benchmark  # noqa: E402
+
+
+CPU_N = 100000
+CPU_TASKS = 4
 
 
 def cpu_bound_task(n: int) -> int:
@@ -41,16 +56,35 @@ def io_bound_task(seconds: float) -> str:
     return f"Slept for {seconds}s"
 
 
+@register("gil.cpu.sequential", group="gil", repeat=5)
+def bench_sequential_cpu() -> list[int]:
+    return [cpu_bound_task(CPU_N) for _ in range(CPU_TASKS)]
+
+
+@register("gil.cpu.threads", group="gil", repeat=5)
+def bench_threaded_cpu() -> list[int]:
+    with ThreadPoolExecutor(max_workers=CPU_TASKS) as executor:
+        return list(executor.map(cpu_bound_task, [CPU_N] * CPU_TASKS))
+
+
+@register("gil.cpu.processes", group="gil", repeat=5)
+def bench_multiprocess_cpu() -> list[int]:
+    with ProcessPoolExecutor(max_workers=CPU_TASKS) as executor:
+        return list(executor.map(cpu_bound_task, [CPU_N] * CPU_TASKS))
+
+
+def _report(name: str) -> None:
+    """등록된 벤치마크를 실행하고 중앙값/p95 출력."""
+    result = registry()[name].run()
+    print(f"  소요 시간: {result.median:.2f}초 (중앙값, p95 {result.p95:.2f}초, {len(result.samples)}회)")
+
+
 def sequential_cpu_demo() -> None:
     """순차 실행 (CPU 바운드)."""
     print("\n📌 CPU 바운드: 순차 실행")
     print("-" * 50)
     
-    start = time.perf_counter()
-    results = [cpu_bound_task(100000) for _ in range(4)]
-    elapsed = time.perf_counter() - start
-    
-    print(f"  소요 시간: {elapsed:.2f}초")
+    _report("gil.cpu.sequential")
 
 
 def threaded_cpu_demo() -> None:
@@ -58,13 +92,7 @@ def threaded_cpu_demo() -> None:
     print("\n📌 CPU 바운드: 멀티스레딩 (GIL 영향)")
     print("-" * 50)
     
-    start = time.perf_counter()
-    
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        results = list(executor.map(cpu_bound_task, [100000] * 4))
-    
-    elapsed = time.perf_counter() - start
-    print(f"  소요 시간: {elapsed:.2f}초")
+    _report("gil.cpu.threads")
     print("  ⚠️ 순차 실행과 비슷하거나 더 느림!")
 
 
@@ -73,14 +101,25 @@ def multiprocess_cpu_demo() -> None:
     print("\n📌 CPU 바운드: 멀티프로세싱 (GIL 우회)")
     print("-" * 50)
     
-    start = time.perf_counter()
-    
-    with ProcessPoolExecutor(max_workers=4) as executor:
-        results = list(executor.map(cpu_bound_task, [100000] * 4))
-    
-    elapsed = time.perf_counter() - start
-    print(f"  소요 시간: {elapsed:.2f}초")
+    _report("gil.cpu.processes")
     print("  ✅ 실제 병렬 실행으로 빠름!")
+    print("  ⚠️ 워커마다 메모리가 따로 → lru_cache도 워커마다 따로 (같은 키 재계산)")
+    print("     → 12_shared_cache.py: 워커 간 공유 캐시")
+
+
+IO_SECONDS = 0.2
+
+
+@register("gil.io.sequential", group="gil", repeat=5, warmup=0)
+def bench_sequential_io() -> None:
+    for _ in range(CPU_TASKS):
+        io_bound_task(IO_SECONDS)
+
+
+@register("gil.io.threads", group="gil", repeat=5, warmup=0)
+def bench_threaded_io() -> list[str]:
+    with ThreadPoolExecutor(max_workers=CPU_TASKS) as executor:
+        return list(executor.map(io_bound_task, [IO_SECONDS] * CPU_TASKS))
 
 
 def threaded_io_demo() -> None:
@@ -89,21 +128,110 @@ def threaded_io_demo() -> None:
     print("-" * 50)
     
     # 순차 실행
-    start = time.perf_counter()
-    for _ in range(4):
-        io_bound_task(0.5)
-    sequential_time = time.perf_counter() - start
+    sequential_time = registry()["gil.io.sequential"].run().median
     print(f"  순차 실행: {sequential_time:.2f}초")
     
     # 멀티스레딩
-    start = time.perf_counter()
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        results = list(executor.map(io_bound_task, [0.5] * 4))
-    threaded_time = time.perf_counter() - start
+    threaded_time = registry()["gil.io.threads"].run().median
     print(f"  멀티스레딩: {threaded_time:.2f}초")
     print(f"  ✅ {sequential_time/threaded_time:.1f}배 빠름!")
 
 
+# =============================================================================
+# Free-threaded (GIL 비활성화) 비교
+# =============================================================================
+
+SCALING_N = 20000
+SCALING_TASKS = 8
+SCALING_THREADS = (1, 2, 4, 8)
+
+
+def is_free_threaded_build() -> bool:
+    """free-threaded 빌드(--disable-gil)인지 확인."""
+    return bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+
+
+def is_gil_enabled() -> bool:
+    """현재 GIL이 켜져 있는지 (3.13 미만은 항상 True)."""
+    check = getattr(sys, "_is_gil_enabled", None)
+    return check() if check is not None else True
+
+
+def run_threads(threads: int, tasks: int = SCALING_TASKS, n: int = SCALING_N) -> None:
+    """총 작업량(tasks)을 고정하고 스레드 수만 바꿔서 실행."""
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(cpu_bound_task, [n] * tasks))
+
+
+def thread_scaling(thread_counts: tuple[int, ...] = SCALING_THREADS) -> list[dict[str, Any]]:
+    """
+    스레드 수별 speedup과 확장 효율 측정.
+
+        speedup    = T(1 스레드) / T(k 스레드)
+        efficiency = speedup / k   (1.0이면 완벽한 선형 확장)
+    """
+    rows = []
+    base = 0.0
+    for threads in thread_counts:
+        elapsed = run_benchmark(f"gil.scaling.threads_{threads}", lambda: run_threads(threads),
+                                repeat=3, warmup=1, group="gil_scaling").median
+        base = base or elapsed
+        speedup = base / elapsed
+        rows.append({
+            "threads": threads,
+            "seconds": elapsed,
+            "speedup": speedup,
+            "efficiency": speedup / threads,
+        })
+    return rows
+
+
+for _threads in SCALING_THREADS:
+    register(f"gil.scaling.threads_{_threads}", group="gil_scaling", repeat=5)(
+        lambda threads=_threads: run_threads(threads))
+
+
+def scaling_in_subprocess(gil: bool) -> list[dict[str, Any]]:
+    """-X gil=0/1로 이 파일을 다시 실행해서 해당 모드의 확장성 측정."""
+    out = subprocess.run(
+        [sys.executable, "-X", f"gil={int(gil)}", __file__, "--scaling-json"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout)
+
+
+def print_scaling(label: str, rows: list[dict[str, Any]]) -> None:
+    print(f"\n  [{label}]")
+    print(f"  {'threads':>7}  {'time':>8}  {'speedup':>7}  {'efficiency':>10}")
+    for r in rows:
+        print(f"  {r['threads']:>7}  {r['seconds']:>7.3f}s  {r['speedup']:>6.2f}x  {r['efficiency']:>9.0%}")
+
+
+def free_threading_demo() -> None:
+    """GIL on/off 스레드 확장성 비교 (free-threaded 빌드에서만 양쪽 측정)."""
+    print("\n📌 Free-threaded CPython: GIL on/off 확장성")
+    print("-" * 50)
+    print(f"  Python {sys.version.split()[0]}, free-threaded 빌드: {is_free_threaded_build()}, "
+          f"GIL 활성: {is_gil_enabled()}")
+    print(f"  작업: cpu_bound_task({SCALING_N}) × {SCALING_TASKS}개 (총량 고정)")
+
+    if not is_free_threaded_build():
+        print_scaling("GIL 켜짐 (일반 빌드)", thread_scaling())
+        print("\n  💡 python3.13t 등 free-threaded 빌드로 실행하면 GIL 꺼짐 모드도 측정합니다")
+        return
+
+    gil_on = scaling_in_subprocess(gil=True)
+    gil_off = scaling_in_subprocess(gil=False)
+    print_scaling("GIL 켜짐 (-X gil=1)", gil_on)
+    print_scaling("GIL 꺼짐 (-X gil=0)", gil_off)
+    best = max(gil_off, key=lambda r: r["speedup"])
+    single_cost = gil_off[0]["seconds"] / gil_on[0]["seconds"] - 1
+    print(f"\n  GIL 꺼짐 최대 speedup: {best['speedup']:.2f}x ({best['threads']} 스레드)")
+    print(f"  단일 스레드 오버헤드: {single_cost:+.0%} (free-threading 비용)")
+
+
 def summary() -> None:
     """GIL 요약."""
     print("""
@@ -123,7 +251,8 @@ def summary() -> None:
     ║    - 멀티스레딩 ✅ (I/O 대기 중 GIL 해제)                      ║
     ║    - asyncio ✅ (더 효율적)                                    ║
     ║                                                               ║
-    ║  💡 Python 3.13+에서 GIL 비활성화 옵션 추가 예정!              ║
+    ║  💡 Python 3.13+ free-threaded 빌드에서 GIL 비활성화 가능!     ║
+    ║     (--free-threading 옵션으로 확장성 직접 비교)              ║
     ║                                                               ║
     ╚═══════════════════════════════════════════════════════════════╝
     """)
@@ -139,9 +268,15 @@ def main() -> None:
     threaded_cpu_demo()
     multiprocess_cpu_demo()
     threaded_io_demo()
+    free_threading_demo()
     summary()
 
 
 if __name__ == "__main__":
-    main()
+    if "--scaling-json" in sys.argv[1:]:
+        print(json.dumps(thread_scaling()))
+    elif "--free-threading" in sys.argv[1:]:
+        free_threading_demo()
+    else:
+        main()
 
@@ -0,0 +1,220 @@
+"""
+02_threading_basics.py - 스레드 풀 크기 정하기: 스케일링 곡선 & 경합 프로파일
+
+📌 핵심 개념:
+    01_gil_explained.py의 스레드 데모는 max_workers=4로 고정되어 있습니다.
+    실제 I/O 풀 크기는 워커 수를 늘려 가며 처리량이 더 이상 늘지 않는
+    지점(knee)을 찾아 정해야 합니다.
+
+    이 예제는 워커 수 1 → 64를 스윕하며 다음을 기록합니다.
+        - 처리량 (tasks/s)과 지연 p50/p95/p99 (submit → 완료)
+        - 컨텍스트 스위치 수 (/proc/self/task/*/status의 voluntary/nonvoluntary)
+
+🔄 다른 언어 비교:
+    - Java: ThreadPoolExecutor 크기 = N_cpu × (1 + 대기시간/계산시간)
+    - Go: goroutine은 가벼워서 풀 크기 고민이 적음 (GOMAXPROCS만 조정)
+    - Python: I/O는 스레드를 늘릴수록 좋아지다 포화, CPU는 GIL 때문에 1개와 비슷
+
+⚠️ 주의사항:
+    - 컨텍스트 스위치 수는 Linux(/proc)에서만 측정됩니다
+    - GIL 전환 횟수는 CPython이 노출하지 않아 표에 넣지 않습니다
+      (CPU 바운드에서 늘어나는 nonvoluntary 스위치가 측정 가능한 경합 신호)
+
+실행:
+    python 02_threading_basics.py           # 1 → 16 워커 (빠른 데모)
+    python 02_threading_basics.py --sweep   # 1 → 64 워커 전체 스윕
+
+📚 참고: https://docs.python.org/3/library/sys.html#sys.setswitchinterval
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.core import percentile  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+_gil = load_example(Path(__file__).with_name("01_gil_explained.py"))
+cpu_bound_task = _gil.cpu_bound_task
+io_bound_task = _gil.io_bound_task
+
+
+# =============================================================================
+# 1️⃣ 컨텍스트 스위치 측정
+# =============================================================================
+
+def context_switches() -> dict[str, tuple[int, int]] | None:
+    """
+    스레드별 (voluntary, nonvoluntary) 컨텍스트 스위치 수 {tid: (v, n)}.
+
+    💡 /proc/self/status는 메인 스레드 값만 보여주므로 task별 status를 읽습니다.
+        (워커 스레드가 살아 있는 동안 읽어야 함)
+    """
+    task_dir = Path("/proc/self/task")
+    if not task_dir.exists():
+        return None
+    counts = {}
+    for status in task_dir.glob("*/status"):
+        try:
+            text = status.read_text()
+        except OSError:  # 그 사이 종료된 스레드
+            continue
+        fields = dict(line.split(":", 1) for line in text.splitlines() if ":" in line)
+        counts[status.parent.name] = (
+            int(fields["voluntary_ctxt_switches"]),
+            int(fields["nonvoluntary_ctxt_switches"]),
+        )
+    return counts
+
+
+def switch_delta(
+    before: dict[str, tuple[int, int]] | None,
+    after: dict[str, tuple[int, int]] | None,
+) -> tuple[int | None, int | None]:
+    """두 스냅샷 사이 증가량 (새로 생긴 스레드는 0부터)."""
+    if before is None or after is None:
+        return None, None
+    vol = nonvol = 0
+    for tid, (v, n) in after.items():
+        v0, n0 = before.get(tid, (0, 0))
+        vol += v - v0
+        nonvol += n - n0
+    return vol, nonvol
+
+
+# =============================================================================
+# 2️⃣ 스윕
+# =============================================================================
+
+@dataclass
+class SweepPoint:
+    """워커 수 하나의 측정 결과."""
+    workers: int
+    elapsed: float
+    throughput: float
+    p50: float
+    p95: float
+    p99: float
+    voluntary: int | None
+    nonvoluntary: int | None
+
+
+def run_point(task: Callable[[], object], workers: int, tasks: int) -> SweepPoint:
+    """workers개 스레드로 task를 tasks번 실행하고 지연/스위치 기록."""
+    latencies: list[float] = []
+
+    def timed(submitted: float) -> None:
+        task()
+        latencies.append(time.perf_counter() - submitted)  # list.append는 스레드 안전
+
+    before_ctx = context_switches()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(timed, time.perf_counter()) for _ in range(tasks)]
+        for f in futures:
+            f.result()
+        elapsed = time.perf_counter() - start
+        after_ctx = context_switches()  # 워커 스레드가 아직 살아 있을 때
+
+    latencies.sort()
+    vol, nonvol = switch_delta(before_ctx, after_ctx)
+    return SweepPoint(
+        workers=workers,
+        elapsed=elapsed,
+        throughput=tasks / elapsed,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+        voluntary=vol,
+        nonvoluntary=nonvol,
+    )
+
+
+def sweep(task: Callable[[], object], worker_counts: Iterable[int], tasks: int) -> list[SweepPoint]:
+    return [run_point(task, w, tasks) for w in worker_counts]
+
+
+def find_knee(points: list[SweepPoint], ratio: float = 0.9) -> SweepPoint:
+    """최대 처리량의 ratio(90%)에 처음 도달하는 가장 작은 워커 수."""
+    best = max(p.throughput for p in points)
+    return next(p for p in points if p.throughput >= best * ratio)
+
+
+def print_sweep(title: str, points: list[SweepPoint]) -> None:
+    """표 + 처리량 막대 차트."""
+    print(f"\n  [{title}]  switchinterval={sys.getswitchinterval() * 1e3:.1f}ms")
+    print(f"  {'workers':>7}  {'tasks/s':>9}  {'p50':>8}  {'p95':>8}  {'p99':>8}"
+          f"  {'vol_cs':>7}  {'invol_cs':>8}  처리량")
+    best = max(p.throughput for p in points)
+    for p in points:
+        bar = "█" * max(1, round(p.throughput / best * 30))
+        vol = "-" if p.voluntary is None else f"{p.voluntary:,}"
+        nonvol = "-" if p.nonvoluntary is None else f"{p.nonvoluntary:,}"
+        print(f"  {p.workers:>7}  {p.throughput:>9,.0f}  {p.p50 * 1e3:>6.1f}ms  {p.p95 * 1e3:>6.1f}ms"
+              f"  {p.p99 * 1e3:>6.1f}ms  {vol:>7}  {nonvol:>8}  {bar}")
+    knee = find_knee(points)
+    print(f"  → knee: 워커 {knee.workers}개 (최대 처리량의 90% 도달)")
+
+
+# =============================================================================
+# 3️⃣ 데모
+# =============================================================================
+
+IO_DELAY = 0.005
+CPU_N = 5000
+TASKS = 128
+
+
+def thread_sweep_demo(worker_counts: Iterable[int] = (1, 2, 4, 8, 16)) -> None:
+    """I/O 바운드 vs CPU 바운드 스케일링 곡선."""
+    print("\n📌 스레드 풀 크기 스윕")
+    print("-" * 50)
+    print(f"  작업 {TASKS}개, CPU {os.cpu_count()}코어")
+
+    worker_counts = list(worker_counts)
+    io_points = sweep(lambda: io_bound_task(IO_DELAY), worker_counts, TASKS)
+    print_sweep(f"I/O 바운드: sleep {IO_DELAY * 1e3:.0f}ms", io_points)
+
+    cpu_points = sweep(lambda: cpu_bound_task(CPU_N), worker_counts, TASKS)
+    print_sweep(f"CPU 바운드: cpu_bound_task({CPU_N})", cpu_points)
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🧵 스레드 풀 크기: 스케일링 곡선 & 경합")
+    print("=" * 60)
+
+    thread_sweep_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   스레드 풀 크기 정리                          ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  I/O 바운드:                                                  ║
+    ║    - 워커를 늘리면 처리량이 거의 선형 증가 → 어느 순간 포화  ║
+    ║    - knee 이후로는 메모리/컨텍스트 스위치만 증가              ║
+    ║                                                               ║
+    ║  CPU 바운드:                                                  ║
+    ║    - 워커 1개 이후 처리량 그대로, 지연(p99)만 증가            ║
+    ║    - GIL 경합 → 비자발적 컨텍스트 스위치 증가                 ║
+    ║                                                               ║
+    ║  💡 추측하지 말고 스윕해서 knee를 찾자!                        ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    if "--sweep" in sys.argv[1:]:
+        thread_sweep_demo((1, 2, 4, 8, 16, 32, 64))
+    else:
+        main()
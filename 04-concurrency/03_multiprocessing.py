@@ -0,0 +1,381 @@
+"""
+03_multiprocessing.py - 멀티프로세싱 실무 패턴
+
+📌 핵심 개념:
+    ProcessPoolExecutor.map()의 기본 chunksize는 1입니다.
+    작은 작업이 수만 개면 작업 하나마다 pickle → 파이프 전송 → unpickle이 일어나서
+    실제 계산보다 IPC 비용이 더 커집니다.
+    작업 여러 개를 한 덩어리(chunk)로 묶어 보내면 IPC 횟수가 줄어듭니다.
+
+    parallel_map()은 몇 개 항목을 직접 실행해 항목당 비용을 측정하고,
+    한 chunk가 target_chunk_seconds 정도 걸리도록 chunksize를 자동으로 정합니다.
+
+🔄 다른 언어 비교:
+    - Java: ForkJoinPool (작업 분할 임계값을 직접 지정)
+    - Go: 워커 goroutine + 채널 (배치 크기를 직접 지정)
+    - Python: executor.map(func, items, chunksize=N)
+
+⚠️ 주의사항:
+    - chunk가 너무 크면 워커 간 부하가 불균형해집니다 (마지막 chunk만 기다림)
+    - 그래서 워커당 최소 4개 chunk는 남도록 상한을 둡니다
+
+    결과가 큰 경우(배열, 바이트)에는 반환값 pickle 자체가 병목입니다.
+    multiprocessing.shared_memory로 부모가 버퍼를 미리 할당하고
+    워커가 그 안에 직접 쓰면, 부모는 복사 없이 memoryview로 읽습니다.
+
+실행:
+    python 03_multiprocessing.py            # 데모
+    python 03_multiprocessing.py --sweep    # chunksize × 워커 수 처리량 비교
+    python 03_multiprocessing.py --shm      # pickle vs shared_memory (1KB / 1MB / 100MB)
+
+📚 참고: https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, registry, run_benchmark  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+# 01_gil_explained.py의 cpu_bound_task를 그대로 사용 (숫자로 시작하는 파일은 import 불가)
+cpu_bound_task = load_example(Path(__file__).with_name("01_gil_explained.py")).cpu_bound_task
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# =============================================================================
+# 1️⃣ chunksize 자동 결정
+# =============================================================================
+
+def estimate_item_cost(func: Callable[[T], R], sample: list[T]) -> tuple[float, list[R]]:
+    """
+    sample을 현재 프로세스에서 실행해 항목당 평균 시간(초)과 결과를 반환.
+
+    💡 결과도 함께 돌려주므로 측정에 쓴 항목을 다시 계산할 필요가 없습니다.
+    """
+    start = time.perf_counter()
+    results = [func(item) for item in sample]
+    elapsed = time.perf_counter() - start
+    return elapsed / max(len(sample), 1), results
+
+
+def choose_chunksize(
+    per_item: float,
+    n_items: int,
+    workers: int,
+    target_chunk_seconds: float = 0.02,
+    min_chunks_per_worker: int = 4,
+) -> int:
+    """
+    chunk 하나가 target_chunk_seconds 정도 걸리도록 chunksize 계산.
+
+    - 하한 1
+    - 상한: 워커마다 min_chunks_per_worker개 이상 chunk가 돌아가도록 (부하 분산)
+    """
+    if n_items <= 0:
+        return 1
+    ideal = target_chunk_seconds / per_item if per_item > 0 else n_items
+    upper = max(1, n_items // (workers * min_chunks_per_worker))
+    return max(1, min(int(ideal), upper))
+
+
+# =============================================================================
+# 2️⃣ parallel_map
+# =============================================================================
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int | None = None,
+    chunksize: int | None = None,
+    executor: Executor | None = None,
+    sample_size: int = 16,
+    target_chunk_seconds: float = 0.02,
+) -> list[R]:
+    """
+    ProcessPoolExecutor.map + 자동 chunksize.
+
+    chunksize를 주지 않으면 앞쪽 sample_size개를 직접 실행해서 비용을 재고,
+    나머지를 chunk 단위로 워커에 보냅니다. 결과 순서는 입력 순서와 같습니다.
+    executor를 넘기면 그 풀을 재사용합니다 (풀 생성 비용 절약).
+    """
+    items = list(items)
+    workers = workers or os.cpu_count() or 1
+    head: list[R] = []
+    rest = items
+    if chunksize is None:
+        per_item, head = estimate_item_cost(func, items[:sample_size])
+        rest = items[sample_size:]
+        chunksize = choose_chunksize(per_item, len(rest), workers, target_chunk_seconds)
+    if not rest:
+        return head
+
+    if executor is not None:
+        return head + list(executor.map(func, rest, chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return head + list(pool.map(func, rest, chunksize=chunksize))
+
+
+# =============================================================================
+# 3️⃣ 데모 & 벤치마크
+# =============================================================================
+
+SMALL_N = 200        # cpu_bound_task(200): 항목당 수 µs → IPC가 지배적인 크기
+SMALL_ITEMS = 10_000
+
+
+@register("multiprocessing.map.chunksize_1", group="multiprocessing", repeat=3, warmup=0)
+def bench_default_chunksize() -> list[int]:
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(cpu_bound_task, [SMALL_N] * SMALL_ITEMS))
+
+
+@register("multiprocessing.map.adaptive", group="multiprocessing", repeat=3, warmup=0)
+def bench_adaptive_chunksize() -> list[int]:
+    return parallel_map(cpu_bound_task, [SMALL_N] * SMALL_ITEMS)
+
+
+def chunksize_demo() -> None:
+    """기본 chunksize(1) vs 자동 chunksize."""
+    print("\n📌 작은 작업 다수: chunksize 비교")
+    print("-" * 50)
+
+    workers = os.cpu_count() or 1
+    per_item, _ = estimate_item_cost(cpu_bound_task, [SMALL_N] * 16)
+    auto = choose_chunksize(per_item, SMALL_ITEMS, workers)
+    print(f"  작업 {SMALL_ITEMS:,}개, 항목당 {per_item * 1e6:.1f}µs, 워커 {workers}개")
+    print(f"  자동 chunksize: {auto}")
+
+    default_time = registry()["multiprocessing.map.chunksize_1"].run().median
+    adaptive_time = registry()["multiprocessing.map.adaptive"].run().median
+    print(f"  chunksize=1:  {default_time:.2f}초")
+    print(f"  자동:         {adaptive_time:.2f}초")
+    print(f"  ✅ {default_time / adaptive_time:.1f}배 빠름 (IPC 횟수 {SMALL_ITEMS:,} → {math.ceil(SMALL_ITEMS / auto):,})")
+
+
+def chunksize_sweep(
+    items: int = SMALL_ITEMS,
+    chunksizes: Iterable[int | None] = (1, 8, 64, 512, None),
+    max_workers: int | None = None,
+) -> None:
+    """워커 수 1..N × chunksize별 처리량(items/s) 표."""
+    max_workers = max_workers or os.cpu_count() or 1
+    worker_counts = sorted({1, *[2**i for i in range(1, max_workers.bit_length())], max_workers})
+    chunksizes = list(chunksizes)
+    data = [SMALL_N] * items
+
+    print(f"\n📌 처리량 (items/s), 작업 {items:,}개")
+    header = "".join(f"{'auto' if c is None else c:>10}" for c in chunksizes)
+    print(f"  {'workers':>7}{header}")
+    for workers in worker_counts:
+        row = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(cpu_bound_task, [SMALL_N] * workers))  # 워커 기동 (측정 제외)
+            for chunksize in chunksizes:
+                start = time.perf_counter()
+                parallel_map(cpu_bound_task, data, workers=workers, chunksize=chunksize, executor=pool)
+                row.append(items / (time.perf_counter() - start))
+        print(f"  {workers:>7}" + "".join(f"{v:>10,.0f}" for v in row))
+
+
+# =============================================================================
+# 4️⃣ shared_memory로 큰 결과 전달
+# =============================================================================
+
+def make_payload(size: int, seed: int) -> bytes:
+    """워커가 만드는 큰 결과 (두 방식 모두 같은 생성 비용)."""
+    return bytes([seed & 0xFF]) * size
+
+
+def produce_pickled(size: int, seed: int) -> bytes:
+    """(워커) 결과를 반환 → pickle로 파이프 전송."""
+    return make_payload(size, seed)
+
+
+def produce_into(name: str, offset: int, size: int, seed: int) -> int:
+    """(워커) 부모가 할당한 공유 메모리 [offset, offset+size)에 결과 작성."""
+    shm = SharedMemory(name=name)
+    try:
+        shm.buf[offset:offset + size] = make_payload(size, seed)
+    finally:
+        shm.close()
+    return size  # 파이프로는 크기(int)만 전달
+
+
+class SharedResultBuffer:
+    """
+    작업별 결과 슬롯을 가진 공유 메모리 버퍼.
+
+    사용 예:
+        with SharedResultBuffer(slots=4, slot_size=1 << 20) as buf:
+            list(pool.map(produce_into, *buf.task_args(size), seeds))
+            view = buf.view(0)   # 복사 없이 읽기
+            ...
+            view.release()       # close 전에 memoryview 해제 필수!
+    """
+
+    def __init__(self, slots: int, slot_size: int) -> None:
+        self.slots = slots
+        self.slot_size = slot_size
+        self._shm = SharedMemory(create=True, size=max(1, slots * slot_size))
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def offset(self, slot: int) -> int:
+        return slot * self.slot_size
+
+    def task_args(self, size: int | None = None) -> tuple[list[str], list[int], list[int]]:
+        """executor.map(produce_into, names, offsets, sizes, seeds)용 인자 리스트."""
+        size = self.slot_size if size is None else size
+        return (
+            [self.name] * self.slots,
+            [self.offset(i) for i in range(self.slots)],
+            [size] * self.slots,
+        )
+
+    def view(self, slot: int, size: int | None = None) -> memoryview:
+        """slot의 결과를 복사 없이 읽는 memoryview."""
+        start = self.offset(slot)
+        return self._shm.buf[start:start + (self.slot_size if size is None else size)]
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> SharedResultBuffer:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+TRANSPORT_TASKS = 2
+TRANSPORT_SIZES = {"1KB": 1 << 10, "1MB": 1 << 20, "100MB": 100 << 20}
+# 레지스트리에는 작은 크기만 (python -m bench run이 작업당 100MB를 돌리지 않게).
+# 100MB는 --shm에서만 run_benchmark로 직접 측정
+REGISTERED_TRANSPORT = ("1KB", "1MB")
+
+
+@functools.cache
+def transport_pool() -> ProcessPoolExecutor:
+    """전송 벤치마크용 풀 (워커 기동 비용을 측정에서 제외)."""
+    return ProcessPoolExecutor(max_workers=TRANSPORT_TASKS)
+
+
+def close_transport_pool() -> None:
+    """
+    전송 벤치마크용 풀 종료.
+
+    ⚠️ 멀티프로세싱 워커 안에서는 atexit이 실행되지 않아서,
+        풀을 닫지 않으면 종료 시 남은 워커를 join하며 멈춥니다.
+    """
+    if transport_pool.cache_info().currsize:
+        transport_pool().shutdown()
+        transport_pool.cache_clear()
+
+
+def transfer_pickled(size: int) -> int:
+    """pickle 경로: 결과를 받아 첫 바이트 합계."""
+    results = list(transport_pool().map(produce_pickled, [size] * TRANSPORT_TASKS, range(TRANSPORT_TASKS)))
+    return sum(r[0] for r in results)
+
+
+def transfer_shared(size: int) -> int:
+    """shared_memory 경로: 워커가 버퍼에 쓰고 부모는 view로 읽음."""
+    with SharedResultBuffer(TRANSPORT_TASKS, size) as buf:
+        list(transport_pool().map(produce_into, *buf.task_args(), range(TRANSPORT_TASKS)))
+        total = 0
+        for i in range(TRANSPORT_TASKS):
+            view = buf.view(i)
+            total += view[0]
+            view.release()
+    return total
+
+
+for _label in REGISTERED_TRANSPORT:
+    _size = TRANSPORT_SIZES[_label]
+    register(f"multiprocessing.transport.pickle.{_label}", group="transport", repeat=3)(
+        functools.partial(transfer_pickled, _size))
+    register(f"multiprocessing.transport.shm.{_label}", group="transport", repeat=3)(
+        functools.partial(transfer_shared, _size))
+
+
+def shared_memory_demo(labels: Iterable[str] = ("1KB", "1MB")) -> None:
+    """pickle vs shared_memory 결과 전달."""
+    print("\n📌 큰 결과 전달: pickle vs shared_memory")
+    print("-" * 50)
+
+    with SharedResultBuffer(slots=2, slot_size=8) as buf:
+        list(transport_pool().map(produce_into, *buf.task_args(), [65, 66]))
+        views = [buf.view(i) for i in range(2)]
+        print(f"  워커가 쓴 결과 (복사 없이 읽기): {[bytes(v) for v in views]}")
+        for v in views:
+            v.release()
+
+    results = []
+    for label in labels:
+        for kind, transfer in (("pickle", transfer_pickled), ("shm", transfer_shared)):
+            name = f"multiprocessing.transport.{kind}.{label}"
+            if label in REGISTERED_TRANSPORT:
+                results.append(registry()[name].run())
+            else:
+                results.append(run_benchmark(name, functools.partial(transfer, TRANSPORT_SIZES[label]),
+                                             repeat=3, group="transport"))
+    close_transport_pool()
+    print(f"\n  작업 {TRANSPORT_TASKS}개, 작업당 결과 크기별:")
+    print(format_table(results))
+    print("\n  💡 작은 결과는 차이 없음 (버퍼 생성 비용이 오히려 큼), 클수록 shared_memory 유리")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🧩 멀티프로세싱: chunksize 최적화")
+    print("=" * 60)
+
+    chunksize_demo()
+    shared_memory_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   chunksize 정리                               ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  작업이 작을수록 IPC(pickle + 파이프) 비용이 지배적            ║
+    ║    → 여러 작업을 chunk로 묶어서 전송                          ║
+    ║                                                               ║
+    ║  chunk 크기 기준:                                              ║
+    ║    - chunk 하나가 수십 ms 정도 걸리게                          ║
+    ║    - 워커당 chunk 여러 개 (부하 분산)                         ║
+    ║                                                               ║
+    ║  큰 결과 (배열, 바이트):                                      ║
+    ║    - 반환값 pickle → 복사 여러 번                             ║
+    ║    - shared_memory에 직접 쓰기 → 부모는 zero-copy 읽기        ║
+    ║                                                               ║
+    ║  💡 python 03_multiprocessing.py --sweep 으로 직접 비교!       ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    if "--sweep" in sys.argv[1:]:
+        chunksize_sweep()
+    elif "--shm" in sys.argv[1:]:
+        shared_memory_demo(TRANSPORT_SIZES)
+    else:
+        main()
@@ -134,12 +134,14 @@ def main() -> None:
     print("⚡ asyncio 기초")
     print("=" * 60)
     
-    # 이벤트 루프 실행
-    asyncio.run(basic_async_demo())
-    asyncio.run(concurrent_async_demo())
-    asyncio.run(task_demo())
-    asyncio.run(timeout_demo())
-    asyncio.run(exception_handling_demo())
+    # 이벤트 루프 하나로 모든 데모 실행
+    # (asyncio.run()을 5번 부르면 루프 생성/종료도 5번 → 08_loop_runner.py 참고)
+    with asyncio.Runner() as runner:
+        runner.run(basic_async_demo())
+        runner.run(concurrent_async_demo())
+        runner.run(task_demo())
+        runner.run(timeout_demo())
+        runner.run(exception_handling_demo())
     
     print("""
     ╔═══════════════════════════════════════════════════════════════╗
@@ -150,6 +152,7 @@ def main() -> None:
     ║    - async def: 코루틴 함수 정의                              ║
     ║    - await: 코루틴 실행 및 대기                               ║
     ║    - asyncio.run(): 이벤트 루프 실행                          ║
+    ║    - asyncio.Runner(): 루프 하나로 여러 번 실행               ║
     ║                                                               ║
     ║  동시 실행:                                                   ║
     ║    - asyncio.gather(): 여러 코루틴 동시 실행                  ║
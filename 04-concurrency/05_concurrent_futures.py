@@ -0,0 +1,333 @@
+"""
+05_concurrent_futures.py - concurrent.futures 실무 패턴: 재사용 워커 풀
+
+📌 핵심 개념:
+    `with ProcessPoolExecutor() as executor:`를 호출마다 쓰면
+    매번 프로세스 생성(fork/spawn) + 모듈 import 비용을 냅니다.
+    오래 실행되는 서비스에서는 풀을 한 번 만들어 계속 재사용해야 합니다.
+
+    WarmPool은 프로세스 전역에서 공유하는 풀입니다.
+        - 지연 생성: 처음 submit할 때 생성
+        - preload: forkserver면 서버에 미리 import (set_forkserver_preload),
+                   워커 initializer에서도 import (spawn / 서버가 이미 떠 있을 때 대비)
+        - max_tasks_per_child: 작업 N개마다 워커 교체 (메모리 누수 완화)
+        - health_check(): 깨진 풀(BrokenProcessPool, 죽은 워커)을 감지하면 다시 생성
+        - atexit: 인터프리터 종료 시 graceful shutdown
+
+🔄 다른 언어 비교:
+    - Java: static ExecutorService + shutdown hook
+    - Go: 워커 goroutine을 한 번 띄워 채널로 작업 전달
+    - Python: 모듈 전역 Executor + atexit
+
+⚠️ 주의사항:
+    max_tasks_per_child는 fork가 아닌 start method가 필요합니다 (3.11+).
+    forkserver를 쓰면 서버에 preload한 모듈을 워커가 fork로 물려받아 빠릅니다.
+    단, forkserver는 프로세스당 하나라서 서버가 이미 시작된 뒤의 preload는 효과가 없습니다.
+
+📚 참고: https://docs.python.org/3/library/concurrent.futures.html
+"""
+
+from __future__ import annotations
+
+import atexit
+import importlib
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, registry  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+cpu_bound_task = load_example(Path(__file__).with_name("01_gil_explained.py")).cpu_bound_task
+
+
+# =============================================================================
+# 1️⃣ 워커 측 함수
+# =============================================================================
+
+def preload_modules(modules: Sequence[str]) -> None:
+    """(워커 initializer) 무거운 모듈을 워커 시작 시 한 번 import."""
+    for name in modules:
+        importlib.import_module(name)
+
+
+def ping() -> int:
+    """(헬스 체크) 워커 PID 반환."""
+    return os.getpid()
+
+
+# =============================================================================
+# 2️⃣ WarmPool
+# =============================================================================
+
+def default_context() -> multiprocessing.context.BaseContext:
+    """max_tasks_per_child를 쓸 수 있는 start method (forkserver > spawn)."""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class WarmPool:
+    """
+    지연 생성 + 재사용되는 ProcessPoolExecutor 래퍼.
+
+    사용 예:
+        pool = WarmPool(max_workers=4, preload=("json", "decimal"))
+        future = pool.submit(cpu_bound_task, 1000)
+        results = list(pool.map(cpu_bound_task, [1000] * 100, chunksize=10))
+        pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        *,
+        preload: Sequence[str] = (),
+        initializer: Callable[..., Any] | None = None,
+        initargs: tuple[Any, ...] = (),
+        max_tasks_per_child: int | None = 1000,
+        mp_context: multiprocessing.context.BaseContext | None = None,
+    ) -> None:
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_tasks_per_child = max_tasks_per_child
+        self._mp_context = mp_context or default_context()
+        if preload and self._mp_context.get_start_method() == "forkserver":
+            # 서버가 아직 안 떴을 때만 효과 (이미 떴으면 아래 initializer가 대신 import)
+            self._mp_context.set_forkserver_preload(list(preload))
+        if initializer is None and preload:
+            initializer, initargs = preload_modules, (tuple(preload),)
+        self._initializer = initializer
+        self._initargs = initargs
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def _get(self) -> ProcessPoolExecutor:
+        """풀을 (필요하면 생성해서) 반환. 더블 체크 락킹."""
+        executor = self._executor
+        if executor is not None:
+            return executor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self._mp_context,
+                    initializer=self._initializer,
+                    initargs=self._initargs,
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+            return self._executor
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        return self._get().submit(fn, *args, **kwargs)
+
+    def map(self, fn: Callable[..., Any], *iterables: Iterable[Any], chunksize: int = 1) -> Iterator[Any]:
+        return self._get().map(fn, *iterables, chunksize=chunksize)
+
+    def warm_up(self) -> None:
+        """워커를 미리 모두 띄움 (첫 요청 지연 제거)."""
+        executor = self._get()
+        for f in [executor.submit(ping) for _ in range(self.max_workers)]:
+            f.result()
+
+    def health_check(self, timeout: float = 5.0) -> bool:
+        """
+        모든 워커 슬롯에 ping을 보내 응답을 확인.
+
+        풀이 깨졌으면(BrokenProcessPool, 죽은 워커) 풀을 버리고 False 반환
+        (다음 submit에서 새 풀이 생성됨).
+        timeout 안에 응답이 없어도 워커가 모두 살아 있으면 바쁜 것이므로 풀을 유지
+        (ping이 실제 작업 뒤에 줄 서 있을 뿐 → 큐에 쌓인 작업을 건드리지 않음).
+        """
+        executor = self._executor
+        if executor is None:
+            return True
+        try:
+            futures = [executor.submit(ping) for _ in range(self.max_workers)]
+            for f in futures:
+                f.result(timeout=timeout)
+            return True
+        except (BrokenProcessPool, RuntimeError):
+            pass
+        except TimeoutError:
+            if not has_dead_worker(executor):
+                return True
+        self._reset(executor)
+        return False
+
+    def _reset(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return  # 다른 스레드가 이미 교체함
+            self._executor = None
+            self.restarts += 1
+        # cancel_futures 없이: 아직 돌 수 있는 작업은 옛 풀에서 마저 실행
+        executor.shutdown(wait=False)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """graceful shutdown. 이후 submit하면 새 풀이 생성됨."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def has_dead_worker(executor: ProcessPoolExecutor) -> bool:
+    """
+    워커 프로세스 중 비정상 종료된 것이 있는지.
+
+    💡 _processes는 CPython 내부 속성이라 없으면 "모름 = 살아 있음"으로 취급.
+       max_tasks_per_child로 정상 교체 중인 워커(exitcode 0)는 죽은 것으로 보지 않음.
+    """
+    processes = getattr(executor, "_processes", None) or {}
+    return any(
+        not p.is_alive() and p.exitcode not in (None, 0)
+        for p in list(processes.values())
+    )
+
+
+# 프로세스 전역 풀
+_shared_pool: WarmPool | None = None
+_shared_kwargs: dict[str, Any] = {}
+_shared_lock = threading.Lock()
+
+
+def get_pool(**kwargs: Any) -> WarmPool:
+    """
+    프로세스 전역 WarmPool (처음 호출할 때의 kwargs로 생성).
+
+    이후에는 kwargs 없이 호출하거나 같은 kwargs를 넘겨야 합니다.
+    다른 설정을 넘기면 조용히 무시하지 않고 ValueError.
+
+    💡 fork된 자식 프로세스에서는 부모의 풀을 쓸 수 없으므로 새로 만듭니다.
+    """
+    global _shared_pool, _shared_kwargs
+    pool = _shared_pool
+    if pool is None:
+        with _shared_lock:
+            if _shared_pool is None:
+                _shared_pool, _shared_kwargs = WarmPool(**kwargs), dict(kwargs)
+                return _shared_pool
+            pool = _shared_pool
+    if kwargs and kwargs != _shared_kwargs:
+        raise ValueError(f"전역 풀은 이미 {_shared_kwargs}로 생성됨 (요청: {kwargs})."
+                         " 다른 설정이 필요하면 WarmPool을 직접 만들거나 shutdown_pool() 후 다시 호출")
+    return pool
+
+
+def shutdown_pool() -> None:
+    """전역 풀 종료 (atexit에 등록됨)."""
+    global _shared_pool
+    with _shared_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _forget_pool_in_child() -> None:
+    global _shared_pool
+    _shared_pool = None
+
+
+atexit.register(shutdown_pool)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool_in_child)
+
+
+# =============================================================================
+# 3️⃣ 데모 & 벤치마크: cold vs warm 디스패치 지연
+# =============================================================================
+
+WORKERS = 2
+
+
+@register("futures.dispatch.cold", group="futures", repeat=5)
+def bench_cold_dispatch() -> int:
+    """매 호출마다 풀 생성 → 작업 1개 → 종료 (01_gil_explained.py 방식)."""
+    with ProcessPoolExecutor(max_workers=WORKERS, mp_context=default_context()) as executor:
+        return executor.submit(cpu_bound_task, 10).result()
+
+
+@register("futures.dispatch.warm", group="futures", number=100, repeat=5,
+          setup=lambda: _warm_pool())
+def bench_warm_dispatch(pool: WarmPool) -> int:
+    """이미 떠 있는 풀에 작업 1개."""
+    return pool.submit(cpu_bound_task, 10).result()
+
+
+def _warm_pool() -> WarmPool:
+    pool = get_pool(max_workers=WORKERS, preload=("decimal", "json"))
+    pool.warm_up()
+    return pool
+
+
+def warm_pool_demo() -> None:
+    """전역 풀 재사용, 헬스 체크, 워커 교체."""
+    print("\n📌 전역 WarmPool")
+    print("-" * 50)
+
+    pool = get_pool(max_workers=WORKERS, preload=("decimal", "json"))
+    print(f"  생성 직후 started={pool.started} (지연 생성)")
+    results = list(pool.map(cpu_bound_task, [1000] * 8, chunksize=2))
+    print(f"  map 결과 {len(results)}개, started={pool.started}")
+    print(f"  같은 풀인가? {get_pool() is pool}")
+    print(f"  health_check(): {pool.health_check()}")
+
+    print("\n  max_tasks_per_child=2 → 작업 2개마다 워커 교체:")
+    recycling = WarmPool(max_workers=1, max_tasks_per_child=2)
+    pids = [recycling.submit(ping).result() for _ in range(6)]
+    print(f"    워커 PID: {pids}")
+    recycling.shutdown()
+
+
+def dispatch_latency_demo() -> None:
+    """cold vs warm 디스패치 지연."""
+    print("\n📌 디스패치 지연: cold vs warm")
+    print("-" * 50)
+
+    cold = registry()["futures.dispatch.cold"].run()
+    warm = registry()["futures.dispatch.warm"].run()
+    print(format_table([cold, warm]))
+    print(f"\n  ✅ 재사용 풀이 {cold.median / warm.median:.0f}배 빠름")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("♻️ concurrent.futures: 재사용 워커 풀")
+    print("=" * 60)
+
+    warm_pool_demo()
+    dispatch_latency_demo()
+    shutdown_pool()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   워커 풀 정리                                 ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ 요청마다 with ProcessPoolExecutor(): → 매번 프로세스 생성  ║
+    ║  ✅ 전역 풀 한 번 생성 → 계속 재사용                          ║
+    ║                                                               ║
+    ║  운영 체크리스트:                                             ║
+    ║    - initializer로 무거운 import 선행                         ║
+    ║    - max_tasks_per_child로 워커 주기적 교체                   ║
+    ║    - BrokenProcessPool 감지 시 풀 재생성                      ║
+    ║    - atexit에서 shutdown                                      ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
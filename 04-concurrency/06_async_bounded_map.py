@@ -0,0 +1,333 @@
+"""
+06_async_bounded_map.py - 동시 실행 수 제한 async map
+
+📌 핵심 개념:
+    asyncio.gather(*[fetch(x) for x in items])는 items 개수만큼 Task를
+    한꺼번에 만듭니다. 10만 개면 Task 10만 개, 소켓 10만 개가 동시에 열립니다.
+
+    bounded_map()은 limit개의 워커 코루틴만 띄우고, 워커가 입력 이터레이터에서
+    하나씩 꺼내 처리합니다. 살아 있는 Task 수가 limit으로 고정되므로
+    입력이 아무리 많아도 메모리와 연결 수가 일정합니다.
+        - stream_bounded(): 완료되는 순서대로 결과를 흘려보냄 (async for)
+        - timeout: 항목별 타임아웃 (04_asyncio_basics.py의 wait_for와 동일)
+        - 예외 수집: 실패한 항목만 모아서 반환 (gather의 return_exceptions와 유사)
+
+🔄 다른 언어 비교:
+    - Go: 버퍼 채널 세마포어 또는 errgroup.SetLimit(n)
+    - Java: Semaphore + CompletableFuture, 또는 고정 크기 Executor
+    - JavaScript: p-limit
+    - Python: asyncio.Semaphore 또는 워커 N개 + 이터레이터 (이 예제)
+
+⚠️ 주의사항:
+    Semaphore만 쓰면 동시 실행은 제한되지만 Task 객체는 여전히 전부 만들어집니다.
+    메모리까지 제한하려면 Task 생성 자체를 limit개로 묶어야 합니다.
+
+실행:
+    python 06_async_bounded_map.py           # 데모 (1만 개)
+    python 06_async_bounded_map.py --bench   # 1만 / 10만 / 100만 개 메모리·지연 비교
+
+📚 참고: https://docs.python.org/3/library/asyncio-sync.html#asyncio.Semaphore
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.core import percentile  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+fetch_data = load_example(Path(__file__).with_name("04_asyncio_basics.py")).fetch_data
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# =============================================================================
+# 1️⃣ stream_bounded / bounded_map
+# =============================================================================
+
+@dataclass
+class ItemError:
+    """실패한 항목 정보."""
+    index: int
+    item: Any
+    error: BaseException
+
+
+_DONE = object()
+
+
+async def _stream(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    limit: int,
+    timeout: float | None,
+) -> AsyncIterator[tuple[int, T, R | BaseException]]:
+    """stream_bounded 본체: (index, item, 결과 또는 예외). item까지 넘겨서 입력을 다시 들고 있을 필요 없음."""
+    if limit < 1:
+        raise ValueError("limit은 1 이상이어야 합니다")
+    source = iter(enumerate(items))
+    # 큐 크기를 limit으로 제한 → 소비자가 느리면 워커도 멈춤 (backpressure)
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=limit)
+
+    async def worker() -> None:
+        error: BaseException | None = None
+        cancelled = False
+        try:
+            # 단일 스레드 이벤트 루프라서 next(source) 사이에 경합 없음
+            for index, item in source:
+                try:
+                    if timeout is None:
+                        result: Any = await func(item)
+                    else:
+                        result = await asyncio.wait_for(func(item), timeout)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    result = e
+                await queue.put((index, item, result))
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except Exception as e:
+            error = e  # 입력 이터러블 자체가 실패 → 소비자 쪽에서 다시 raise
+        finally:
+            # sentinel이 빠지면 소비자가 영원히 기다림 (취소 중이면 소비자가 이미 정리 중)
+            if not cancelled:
+                await queue.put((_DONE, error))
+
+    workers = [asyncio.create_task(worker()) for _ in range(limit)]
+    try:
+        remaining = limit
+        while remaining:
+            entry = await queue.get()
+            if entry[0] is _DONE:
+                if entry[1] is not None:
+                    raise entry[1]
+                remaining -= 1
+                continue
+            yield entry
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def stream_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    limit: int = 100,
+    timeout: float | None = None,
+) -> AsyncIterator[tuple[int, R | BaseException]]:
+    """
+    limit개 워커로 func(item)을 실행하고, 완료 순서대로 (index, 결과 또는 예외)를 yield.
+
+    items는 lazy iterable이어도 됩니다 (필요할 때 하나씩 꺼냄).
+    소비자가 중간에 break하면 남은 워커는 취소됩니다.
+    items 자체가 예외를 던지면 (func 예외와 달리) 그 예외가 async for 쪽으로 raise됩니다.
+    """
+    stream = _stream(func, items, limit=limit, timeout=timeout)
+    try:
+        async for index, _, result in stream:
+            yield index, result
+    finally:
+        await stream.aclose()
+
+
+async def bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    limit: int = 100,
+    timeout: float | None = None,
+    return_exceptions: bool = False,
+) -> list[R | BaseException]:
+    """
+    입력 순서대로 결과 리스트 반환.
+
+    return_exceptions=False면 첫 예외를 그대로 raise (gather 기본 동작과 동일),
+    True면 예외 객체가 결과 자리에 들어갑니다.
+    """
+    results: dict[int, R | BaseException] = {}
+    stream = stream_bounded(func, items, limit=limit, timeout=timeout)
+    try:
+        async for index, result in stream:
+            if isinstance(result, BaseException) and not return_exceptions:
+                raise result
+            results[index] = result
+    finally:
+        await stream.aclose()
+    return [results[i] for i in range(len(results))]
+
+
+async def bounded_map_collect(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    limit: int = 100,
+    timeout: float | None = None,
+) -> tuple[dict[int, R], list[ItemError]]:
+    """
+    성공 결과 {index: 결과}와 실패 목록을 분리해서 반환.
+
+    items를 list로 만들지 않습니다 (실패한 항목만 ItemError에 남김).
+    """
+    ok: dict[int, R] = {}
+    errors: list[ItemError] = []
+    stream = _stream(func, items, limit=limit, timeout=timeout)
+    try:
+        async for index, item, result in stream:
+            if isinstance(result, BaseException):
+                errors.append(ItemError(index, item, result))
+            else:
+                ok[index] = result
+    finally:
+        await stream.aclose()
+    return ok, errors
+
+
+# =============================================================================
+# 2️⃣ 데모
+# =============================================================================
+
+async def quiet_fetch(i: int) -> int:
+    """출력 없는 fetch (대량 실행용)."""
+    await asyncio.sleep(0.001)
+    return i
+
+
+async def bounded_demo() -> None:
+    """동시 실행 수 제한 + 스트리밍 + 타임아웃 + 예외 수집."""
+    print("\n📌 limit=2로 fetch_data 4개 실행")
+    print("-" * 50)
+    start = time.perf_counter()
+    results = await bounded_map(
+        lambda name: fetch_data(name, 0.3),
+        ["Task1", "Task2", "Task3", "Task4"],
+        limit=2,
+    )
+    print(f"  결과: {results} ({time.perf_counter() - start:.2f}초, 2개씩)")
+
+    print("\n📌 완료 순서대로 스트리밍")
+    print("-" * 50)
+
+    async def variable(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    async for index, result in stream_bounded(variable, [0.3, 0.1, 0.2], limit=3):
+        print(f"  #{index} 완료: {result}초")
+
+    print("\n📌 항목별 타임아웃 + 예외 수집")
+    print("-" * 50)
+
+    async def may_fail(i: int) -> str:
+        if i == 2:
+            raise ValueError("의도적 실패")
+        await asyncio.sleep(5 if i == 3 else 0.05)
+        return f"item{i} 성공"
+
+    ok, errors = await bounded_map_collect(may_fail, range(5), limit=5, timeout=0.5)
+    print(f"  성공: {ok}")
+    for e in errors:
+        print(f"  실패: #{e.index} {type(e.error).__name__} {e.error}")
+
+    print("\n📌 입력 이터러블 자체가 실패하면 → 멈추지 않고 그 예외가 raise")
+    print("-" * 50)
+
+    def broken_source() -> Iterable[int]:
+        yield from range(3)
+        raise OSError("입력 스트림 끊김")
+
+    try:
+        await asyncio.wait_for(bounded_map(quiet_fetch, broken_source(), limit=2), timeout=2)
+    except OSError as e:
+        print(f"  bounded_map → {type(e).__name__}: {e}")
+
+
+async def measure_fanout(n: int, bounded: bool, limit: int = 1000) -> tuple[float, int, list[float]]:
+    """(소요 초, tracemalloc peak 바이트, 항목별 지연 정렬 리스트).
+
+    항목별 지연 = fan-out 시작 → 그 항목 완료. gather는 모두 한꺼번에 시작하지만
+    이벤트 루프가 Task 수만큼 느려지고, bounded는 차례를 기다리는 시간이 들어갑니다.
+    """
+    latencies: list[float] = []
+
+    async def timed(i: int) -> int:
+        result = await quiet_fetch(i)
+        latencies.append(time.perf_counter() - start)
+        return result
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    if bounded:
+        await bounded_map(timed, range(n), limit=limit)
+    else:
+        await asyncio.gather(*(timed(i) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies.sort()
+    return elapsed, peak, latencies
+
+
+async def fanout_benchmark(sizes: Iterable[int] = (10_000,), gather_max: int = 100_000) -> None:
+    """gather 전체 vs bounded_map 메모리/지연 비교."""
+    print("\n📌 gather 전체 vs bounded_map(limit=1000)")
+    print("-" * 50)
+    print(f"  {'items':>9}  {'방식':<8}  {'시간':>8}  {'p50':>8}  {'p99':>8}  {'peak 메모리':>12}")
+    for n in sizes:
+        rows = [("bounded", True)]
+        if n <= gather_max:
+            rows.insert(0, ("gather", False))
+        for label, bounded in rows:
+            elapsed, peak, latencies = await measure_fanout(n, bounded)
+            print(f"  {n:>9,}  {label:<8}  {elapsed:>7.2f}s  {percentile(latencies, 50):>7.2f}s"
+                  f"  {percentile(latencies, 99):>7.2f}s  {peak / 1024 / 1024:>10.1f}MB")
+    print("\n  💡 p50/p99: 시작부터 항목 완료까지 (tracemalloc 켠 상태라 절대값보다 비교용)")
+    print(f"  💡 gather는 {gather_max:,}개 초과 시 생략 (Task 수만큼 메모리 증가)")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🚦 동시 실행 수 제한 async map")
+    print("=" * 60)
+
+    async def run_all() -> None:
+        await bounded_demo()
+        await fanout_benchmark()
+
+    asyncio.run(run_all())
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                  bounded fan-out 정리                          ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ gather(*[f(x) for x in 100만개]) → Task 100만 개          ║
+    ║  ✅ 워커 N개 + 이터레이터 → Task N개, 메모리 일정             ║
+    ║                                                               ║
+    ║  함께 챙길 것:                                                ║
+    ║    - 항목별 타임아웃 (wait_for)                               ║
+    ║    - 실패 항목 수집 (전체 중단 X)                             ║
+    ║    - 완료 순 스트리밍 (async for)                             ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        asyncio.run(fanout_benchmark((10_000, 100_000, 1_000_000)))
+    else:
+        main()
@@ -0,0 +1,226 @@
+"""
+07_event_loops.py - 이벤트 루프 선택 & 루프 마이크로벤치마크
+
+📌 핵심 개념:
+    asyncio.run()은 항상 기본 루프(Unix: SelectorEventLoop)를 씁니다.
+    uvloop(libuv 기반) 같은 대체 루프는 같은 asyncio API를 구현하면서
+    task 스케줄링과 소켓 I/O가 더 빠릅니다.
+
+    이 예제는 설치된 루프를 찾아 loop_factory로 선택하고,
+    다음 세 가지로 비교합니다.
+        - task 생성률: 빈 코루틴 Task N개 생성 + 완료
+        - sleep(0) 핑퐁: 두 코루틴이 sleep(0)으로 번갈아 양보
+        - TCP echo: 로컬 서버/클라이언트 왕복 처리량
+
+🔄 다른 언어 비교:
+    - Node.js: libuv가 기본 루프 (uvloop과 같은 엔진)
+    - Go: 런타임 netpoller가 내장 (선택 불필요)
+    - Python: 기본 루프 + 선택적으로 uvloop (pip install uvloop)
+
+⚠️ 주의사항:
+    - 이벤트 루프 정책(set_event_loop_policy)은 3.14부터 deprecated입니다.
+      asyncio.Runner(loop_factory=...)로 루프를 고르세요.
+    - 환경 변수 ASYNC_LOOP=uvloop 으로 기본 선택을 바꿀 수 있습니다.
+
+📚 참고: https://docs.python.org/3/library/asyncio-runner.html
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import Any, Callable, Coroutine, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+
+T = TypeVar("T")
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+# =============================================================================
+# 1️⃣ 루프 선택
+# =============================================================================
+
+def available_loops() -> dict[str, LoopFactory]:
+    """이 환경에서 쓸 수 있는 이벤트 루프 {이름: factory}."""
+    loops: dict[str, LoopFactory] = {"asyncio": asyncio.new_event_loop}
+    if sys.platform == "win32":
+        loops["selector"] = asyncio.SelectorEventLoop
+    try:
+        import uvloop  # 선택 의존성
+    except ImportError:
+        pass
+    else:
+        loops["uvloop"] = uvloop.new_event_loop
+    try:
+        import winloop  # Windows용 uvloop 포크 (선택 의존성)
+    except ImportError:
+        pass
+    else:
+        loops["winloop"] = winloop.new_event_loop
+    return loops
+
+
+def loop_factory(name: str | None = None) -> LoopFactory:
+    """
+    이름으로 루프 factory 선택.
+
+    name이 없으면 환경 변수 ASYNC_LOOP, 그것도 없으면 "auto"
+    (uvloop/winloop이 설치되어 있으면 그것, 아니면 기본 asyncio).
+    """
+    loops = available_loops()
+    name = name or os.environ.get("ASYNC_LOOP", "auto")
+    if name == "auto":
+        for preferred in ("uvloop", "winloop", "asyncio"):
+            if preferred in loops:
+                return loops[preferred]
+    if name not in loops:
+        raise ValueError(f"사용할 수 없는 루프: {name} (가능: {', '.join(loops)})")
+    return loops[name]
+
+
+def run(coro: Coroutine[Any, Any, T], *, loop: str | None = None) -> T:
+    """asyncio.run() 대신 선택한 루프로 실행."""
+    with asyncio.Runner(loop_factory=loop_factory(loop)) as runner:
+        return runner.run(coro)
+
+
+# =============================================================================
+# 2️⃣ 마이크로벤치마크 시나리오
+# =============================================================================
+
+TASKS = 10_000
+PINGPONG = 10_000
+ECHO_MESSAGES = 2_000
+ECHO_SIZE = 1024
+
+
+async def task_creation(n: int = TASKS) -> None:
+    """빈 코루틴 Task n개 생성 후 모두 대기."""
+    async def noop() -> None:
+        pass
+
+    await asyncio.gather(*[asyncio.create_task(noop()) for _ in range(n)])
+
+
+async def sleep0_pingpong(n: int = PINGPONG) -> None:
+    """두 코루틴이 sleep(0)으로 번갈아 양보 (루프 1회전 비용)."""
+    turn = 0
+
+    async def player(me: int) -> None:
+        nonlocal turn
+        for _ in range(n):
+            while turn != me:
+                await asyncio.sleep(0)
+            turn = 1 - me
+
+    await asyncio.gather(player(0), player(1))
+
+
+async def tcp_echo(messages: int = ECHO_MESSAGES, size: int = ECHO_SIZE) -> None:
+    """로컬 TCP echo 서버와 messages번 왕복."""
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    payload = b"x" * size
+    for _ in range(messages):
+        writer.write(payload)
+        await writer.drain()
+        await reader.readexactly(size)
+    writer.close()
+    await writer.wait_closed()
+    server.close()
+    await server.wait_closed()
+
+
+SCENARIOS: dict[str, tuple[Callable[[], Coroutine[Any, Any, None]], int, str]] = {
+    "tasks": (task_creation, TASKS, "tasks/s"),
+    "sleep0": (sleep0_pingpong, PINGPONG * 2, "switches/s"),
+    "tcp_echo": (tcp_echo, ECHO_MESSAGES, "round-trips/s"),
+}
+
+
+def _register_loop_benchmarks() -> None:
+    """설치된 루프 × 시나리오마다 벤치마크 등록."""
+    for loop_name in available_loops():
+        for scenario, (coro_fn, _, _) in SCENARIOS.items():
+            def bench(coro_fn: Callable[[], Coroutine[Any, Any, None]] = coro_fn,
+                      loop_name: str = loop_name) -> None:
+                run(coro_fn(), loop=loop_name)
+
+            register(f"eventloop.{scenario}.{loop_name}", group="eventloop", repeat=5)(bench)
+
+
+_register_loop_benchmarks()
+
+
+# =============================================================================
+# 3️⃣ 데모
+# =============================================================================
+
+def loop_selection_demo() -> None:
+    """루프 선택."""
+    print("\n📌 이벤트 루프 선택")
+    print("-" * 50)
+    loops = available_loops()
+    print(f"  설치된 루프: {', '.join(loops)}")
+
+    async def which() -> str:
+        return type(asyncio.get_running_loop()).__module__ + "." + type(asyncio.get_running_loop()).__name__
+
+    print(f"  auto 선택:   {run(which())}")
+    print(f"  asyncio:     {run(which(), loop='asyncio')}")
+    if "uvloop" not in loops:
+        print("  💡 pip install uvloop 후 다시 실행하면 uvloop도 비교합니다")
+
+
+def loop_benchmark_demo() -> None:
+    """루프별 마이크로벤치마크."""
+    print("\n📌 루프 마이크로벤치마크")
+    print("-" * 50)
+    results = run_group("eventloop")
+    print(format_table(results))
+
+    print()
+    for r in results:
+        _, scenario, loop_name = r.name.split(".")
+        _, ops, unit = SCENARIOS[scenario]
+        print(f"  {scenario:<9} {loop_name:<8} {ops / r.median:>12,.0f} {unit}")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🔁 이벤트 루프 선택 & 벤치마크")
+    print("=" * 60)
+
+    loop_selection_demo()
+    loop_benchmark_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   이벤트 루프 정리                             ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  루프 선택:                                                   ║
+    ║    - asyncio.Runner(loop_factory=uvloop.new_event_loop)       ║
+    ║    - 3.12+: asyncio.run(main(), loop_factory=...)             ║
+    ║    - 정책(set_event_loop_policy)은 deprecated                 ║
+    ║                                                               ║
+    ║  💡 추측 말고 측정: task 생성, 루프 회전, 소켓 I/O            ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
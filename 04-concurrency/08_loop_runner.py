@@ -0,0 +1,289 @@
+"""
+08_loop_runner.py - 이벤트 루프 하나를 계속 살려 두는 러너
+
+📌 핵심 개념:
+    asyncio.run()은 호출할 때마다 루프 생성 → 실행 → 남은 task 정리 → 루프 종료를 합니다.
+    동기 코드(CLI, Flask 핸들러, 배치 스크립트) 안에서 async 함수를 자주 부르면
+    이 준비/정리 비용이 실제 작업보다 커집니다.
+
+    두 가지 재사용 방법:
+        - asyncio.Runner: 같은 스레드에서 루프 하나로 여러 코루틴 실행
+                          (04_asyncio_basics.py의 main()이 이 방식)
+        - BackgroundLoop: 별도 스레드에서 루프를 계속 돌리고, 어느 스레드에서든
+                          run_coroutine_threadsafe()로 코루틴을 제출
+
+🔄 다른 언어 비교:
+    - Java: 공유 Executor에 CompletableFuture 제출
+    - Go: 런타임이 항상 떠 있음 (go 키워드로 바로 제출)
+    - Python: 백그라운드 스레드 + asyncio.run_coroutine_threadsafe
+
+⚠️ 주의사항:
+    - 루프 스레드 안에서 BackgroundLoop.run()을 호출하면 자기 자신을 기다리며 멈춥니다
+      → RuntimeError로 막습니다
+    - 루프에 묶인 객체(세션, 커넥션 풀)는 항상 같은 루프에서만 써야 합니다
+
+📚 참고: https://docs.python.org/3/library/asyncio-task.html#asyncio.run_coroutine_threadsafe
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Coroutine, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+_loops = load_example(Path(__file__).with_name("07_event_loops.py"))
+_basics = load_example(Path(__file__).with_name("04_asyncio_basics.py"))
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# 1️⃣ BackgroundLoop
+# =============================================================================
+
+class BackgroundLoop:
+    """
+    별도 스레드에서 계속 도는 이벤트 루프.
+
+    loop_factory를 생략하면 07_event_loops.py의 loop_factory() 규칙을 따릅니다
+    (ASYNC_LOOP 환경 변수 → uvloop → 기본 asyncio).
+
+    사용 예:
+        with BackgroundLoop() as bg:
+            result = bg.run(fetch_data("A", 0.1))     # 동기 코드에서 결과 대기
+            future = bg.submit(fetch_data("B", 0.1))  # concurrent.futures.Future
+    """
+
+    def __init__(
+        self,
+        loop_factory: Callable[[], asyncio.AbstractEventLoop] | None = None,
+        name: str = "background-loop",
+    ) -> None:
+        self._loop_factory = loop_factory or _loops.loop_factory()
+        self._name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """루프 (필요하면 시작)."""
+        return self._loop if self._loop is not None else self.start()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """루프 스레드 시작 (이미 돌고 있으면 그대로)."""
+        with self._lock:
+            if self._loop is None:
+                loop = self._loop_factory()
+                ready = threading.Event()
+
+                def serve() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=serve, name=self._name, daemon=True)
+                self._thread.start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """코루틴 제출 (어느 스레드에서든 가능)."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """코루틴을 제출하고 결과까지 대기 (동기 코드용)."""
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("루프 스레드 안에서는 run()을 호출할 수 없습니다 (await 사용)")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        남은 task 취소 → 루프 정지 → 스레드 join → 루프 close.
+
+        timeout 안에 스레드가 끝나지 않으면 (루프가 아직 도는 중이라 close할 수 없으므로)
+        루프를 닫지 않고 RuntimeError를 냅니다.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def cancel_all() -> None:
+            current = asyncio.current_task()
+            tasks = [t for t in asyncio.all_tasks() if t is not current]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_all(), loop).result(timeout)
+        except concurrent.futures.TimeoutError:
+            pass  # 취소를 무시하는 task가 있어도 루프는 멈춤
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if thread.is_alive():
+            # 실행 중인 루프를 close하면 "Cannot close a running event loop"
+            raise RuntimeError(f"루프 스레드가 {timeout}초 안에 끝나지 않았습니다 (루프를 닫지 않음)")
+        loop.close()
+
+    def __enter__(self) -> BackgroundLoop:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+_shared: BackgroundLoop | None = None
+_shared_lock = threading.Lock()
+
+
+def get_background_loop() -> BackgroundLoop:
+    """프로세스 전역 BackgroundLoop (종료 시 atexit으로 정리)."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = BackgroundLoop(name="shared-background-loop")
+                atexit.register(_shared.stop)
+    return _shared
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """asyncio.run() 대용: 전역 루프에서 실행하고 결과 반환."""
+    return get_background_loop().run(coro, timeout)
+
+
+# =============================================================================
+# 2️⃣ 벤치마크: asyncio.run vs Runner vs BackgroundLoop
+# =============================================================================
+
+async def tiny() -> int:
+    """오버헤드만 보이도록 거의 아무것도 안 하는 코루틴."""
+    await asyncio.sleep(0)
+    return 1
+
+
+@register("loop_runner.asyncio_run", group="loop_runner", number=200)
+def bench_asyncio_run() -> int:
+    return asyncio.run(tiny())
+
+
+@register("loop_runner.runner", group="loop_runner", number=200,
+          setup=lambda: _persistent_runner())
+def bench_runner(runner: asyncio.Runner) -> int:
+    return runner.run(tiny())
+
+
+@register("loop_runner.background", group="loop_runner", number=200,
+          setup=lambda: get_background_loop())
+def bench_background(bg: BackgroundLoop) -> int:
+    return bg.run(tiny())
+
+
+_runner: asyncio.Runner | None = None
+
+
+def _persistent_runner() -> asyncio.Runner:
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+        atexit.register(_runner.close)
+    return _runner
+
+
+# =============================================================================
+# 3️⃣ 데모
+# =============================================================================
+
+def background_loop_demo() -> None:
+    """여러 동기 스레드가 하나의 루프를 공유."""
+    print("\n📌 동기 코드에서 공유 루프로 코루틴 실행")
+    print("-" * 50)
+
+    async def where(name: str) -> str:
+        await asyncio.sleep(0.05)
+        return f"{name} → 루프 스레드 {threading.current_thread().name}"
+
+    print(f"  {run_sync(where('메인'))}")
+
+    results: list[str] = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(run_sync(where(f"워커{i}"))))
+        for i in range(3)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for r in sorted(results):
+        print(f"  {r}")
+
+    print("\n  04_asyncio_basics.py의 fetch_data를 공유 루프에서:")
+    future = get_background_loop().submit(_basics.fetch_data("BG", 0.1))
+    print(f"  submit() 직후 done={future.done()} → 결과 {future.result()!r}")
+
+    print("\n  타임아웃:")
+    try:
+        run_sync(asyncio.sleep(5), timeout=0.1)
+    except concurrent.futures.TimeoutError:
+        print("  ⚠️ 0.1초 타임아웃 → 루프 쪽 코루틴도 취소됨")
+
+
+def dispatch_overhead_demo() -> None:
+    """호출 1회당 오버헤드 비교."""
+    print("\n📌 호출당 오버헤드: asyncio.run vs 재사용 루프")
+    print("-" * 50)
+    results = {r.name: r for r in run_group("loop_runner")}
+    print(format_table(results.values()))
+    base = results["loop_runner.asyncio_run"].median
+    for name in ("loop_runner.runner", "loop_runner.background"):
+        print(f"  {name}: asyncio.run 대비 {base / results[name].median:.1f}배 빠름")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("♾️ 이벤트 루프 재사용")
+    print("=" * 60)
+
+    background_loop_demo()
+    dispatch_overhead_demo()
+    get_background_loop().stop()
+    if _runner is not None:
+        _runner.close()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   루프 재사용 정리                             ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ 동기 코드에서 매번 asyncio.run() → 루프 생성/정리 반복    ║
+    ║                                                               ║
+    ║  ✅ 같은 스레드: with asyncio.Runner() as r: r.run(...)        ║
+    ║  ✅ 여러 스레드: 백그라운드 루프 + run_coroutine_threadsafe    ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+09_task_supervisor.py - TaskGroup 기반 작업 감독자 (backpressure + 재시작)
+
+📌 핵심 개념:
+    04_asyncio_basics.py의 task_demo()는 create_task로 띄운 뒤 하나씩 await합니다.
+    작업이 수천 개가 되면 다음 문제가 생깁니다.
+        - Task가 무제한으로 쌓임 (메모리 증가)
+        - 실패한 작업은 조용히 사라짐 (재시도 없음)
+        - 종료 시 누가 무엇을 취소해야 하는지 불분명
+
+    Supervisor는 이를 한곳에서 관리합니다.
+        - TaskGroup 안에 워커 max_running개만 실행 → 살아 있는 Task 수 고정
+        - 크기 제한 큐(max_queued) → 큐가 차면 submit()이 대기 (backpressure)
+        - 실패 시 지수 백오프 + full jitter로 재시작 (max_restarts회)
+        - queued / running / completed / failed / restarts 실시간 카운터
+        - async with 블록을 빠져나오면 남은 작업까지 완료 후 워커 정리,
+          예외로 빠져나오면 TaskGroup이 모든 워커를 취소 (structured concurrency)
+        - cancel(): 끝나지 않는 루프 작업을 한 번에 종료
+
+🔄 다른 언어 비교:
+    - Erlang/Elixir: Supervisor + restart strategy (원조)
+    - Go: errgroup.SetLimit + 버퍼 채널
+    - Java: ThreadPoolExecutor(bounded queue, CallerRunsPolicy)
+    - Python: asyncio.TaskGroup + asyncio.Queue(maxsize)
+
+⚠️ 주의사항:
+    - 재시작하려면 코루틴이 아니라 "코루틴을 만드는 함수"를 넘겨야 합니다
+      (코루틴 객체는 한 번만 await할 수 있음)
+    - 백오프 대기 중에도 워커 슬롯을 차지합니다 (running에 포함)
+    - asyncio.TaskGroup은 Python 3.11+
+
+📚 참고: https://docs.python.org/3/library/asyncio-task.html#task-groups
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+
+# =============================================================================
+# 1️⃣ Supervisor
+# =============================================================================
+
+@dataclass
+class SupervisorStats:
+    """실시간 카운터 스냅샷."""
+    queued: int
+    running: int
+    completed: int
+    failed: int
+    restarts: int
+
+    def __str__(self) -> str:
+        return (f"queued={self.queued} running={self.running} completed={self.completed}"
+                f" failed={self.failed} restarts={self.restarts}")
+
+
+@dataclass
+class JobFailure:
+    """재시작을 모두 소진한 작업."""
+    name: str
+    attempts: int
+    error: BaseException
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """지수 백오프 + full jitter: uniform(0, min(cap, base * 2^attempt))."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class Supervisor:
+    """
+    TaskGroup 안에서 고정 개수 워커로 작업을 실행하는 감독자.
+
+    사용 예:
+        async with Supervisor(max_running=10, max_queued=100) as sup:
+            for i in range(10_000):
+                await sup.submit(lambda i=i: fetch(i))   # 큐가 차면 대기
+        print(sup.stats)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_running: int = 100,
+        max_queued: int = 1000,
+        max_restarts: int = 3,
+        backoff_base: float = 0.05,
+        backoff_cap: float = 2.0,
+        keep_failures: int = 100,
+    ) -> None:
+        if max_running < 1 or max_queued < 1:
+            raise ValueError("max_running, max_queued는 1 이상이어야 합니다")
+        self.max_running = max_running
+        self.max_restarts = max_restarts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._queue: asyncio.Queue[tuple[str, JobFactory]] = asyncio.Queue(maxsize=max_queued)
+        self._group: asyncio.TaskGroup | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._running = self._completed = self._failed = self._restarts = 0
+        self._submitted = 0
+        self._closed = False  # cancel() 또는 종료 이후에는 제출 거부
+        # 최근 실패만 보관 (작업이 무한히 실패해도 메모리 일정)
+        self.failures: deque[JobFailure] = deque(maxlen=keep_failures)
+
+    @property
+    def stats(self) -> SupervisorStats:
+        return SupervisorStats(
+            queued=self._queue.qsize(),
+            running=self._running,
+            completed=self._completed,
+            failed=self._failed,
+            restarts=self._restarts,
+        )
+
+    async def __aenter__(self) -> Supervisor:
+        self._group = asyncio.TaskGroup()
+        await self._group.__aenter__()
+        self._workers = [
+            self._group.create_task(self._worker(), name=f"supervisor-worker-{i}")
+            for i in range(self.max_running)
+        ]
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool | None:
+        assert self._group is not None
+        pending: BaseException | None = None
+        if exc_type is None:
+            try:
+                await self._queue.join()  # 정상 종료: 남은 작업까지 처리
+            except BaseException as e:  # 기다리는 중 취소됨
+                pending = e
+                exc_type, exc, tb = type(e), e, e.__traceback__
+        self._closed = True
+        for w in self._workers:
+            w.cancel()
+        # 예외로 빠져나온 경우에도 TaskGroup이 워커 취소/대기를 보장
+        suppress = await self._group.__aexit__(exc_type, exc, tb)
+        if pending is not None:
+            raise pending
+        return suppress
+
+    def cancel(self) -> None:
+        """대기 중인 작업은 버리고 실행 중인 작업은 취소 (끝나지 않는 루프 작업 종료용)."""
+        self._closed = True
+        self._discard_queued()
+        for w in self._workers:
+            w.cancel()
+
+    def _discard_queued(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("이미 취소되었거나 종료된 Supervisor에는 작업을 제출할 수 없습니다")
+
+    async def submit(self, factory: JobFactory, name: str | None = None) -> None:
+        """
+        작업 제출. 큐가 가득 차면 자리가 날 때까지 대기 (backpressure).
+
+        cancel() 또는 종료 이후에는 RuntimeError (실행되지 않을 작업을 받지 않음).
+        """
+        self._check_open()
+        self._submitted += 1
+        await self._queue.put((name or f"job-{self._submitted}", factory))
+        if self._closed:  # 자리를 기다리는 사이 cancel()됨 → 넣은 작업은 실행되지 않으므로 되돌림
+            self._discard_queued()
+            self._check_open()
+
+    def try_submit(self, factory: JobFactory, name: str | None = None) -> bool:
+        """대기 없이 제출. 큐가 가득 차면 False (호출자가 버리거나 나중에 재시도)."""
+        self._check_open()
+        try:
+            self._queue.put_nowait((name or f"job-{self._submitted + 1}", factory))
+        except asyncio.QueueFull:
+            return False
+        self._submitted += 1
+        return True
+
+    async def _worker(self) -> None:
+        while True:
+            name, factory = await self._queue.get()
+            self._running += 1
+            try:
+                await self._run_job(name, factory)
+            finally:
+                self._running -= 1
+                self._queue.task_done()
+
+    async def _run_job(self, name: str, factory: JobFactory) -> None:
+        """성공할 때까지 최대 max_restarts회 재시작."""
+        attempt = 0
+        while True:
+            try:
+                await factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if attempt >= self.max_restarts:
+                    self._failed += 1
+                    self.failures.append(JobFailure(name, attempt + 1, e))
+                    return
+                self._restarts += 1
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_cap))
+                attempt += 1
+            else:
+                self._completed += 1
+                return
+
+
+# =============================================================================
+# 2️⃣ 데모
+# =============================================================================
+
+async def background_task_demo() -> None:
+    """task_demo()의 백그라운드 작업을 Supervisor로."""
+    print("\n📌 task_demo → Supervisor")
+    print("-" * 50)
+
+    async def background_task(name: str) -> None:
+        for i in range(3):
+            print(f"  {name}: 작업 {i+1}")
+            await asyncio.sleep(0.1)
+
+    async with Supervisor(max_running=2) as sup:
+        await sup.submit(lambda: background_task("BG1"), name="BG1")
+        await sup.submit(lambda: background_task("BG2"), name="BG2")
+        print("  메인: 다른 작업 수행 중...")
+        await asyncio.sleep(0.15)
+        print(f"  중간 상태: {sup.stats}")
+    print(f"  모든 작업 완료: {sup.stats}")
+
+
+async def restart_demo() -> None:
+    """실패 → jitter 백오프 재시작."""
+    print("\n📌 실패한 작업 재시작 (지수 백오프 + jitter)")
+    print("-" * 50)
+
+    attempts: dict[str, int] = {}
+
+    def flaky(name: str, fail_times: int) -> JobFactory:
+        async def job() -> None:
+            attempts[name] = attempts.get(name, 0) + 1
+            await asyncio.sleep(0.01)
+            if attempts[name] <= fail_times:
+                raise ConnectionError(f"{name} {attempts[name]}번째 시도 실패")
+        return job
+
+    async with Supervisor(max_running=3, max_restarts=2, backoff_base=0.02) as sup:
+        await sup.submit(flaky("안정", 0), name="안정")
+        await sup.submit(flaky("가끔 실패", 1), name="가끔 실패")
+        await sup.submit(flaky("항상 실패", 99), name="항상 실패")
+
+    for name, n in attempts.items():
+        print(f"  {name:<8} 시도 {n}회")
+    print(f"  {sup.stats}")
+    for f in sup.failures:
+        print(f"  ❌ {f.name}: {f.attempts}회 시도 후 포기 ({f.error})")
+
+
+async def long_running_demo(loops: int = 2000) -> None:
+    """끝나지 않는 백그라운드 루프 수천 개 → cancel()로 한 번에 정리."""
+    print(f"\n📌 백그라운드 루프 {loops:,}개 감독")
+    print("-" * 50)
+
+    ticks = 0
+
+    async def poller() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async with Supervisor(max_running=loops, max_queued=loops) as sup:
+        for _ in range(loops):
+            sup.try_submit(poller)
+        await asyncio.sleep(0.2)
+        print(f"  실행 중: {sup.stats}, tick {ticks:,}회")
+        sup.cancel()
+        try:
+            await sup.submit(poller)
+        except RuntimeError as e:
+            print(f"  cancel() 후 submit → RuntimeError: {e}")
+    print(f"  cancel() 후 남은 Task: {len(asyncio.all_tasks()) - 1}개 (메인 제외)")
+
+
+async def backpressure_demo(jobs: int = 20_000) -> None:
+    """create_task 전부 vs Supervisor: 살아 있는 Task 수와 peak 메모리."""
+    print(f"\n📌 작업 {jobs:,}개: create_task 전부 vs Supervisor")
+    print("-" * 50)
+
+    async def job() -> None:
+        await asyncio.sleep(0.001)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    tasks = [asyncio.create_task(job()) for _ in range(jobs)]
+    live = len(asyncio.all_tasks())
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    print(f"  create_task   최대 Task {live:>6,}개  {elapsed:5.2f}s  peak {peak / 1024 / 1024:6.1f}MB")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    max_live = 0
+    async with Supervisor(max_running=200, max_queued=200) as sup:
+        for i in range(jobs):
+            await sup.submit(job)  # 큐가 차면 여기서 대기 → 생산자 속도 제한
+            if i % 5000 == 0:
+                max_live = max(max_live, len(asyncio.all_tasks()))
+                print(f"    [{i:>6,}] {sup.stats}")
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  Supervisor    최대 Task {max_live:>6,}개  {elapsed:5.2f}s  peak {peak / 1024 / 1024:6.1f}MB")
+    print(f"  {sup.stats}")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🛡️ 작업 감독자: backpressure + 재시작")
+    print("=" * 60)
+
+    async def run_all() -> None:
+        await background_task_demo()
+        await restart_demo()
+        await long_running_demo()
+        await backpressure_demo()
+
+    asyncio.run(run_all())
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   작업 감독자 정리                             ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ create_task 남발 → Task 무한 증가, 실패는 조용히 사라짐   ║
+    ║                                                               ║
+    ║  ✅ TaskGroup + 워커 N개 → 살아 있는 Task 수 고정             ║
+    ║  ✅ Queue(maxsize) → 큐가 차면 생산자 대기 (backpressure)     ║
+    ║  ✅ 실패 시 지수 백오프 + jitter로 재시작                     ║
+    ║  ✅ queued/running/completed/failed 카운터로 상태 관찰        ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+10_async_pipeline.py - asyncio.Queue로 잇는 생산자/소비자 파이프라인
+
+📌 핵심 개념:
+    실무의 비동기 처리는 보통 여러 단계입니다.
+        가져오기(I/O) → 파싱(CPU) → 묶어서 저장(I/O, 배치)
+
+    Pipeline은 각 단계를 async 함수로 정의하고, 단계 사이를
+    크기 제한 asyncio.Queue로 연결합니다.
+        - 단계별 동시 실행 수 (concurrency): 느린 단계만 워커를 늘림
+        - 배치 (batch_size, batch_timeout): 항목을 모아 한 번에 처리
+        - 종료 신호 (end-of-stream): 입력이 끝나면 단계마다 차례로 전파
+        - 오류: 한 단계가 실패하면 모든 워커를 취소하고 소비자에게 예외 전달
+
+    큐 크기는 처리량이 아니라 지연을 결정합니다.
+    처리량은 가장 느린 단계가 정하고, 큐가 크면 그 앞에 항목이 쌓여
+    기다리는 시간만 늘어납니다 (Little's law: 대기 항목 = 처리량 × 지연).
+
+🔄 다른 언어 비교:
+    - Go: goroutine + 버퍼 채널 파이프라인 (close(ch)로 종료 전파)
+    - Java: BlockingQueue + ExecutorService, 또는 Reactor/Akka Streams
+    - Python: asyncio.Queue(maxsize) + 워커 코루틴 (이 예제)
+
+⚠️ 주의사항:
+    - 파이프라인 안 CPU 작업은 이벤트 루프를 막습니다 (무거우면 to_thread/프로세스 풀)
+    - 배치 단계는 여러 항목을 받아 결과 이터러블을 반환합니다 (결과는 하나씩 다음 단계로)
+
+실행:
+    python 10_async_pipeline.py           # 데모 + 작은 스윕
+    python 10_async_pipeline.py --bench   # 동시 실행 수 × 큐 크기 전체 스윕
+
+📚 참고: https://docs.python.org/3/library/asyncio-queue.html
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.core import percentile  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+fetch_data = load_example(Path(__file__).with_name("04_asyncio_basics.py")).fetch_data
+
+
+# =============================================================================
+# 1️⃣ Stage / Pipeline
+# =============================================================================
+
+@dataclass
+class Stage:
+    """
+    파이프라인 단계 하나.
+
+    batch_size=1이면 func(item) → 결과 1개,
+    batch_size>1이면 func([item, ...]) → 결과 이터러블 (하나씩 다음 단계로).
+    """
+    name: str
+    func: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    queue_size: int = 100
+    batch_size: int = 1
+    batch_timeout: float | None = None  # 배치가 덜 차도 이 시간이 지나면 처리
+    processed: int = field(default=0, init=False)
+    busy: float = field(default=0.0, init=False)
+
+
+class _EndOfStream:
+    def __repr__(self) -> str:
+        return "<EOS>"
+
+
+@dataclass
+class _Failure:
+    stage: str
+    error: BaseException
+
+
+EOS = _EndOfStream()
+
+
+class Pipeline:
+    """
+    단계들을 크기 제한 큐로 연결한 파이프라인.
+
+    사용 예:
+        pipeline = Pipeline(
+            Stage("fetch", fetch, concurrency=8),
+            Stage("parse", parse),
+            Stage("store", store_batch, batch_size=50, batch_timeout=0.1),
+        )
+        async for result in pipeline.stream(urls):
+            ...
+    """
+
+    def __init__(self, *stages: Stage) -> None:
+        if not stages:
+            raise ValueError("단계가 하나 이상 필요합니다")
+        for s in stages:
+            if s.concurrency < 1 or s.queue_size < 1 or s.batch_size < 1:
+                raise ValueError(f"{s.name}: concurrency/queue_size/batch_size는 1 이상")
+        self.stages = stages
+
+    async def stream(self, source: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+        """source를 흘려보내고 마지막 단계 결과를 완료 순서대로 yield."""
+        queues = [asyncio.Queue[Any](maxsize=s.queue_size) for s in self.stages]
+        output: asyncio.Queue[Any] = asyncio.Queue(maxsize=self.stages[-1].queue_size)
+        tasks: list[asyncio.Task[None]] = []
+
+        def fail(stage: str, error: BaseException) -> None:
+            """모든 워커 취소 + 소비자에게 실패 전달 (출력 큐를 비워서라도)."""
+            for t in tasks:
+                if t is not asyncio.current_task():
+                    t.cancel()
+            while True:
+                try:
+                    output.put_nowait(_Failure(stage, error))
+                    return
+                except asyncio.QueueFull:
+                    output.get_nowait()
+
+        async def feed() -> None:
+            try:
+                if isinstance(source, AsyncIterable):
+                    async for item in source:
+                        await queues[0].put(item)
+                else:
+                    for item in source:
+                        await queues[0].put(item)
+            except Exception as e:
+                fail("source", e)
+                return
+            await queues[0].put(EOS)
+
+        for i, stage in enumerate(self.stages):
+            inbox = queues[i]
+            outbox = queues[i + 1] if i + 1 < len(self.stages) else output
+            alive = [stage.concurrency]  # 이 단계에 남은 워커 수
+            for _ in range(stage.concurrency):
+                tasks.append(asyncio.create_task(self._worker(stage, inbox, outbox, alive, fail)))
+        tasks.append(asyncio.create_task(feed()))
+
+        try:
+            while True:
+                item = await output.get()
+                if item is EOS:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                yield item
+        finally:
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, source: Iterable[Any] | AsyncIterable[Any]) -> list[Any]:
+        """모든 결과를 리스트로 (완료 순서)."""
+        return [item async for item in self.stream(source)]
+
+    @staticmethod
+    async def _worker(
+        stage: Stage,
+        inbox: asyncio.Queue[Any],
+        outbox: asyncio.Queue[Any],
+        alive: list[int],
+        fail: Callable[[str, BaseException], None],
+    ) -> None:
+        done = False
+        while not done:
+            batch: list[Any] = []
+            deadline = None
+            while len(batch) < stage.batch_size:
+                if batch and stage.batch_timeout is not None:
+                    deadline = deadline or time.monotonic() + stage.batch_timeout
+                    try:
+                        item = await asyncio.wait_for(inbox.get(), deadline - time.monotonic())
+                    except TimeoutError:
+                        break
+                else:
+                    item = await inbox.get()
+                if item is EOS:
+                    inbox.put_nowait(EOS)  # 같은 단계의 다른 워커도 보도록 되돌려 놓음
+                    done = True
+                    break
+                batch.append(item)
+
+            if batch:
+                start = time.perf_counter()
+                try:
+                    if stage.batch_size == 1:
+                        results: Iterable[Any] = (await stage.func(batch[0]),)
+                    else:
+                        results = await stage.func(batch)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    fail(stage.name, e)
+                    return
+                stage.busy += time.perf_counter() - start
+                stage.processed += len(batch)
+                for r in results:
+                    await outbox.put(r)
+
+        alive[0] -= 1
+        if alive[0] == 0:  # 이 단계의 마지막 워커가 다음 단계로 종료 전파
+            await outbox.put(EOS)
+
+
+# =============================================================================
+# 2️⃣ 데모
+# =============================================================================
+
+async def pipeline_demo() -> None:
+    """fetch_data → 파싱 → 배치 저장."""
+    print("\n📌 fetch → parse → store(batch=2) 파이프라인")
+    print("-" * 50)
+
+    async def fetch(name: str) -> str:
+        return await fetch_data(name, 0.2)
+
+    async def parse(raw: str) -> dict[str, Any]:
+        return {"name": raw.split()[0], "size": len(raw)}
+
+    async def store(batch: list[dict[str, Any]]) -> list[str]:
+        await asyncio.sleep(0.05)
+        print(f"  store: {len(batch)}개 한 번에 저장")
+        return [row["name"] for row in batch]
+
+    pipeline = Pipeline(
+        Stage("fetch", fetch, concurrency=3),
+        Stage("parse", parse),
+        Stage("store", store, batch_size=2, batch_timeout=0.1),
+    )
+    start = time.perf_counter()
+    stored = await pipeline.run([f"Task{i}" for i in range(1, 6)])
+    print(f"  저장 완료: {stored} ({time.perf_counter() - start:.2f}초)")
+    for s in pipeline.stages:
+        print(f"    {s.name:<6} 처리 {s.processed}개, 작업 시간 {s.busy:.2f}초")
+
+    print("\n📌 단계 실패 → 전체 취소 + 예외 전달")
+    print("-" * 50)
+
+    async def boom(x: int) -> int:
+        if x == 3:
+            raise ValueError(f"항목 {x} 파싱 실패")
+        return x
+
+    try:
+        await Pipeline(Stage("parse", boom, concurrency=2)).run(range(10))
+    except ValueError as e:
+        print(f"  ⚠️ {e}")
+
+
+async def measure_pipeline(
+    concurrency: int, queue_size: int, items: int, io_delay: float, store_delay: float,
+) -> tuple[float, list[float]]:
+    """(처리량 items/s, 항목별 end-to-end 지연 정렬 리스트)."""
+
+    async def fetch(item: tuple[float, int]) -> tuple[float, int]:
+        await asyncio.sleep(io_delay)
+        return item
+
+    async def store(batch: list[tuple[float, int]]) -> list[float]:
+        await asyncio.sleep(store_delay)
+        now = time.perf_counter()
+        return [now - t0 for t0, _ in batch]
+
+    pipeline = Pipeline(
+        Stage("fetch", fetch, concurrency=concurrency, queue_size=queue_size),
+        Stage("store", store, queue_size=queue_size, batch_size=20, batch_timeout=0.01),
+    )
+
+    async def source() -> AsyncIterator[tuple[float, int]]:
+        for i in range(items):
+            yield time.perf_counter(), i  # 생성 시각부터 측정 → 큐 대기 시간 포함
+
+    start = time.perf_counter()
+    latencies = await pipeline.run(source())
+    elapsed = time.perf_counter() - start
+    return items / elapsed, sorted(latencies)
+
+
+async def throughput_benchmark(
+    concurrencies: Iterable[int] = (1, 4, 16),
+    queue_sizes: Iterable[int] = (1, 100),
+    items: int = 300,
+) -> None:
+    """단계 동시 실행 수 × 큐 크기 → 처리량과 지연."""
+    print(f"\n📌 처리량/지연 스윕 (항목 {items}개, fetch 2ms, store 배치 20개당 5ms)")
+    print("-" * 50)
+    print(f"  {'fetch 워커':>9}  {'큐 크기':>6}  {'items/s':>8}  {'p50':>8}  {'p99':>8}")
+    for c in concurrencies:
+        for q in queue_sizes:
+            throughput, lat = await measure_pipeline(c, q, items, 0.002, 0.005)
+            print(f"  {c:>9}  {q:>6}  {throughput:>8,.0f}"
+                  f"  {percentile(lat, 50) * 1e3:>6.1f}ms  {percentile(lat, 99) * 1e3:>6.1f}ms")
+    print("\n  💡 처리량은 워커 수가, 지연은 큐 크기가 좌우 (큰 큐 = 긴 대기열)")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🏭 asyncio 파이프라인")
+    print("=" * 60)
+
+    async def run_all() -> None:
+        await pipeline_demo()
+        await throughput_benchmark()
+
+    asyncio.run(run_all())
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   파이프라인 정리                              ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  단계 = async 함수, 연결 = asyncio.Queue(maxsize)             ║
+    ║                                                               ║
+    ║  ✅ 느린 단계만 concurrency 증가                              ║
+    ║  ✅ 쓰기 단계는 batch_size + batch_timeout으로 묶음 처리      ║
+    ║  ✅ 종료 신호는 단계의 마지막 워커가 다음 단계로 전파         ║
+    ║  ✅ 큐는 작게: 처리량은 그대로, 대기 지연만 줄어듦            ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        asyncio.run(throughput_benchmark((1, 2, 4, 8, 16, 32), (1, 10, 100, 1000), items=1000))
+    else:
+        main()
@@ -0,0 +1,295 @@
+"""
+11_single_flight.py - 동일한 동시 요청 합치기 (single-flight)
+
+📌 핵심 개념:
+    캐시가 만료된 순간 같은 키로 요청 1000개가 동시에 들어오면
+    1000개가 모두 백엔드로 갑니다 (thundering herd / cache stampede).
+
+    SingleFlight는 "같은 키로 이미 진행 중인 호출"이 있으면 새로 호출하지 않고
+    그 결과를 함께 기다립니다.
+        - 첫 호출자(leader)만 실제로 실행, 나머지는 같은 Task를 await
+        - 예외: 기다리던 모두에게 같은 예외 전달, 캐시하지 않음 (다음 호출은 재시도)
+        - 취소: 기다리던 하나가 취소돼도 공유 작업은 계속 (asyncio.shield)
+                기다리는 쪽이 모두 취소되면 공유 작업도 취소
+        - ttl: 성공 결과를 ttl초 동안 캐시 (선택)
+
+🔄 다른 언어 비교:
+    - Go: golang.org/x/sync/singleflight (이름의 원조)
+    - Java: Caffeine AsyncLoadingCache (같은 키 로딩 합치기)
+    - Python: dict[key, Task] + asyncio.shield (이 예제)
+
+⚠️ 주의사항:
+    - 인자는 해시 가능해야 합니다 (키로 사용)
+    - Task는 이벤트 루프에 묶이므로 하나의 SingleFlight는 하나의 루프에서만 쓰세요
+    - ttl 캐시는 만료 항목을 조회 시에만 지웁니다 (크기 제한이 필요하면 별도 캐시)
+
+📚 참고: https://pkg.go.dev/golang.org/x/sync/singleflight
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.discovery import load_example  # noqa: E402
+
+fetch_data = load_example(Path(__file__).with_name("04_asyncio_basics.py")).fetch_data
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# 1️⃣ SingleFlight
+# =============================================================================
+
+@dataclass
+class _Call:
+    """진행 중인 호출 하나."""
+    task: asyncio.Task[Any]
+    waiters: int = 0
+
+
+_KWARGS_MARK = object()
+
+
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    """위치/키워드 인자로 해시 가능한 키 생성."""
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+class SingleFlight:
+    """
+    키별로 진행 중인 호출을 하나로 합치는 그룹.
+
+    사용 예:
+        group = SingleFlight(ttl=1.0)
+        user = await group.do(("user", 1), lambda: load_user(1))
+    """
+
+    def __init__(self, ttl: float | None = None) -> None:
+        self.ttl = ttl
+        self._inflight: dict[Hashable, _Call] = {}
+        self._cache: dict[Hashable, tuple[float, Any]] = {}
+        self.calls = 0        # do() 호출 수
+        self.executions = 0   # 실제 실행 수 (백엔드 호출)
+        self.shared = 0       # 진행 중인 호출에 합류한 수
+        self.cache_hits = 0   # ttl 캐시 적중 수
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """key로 진행 중인 호출이 있으면 합류, 없으면 factory()를 실행."""
+        self.calls += 1
+        if self.ttl is not None and key in self._cache:
+            expires, value = self._cache[key]
+            if expires > time.monotonic():
+                self.cache_hits += 1
+                return value
+            del self._cache[key]
+
+        call = self._inflight.get(key)
+        if call is None:
+            self.executions += 1
+            task = asyncio.ensure_future(factory())
+            call = self._inflight[key] = _Call(task)
+            task.add_done_callback(functools.partial(self._finish, key))
+        else:
+            self.shared += 1
+
+        call.waiters += 1
+        try:
+            # shield: 이 호출자가 취소돼도 공유 Task는 취소되지 않음
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()  # 기다리는 쪽이 모두 떠남 → 공유 작업도 중단
+                # done 콜백(_finish)은 다음 루프 턴에 돌므로 지금 빼야
+                # 그 사이 들어온 호출자가 취소된 Task에 합류하지 않음
+                # (이미 새 호출이 같은 키를 차지했다면 그건 건드리지 않음)
+                if self._inflight.get(key) is call:
+                    del self._inflight[key]
+
+    def _finish(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        call = self._inflight.get(key)
+        if call is not None and call.task is task:
+            del self._inflight[key]
+        if task.cancelled():
+            return
+        error = task.exception()  # 예외 "never retrieved" 경고 방지
+        if error is None and self.ttl is not None:
+            self._cache[key] = (time.monotonic() + self.ttl, task.result())
+
+    def forget(self, key: Hashable) -> None:
+        """캐시된 결과 삭제 (진행 중인 호출은 그대로)."""
+        self._cache.pop(key, None)
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
+
+
+def single_flight(
+    func: Callable[..., Awaitable[T]] | None = None, *, ttl: float | None = None,
+) -> Any:
+    """
+    async 함수에 single-flight 적용 (인자가 같으면 합침).
+
+    사용 예:
+        @single_flight(ttl=0.5)
+        async def load_user(user_id: int) -> dict: ...
+
+        load_user.group.executions   # 실제 실행 수
+    """
+    def decorator(f: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        group = SingleFlight(ttl=ttl)
+
+        @functools.wraps(f)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            return await group.do(make_key(args, kwargs), lambda: f(*args, **kwargs))
+
+        wrapper.group = group  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+# =============================================================================
+# 2️⃣ 데모
+# =============================================================================
+
+async def coalescing_demo() -> None:
+    """같은 fetch_data 호출 100개 → 실제 실행 1번."""
+    print("\n📌 동시에 같은 요청 100개")
+    print("-" * 50)
+
+    shared_fetch = single_flight(fetch_data)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(shared_fetch("user:1", 0.2) for _ in range(100)))
+    group = shared_fetch.group
+    print(f"  결과 {len(results)}개, 모두 같은 값? {len(set(results)) == 1}")
+    print(f"  호출 {group.calls}번 → 실제 실행 {group.executions}번"
+          f" ({time.perf_counter() - start:.2f}초)")
+
+
+async def exception_demo() -> None:
+    """exception_handling_demo와 같은 gather(return_exceptions=True) 의미."""
+    print("\n📌 예외: 함께 기다린 모두에게 전달, 캐시는 안 함")
+    print("-" * 50)
+
+    attempts = 0
+
+    @single_flight(ttl=10)
+    async def may_fail(key: str) -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.1)
+        if attempts == 1:
+            raise ValueError("의도적 실패")
+        return "성공"
+
+    results = await asyncio.gather(*(may_fail("k") for _ in range(3)), return_exceptions=True)
+    for i, r in enumerate(results):
+        print(f"  Task {i}: {'예외 - ' + str(r) if isinstance(r, Exception) else r}")
+    print(f"  재호출: {await may_fail('k')} (실패는 캐시 안 됨 → 다시 실행)")
+    print(f"  또 호출: {await may_fail('k')} (ttl 캐시 적중, 실행 {attempts}번)")
+
+
+async def cancellation_demo() -> None:
+    """취소: 일부만 취소 → 공유 작업 유지, 전부 취소 → 공유 작업 취소."""
+    print("\n📌 취소 처리")
+    print("-" * 50)
+
+    state = {"started": 0, "cancelled": 0}
+
+    @single_flight
+    async def slow(key: str) -> str:
+        state["started"] += 1
+        try:
+            await asyncio.sleep(0.2)
+        except asyncio.CancelledError:
+            state["cancelled"] += 1
+            raise
+        return f"{key} 완료"
+
+    a = asyncio.create_task(slow("x"))
+    b = asyncio.create_task(slow("x"))
+    await asyncio.sleep(0.05)
+    a.cancel()
+    print(f"  하나 취소 후 나머지: {await b!r} (공유 작업 취소 {state['cancelled']}번)")
+
+    c = asyncio.create_task(slow("y"))
+    d = asyncio.create_task(slow("y"))
+    await asyncio.sleep(0.05)
+    c.cancel()
+    d.cancel()
+    await asyncio.gather(c, d, return_exceptions=True)
+    await asyncio.sleep(0)
+    print(f"  모두 취소: 공유 작업도 취소됨 (취소 {state['cancelled']}번, 진행 중 {slow.group.inflight}개)")
+
+
+async def herd_benchmark(requests: int = 10_000, keys: int = 20, waves: int = 5) -> None:
+    """thundering herd: 키 20개에 요청이 몰릴 때 백엔드 호출 수."""
+    print(f"\n📌 thundering herd: 요청 {requests:,}개, 키 {keys}개, {waves}번 몰림")
+    print("-" * 50)
+
+    backend_calls = 0
+
+    async def backend(key: int) -> int:
+        nonlocal backend_calls
+        backend_calls += 1
+        await asyncio.sleep(0.01)
+        return key
+
+    per_wave = requests // waves
+    for label, func in (
+        ("합치지 않음", backend),
+        ("single-flight", single_flight(backend)),
+        ("single-flight+ttl", single_flight(backend, ttl=60)),
+    ):
+        backend_calls = 0
+        start = time.perf_counter()
+        for _ in range(waves):
+            await asyncio.gather(*(func(i % keys) for i in range(per_wave)))
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<18} 백엔드 호출 {backend_calls:>6,}번  {elapsed:5.2f}s")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🛬 single-flight: 동일 요청 합치기")
+    print("=" * 60)
+
+    async def run_all() -> None:
+        await coalescing_demo()
+        await exception_demo()
+        await cancellation_demo()
+        await herd_benchmark()
+
+    asyncio.run(run_all())
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   single-flight 정리                           ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  같은 키 동시 요청 → 실행 1번, 결과 공유                      ║
+    ║                                                               ║
+    ║  ✅ 예외는 모두에게 전달, 캐시하지 않음                       ║
+    ║  ✅ 일부 취소 → shield로 공유 작업 보호                        ║
+    ║  ✅ 모두 취소 → 공유 작업도 취소                              ║
+    ║  ✅ ttl로 완료 직후 몰리는 요청도 흡수                        ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+12_shared_cache.py - 프로세스 풀 워커들이 함께 쓰는 공유 메모리 캐시
+
+📌 핵심 개념:
+    01_gil_explained.py의 multiprocess_cpu_demo처럼 ProcessPoolExecutor를 쓰면
+    워커마다 메모리가 따로입니다. 워커 안의 lru_cache는 워커 수만큼 복제되고,
+    워커 A가 계산한 결과를 워커 B는 모릅니다 → 같은 키를 워커 수만큼 재계산.
+
+    SharedCache는 multiprocessing.shared_memory 위의 고정 크기 해시 테이블입니다.
+    Manager(별도 서버 프로세스 + 프록시) 없이 워커가 메모리를 직접 읽고 씁니다.
+        - 구조: 버킷 × WAYS(8)개 슬롯 (set-associative), 버킷이 차면 임의 슬롯 교체
+        - 키: blake2b(repr(key)) 16바이트 → 버킷 선택 + 슬롯 식별
+        - 쓰기: 버킷별 락 (락 여러 개를 버킷에 나눠 씀 = lock striping)
+        - 읽기: 락 없음. 슬롯의 seq(짝수=완료, 홀수=쓰는 중)를 앞뒤로 읽어
+                값이 바뀌는 도중이면 미스로 처리 (seqlock)
+
+🔄 다른 언어 비교:
+    - Java: Chronicle Map, Hazelcast near-cache (off-heap 공유 맵)
+    - Go: 보통 goroutine이 메모리를 공유하므로 sync.Map 하나면 충분
+    - Python: Manager().dict() (느림, 프록시 왕복) 대신 shared_memory 직접 구현
+
+⚠️ 주의사항:
+    - 값은 bytes, 최대 value_size 바이트 (넘으면 캐시하지 않음)
+    - 용량이 고정이라 가득 차면 교체됨 (캐시이지 저장소가 아님)
+    - seqlock 읽기는 x86처럼 쓰기 순서가 유지되는 CPU를 가정한 단순화입니다
+
+실행:
+    python 12_shared_cache.py           # 데모 (워커 1/2/4)
+    python 12_shared_cache.py --bench   # 워커 1/2/4/8
+
+📚 참고: https://docs.python.org/3/library/multiprocessing.shared_memory.html
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import random
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Any, Hashable, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.core import REPO_ROOT  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+default_context = load_example(Path(__file__).with_name("05_concurrent_futures.py")).default_context
+zipf_keys = load_example(REPO_ROOT / "10-performance" / "05_memoize_cache.py").zipf_keys
+
+
+# =============================================================================
+# 1️⃣ SharedCache
+# =============================================================================
+
+HEADER = struct.Struct("<II16s")  # seq, 값 길이, 키 digest
+WAYS = 8
+
+
+def key_digest(key: Hashable) -> bytes:
+    """프로세스가 달라도 같은 16바이트 (hash()는 프로세스마다 다름)."""
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).digest()
+
+
+class SharedCache:
+    """
+    shared_memory 위의 set-associative 해시 테이블.
+
+    사용 예 (부모):
+        cache = SharedCache.create(buckets=512, value_size=64, ctx=ctx)
+        pool = ProcessPoolExecutor(mp_context=ctx, initializer=attach_worker, initargs=(cache.spec(),))
+        ...
+        cache.close(); cache.unlink()
+
+    워커:
+        value = _worker_cache.get(key)      # 없으면 None
+        _worker_cache.put(key, value)
+    """
+
+    def __init__(self, shm: SharedMemory, buckets: int, value_size: int, locks: Sequence[Any]) -> None:
+        self._shm = shm
+        self.buckets = buckets
+        self.value_size = value_size
+        self.slot_size = HEADER.size + value_size
+        self._locks = locks
+        self._rng = random.Random(os.getpid())
+        self.hits = self.misses = 0
+
+    @classmethod
+    def create(cls, buckets: int = 512, value_size: int = 64, *, stripes: int = 16,
+               ctx: Any = None) -> SharedCache:
+        """새 테이블 생성 (0으로 초기화 = 모든 슬롯 비어 있음)."""
+        ctx = ctx or default_context()
+        slot_size = HEADER.size + value_size
+        shm = SharedMemory(create=True, size=buckets * WAYS * slot_size)
+        shm.buf[:] = bytes(len(shm.buf))
+        locks = [ctx.Lock() for _ in range(stripes)]
+        return cls(shm, buckets, value_size, locks)
+
+    def spec(self) -> tuple[str, int, int, list[Any]]:
+        """워커 initializer로 넘길 정보 (락은 프로세스 생성 시에만 전달 가능)."""
+        return self._shm.name, self.buckets, self.value_size, list(self._locks)
+
+    @classmethod
+    def attach(cls, spec: tuple[str, int, int, list[Any]]) -> SharedCache:
+        name, buckets, value_size, locks = spec
+        return cls(SharedMemory(name=name), buckets, value_size, locks)
+
+    def _bucket(self, digest: bytes) -> int:
+        return int.from_bytes(digest[:8], "little") % self.buckets
+
+    def get(self, key: Hashable) -> bytes | None:
+        """락 없이 읽기. 쓰는 중인 슬롯은 미스로 처리."""
+        digest = key_digest(key)
+        buf = self._shm.buf
+        base = self._bucket(digest) * WAYS * self.slot_size
+        for way in range(WAYS):
+            off = base + way * self.slot_size
+            seq, length, slot_key = HEADER.unpack_from(buf, off)
+            if seq == 0:
+                break  # 빈 슬롯 이후로는 없음 (슬롯은 앞에서부터 채워짐)
+            if slot_key != digest:
+                continue
+            if seq & 1:
+                break  # 쓰는 중
+            start = off + HEADER.size
+            value = bytes(buf[start:start + length])
+            if HEADER.unpack_from(buf, off)[0] != seq:
+                break  # 읽는 사이 바뀜
+            self.hits += 1
+            return value
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: bytes) -> bool:
+        """저장 (버킷 락 안에서). 값이 value_size보다 크면 저장하지 않고 False."""
+        if len(value) > self.value_size:
+            return False
+        digest = key_digest(key)
+        bucket = self._bucket(digest)
+        buf = self._shm.buf
+        base = bucket * WAYS * self.slot_size
+        with self._locks[bucket % len(self._locks)]:
+            target = None
+            for way in range(WAYS):
+                off = base + way * self.slot_size
+                seq, _, slot_key = HEADER.unpack_from(buf, off)
+                if seq == 0 or slot_key == digest:
+                    target = off
+                    break
+            if target is None:  # 버킷이 가득 참 → 임의 슬롯 교체
+                target = base + self._rng.randrange(WAYS) * self.slot_size
+            seq = HEADER.unpack_from(buf, target)[0]
+            HEADER.pack_into(buf, target, seq + 1, 0, digest)  # 홀수: 쓰는 중
+            start = target + HEADER.size
+            buf[start:start + len(value)] = value
+            HEADER.pack_into(buf, target, seq + 2, len(value), digest)  # 짝수: 완료
+        return True
+
+    def close(self) -> None:
+        self._shm.close()
+
+    def unlink(self) -> None:
+        self._shm.unlink()
+
+
+# =============================================================================
+# 2️⃣ 워커 측: 공유 캐시 vs 워커별 lru_cache
+# =============================================================================
+
+COST = 1_000  # sha256 반복 횟수 (작업 1개 ≈ 0.5ms)
+
+
+def expensive(key: int) -> bytes:
+    """비싼 순수 함수 (결과 32바이트)."""
+    h = key.to_bytes(8, "little")
+    for _ in range(COST):
+        h = hashlib.sha256(h).digest()
+    return h
+
+
+_worker_cache: SharedCache | None = None
+
+
+def attach_worker(spec: tuple[str, int, int, list[Any]]) -> None:
+    """(워커 initializer) 공유 캐시 연결."""
+    global _worker_cache
+    _worker_cache = SharedCache.attach(spec)
+
+
+def shared_task(key: int) -> bool:
+    """공유 캐시 조회 → 없으면 계산 후 저장. 적중 여부 반환."""
+    assert _worker_cache is not None
+    if _worker_cache.get(key) is not None:
+        return True
+    _worker_cache.put(key, expensive(key))
+    return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_expensive(key: int) -> bytes:
+    return expensive(key)
+
+
+def local_task(key: int) -> bool:
+    """워커 자기 lru_cache만 사용. 적중 여부 반환."""
+    hits = _local_expensive.cache_info().hits
+    _local_expensive(key)
+    return _local_expensive.cache_info().hits > hits
+
+
+def worker_pid(_: object = None) -> int:
+    return os.getpid()
+
+
+# =============================================================================
+# 3️⃣ 벤치마크
+# =============================================================================
+
+TASKS = 4_000
+KEY_SPACE = 1_000
+KEYS = zipf_keys(TASKS, KEY_SPACE, seed=2)
+
+
+def run_workload(mode: str, workers: int, keys: list[int] = KEYS) -> tuple[float, float]:
+    """(처리량 tasks/s, 적중률). 풀 기동 시간은 제외."""
+    ctx = default_context()
+    cache = SharedCache.create(buckets=512, value_size=32, ctx=ctx) if mode == "shared" else None
+    kwargs: dict[str, Any] = {"max_workers": workers, "mp_context": ctx}
+    if cache is not None:
+        kwargs.update(initializer=attach_worker, initargs=(cache.spec(),))
+    try:
+        with ProcessPoolExecutor(**kwargs) as pool:
+            list(pool.map(worker_pid, range(workers * 4)))  # 워커 기동 + import 완료 대기
+            task = shared_task if mode == "shared" else local_task
+            start = time.perf_counter()
+            hits = sum(pool.map(task, keys, chunksize=16))
+            elapsed = time.perf_counter() - start
+    finally:
+        if cache is not None:
+            cache.close()
+            cache.unlink()
+    return len(keys) / elapsed, hits / len(keys)
+
+
+def correctness_demo() -> None:
+    """워커가 쓴 값을 부모가 그대로 읽을 수 있는지."""
+    print("\n📌 워커가 계산한 결과를 다른 프로세스에서 읽기")
+    print("-" * 50)
+    ctx = default_context()
+    cache = SharedCache.create(buckets=64, value_size=32, ctx=ctx)
+    try:
+        with ProcessPoolExecutor(2, mp_context=ctx, initializer=attach_worker,
+                                 initargs=(cache.spec(),)) as pool:
+            first = list(pool.map(shared_task, range(20)))
+            second = list(pool.map(shared_task, range(20)))
+        ok = all(cache.get(k) == expensive(k) for k in range(20))
+        print(f"  1차 적중 {sum(first)}/20, 2차 적중 {sum(second)}/20 (다른 워커가 쓴 값 포함)")
+        print(f"  부모에서 읽은 값 == 직접 계산: {ok}")
+    finally:
+        cache.close()
+        cache.unlink()
+
+
+def scaling_benchmark(worker_counts: Sequence[int] = (1, 2, 4)) -> None:
+    """워커 수별 적중률/처리량: 워커별 lru_cache vs 공유 캐시."""
+    print(f"\n📌 작업 {TASKS:,}개 (Zipf, 키 {KEY_SPACE:,}개, 작업당 sha256 {COST:,}회, CPU {os.cpu_count()}코어)")
+    print("-" * 50)
+    print(f"  {'workers':>7}  {'방식':<10} {'적중률':>7} {'tasks/s':>9}")
+    for workers in worker_counts:
+        for mode in ("local", "shared"):
+            throughput, hit_rate = run_workload(mode, workers)
+            print(f"  {workers:>7}  {mode:<10} {hit_rate:>6.1%} {throughput:>9,.0f}")
+    print("\n  💡 워커별 캐시는 워커가 늘수록 같은 키를 여러 번 계산 (적중률 하락)")
+    print("     공유 캐시는 워커 수와 무관하게 키마다 거의 한 번만 계산")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🤝 프로세스 간 공유 캐시 (shared_memory)")
+    print("=" * 60)
+
+    correctness_demo()
+    scaling_benchmark()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   공유 캐시 정리                               ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ 워커마다 lru_cache → 워커 수만큼 복제 + 재계산            ║
+    ║  ❌ Manager().dict() → 접근마다 서버 프로세스 왕복            ║
+    ║                                                               ║
+    ║  ✅ shared_memory 해시 테이블                                 ║
+    ║     - 읽기: 락 없음 (seqlock으로 찢어진 값 감지)              ║
+    ║     - 쓰기: 버킷별 락 (lock striping)                         ║
+    ║     - initializer로 워커마다 한 번 연결                       ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        scaling_benchmark((1, 2, 4, 8))
+    else:
+        main()
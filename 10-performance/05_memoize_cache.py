@@ -0,0 +1,452 @@
+"""
+05_memoize_cache.py - 크기 제한 + TTL + 스레드 안전 메모이제이션
+
+📌 핵심 개념:
+    01-pythonic-basics/03_functions_as_objects.py의 memoize 클로저는
+    dict에 결과를 영원히 쌓습니다 (메모리 무제한, 스레드 안전 X).
+    실무용 캐시에는 다음이 필요합니다.
+        - maxsize: 가득 차면 퇴출 (LRU: 가장 오래 안 쓴 것, LFU: 가장 적게 쓴 것)
+        - ttl: 항목별 만료 시간
+        - 스레드 안전: 락 (shards>1이면 키 해시로 락을 나눔 = lock striping)
+        - 통계: hits / misses / evictions / expirations
+        - functools.lru_cache와 같은 cache_info() / cache_clear() API
+
+🔄 다른 언어 비교:
+    - Java: Caffeine (W-TinyLFU, expireAfterWrite), Guava CacheBuilder
+    - Go: hashicorp/golang-lru, ristretto
+    - Python: functools.lru_cache (TTL 없음, C 구현), cachetools, 이 예제
+
+⚠️ 주의사항:
+    - 순수 Python 구현은 C로 된 lru_cache보다 느립니다.
+      TTL/LFU/통계가 필요 없으면 lru_cache를 쓰세요.
+    - 계산은 락 밖에서 합니다. 같은 키로 동시에 미스가 나면 중복 계산될 수 있습니다
+      (async 코드는 04-concurrency/11_single_flight.py 참고).
+    - GIL 빌드에서는 lock striping 효과가 작습니다 (free-threaded 빌드에서 의미 있음).
+
+📚 참고: https://docs.python.org/3/library/functools.html#functools.lru_cache
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+
+
+# =============================================================================
+# 1️⃣ 퇴출 정책별 저장소 (락 없음, 샤드 하나)
+# =============================================================================
+
+class CacheInfo(NamedTuple):
+    """functools.lru_cache의 CacheInfo + 퇴출/만료 수."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_MISSING = object()
+
+
+class LRUStore:
+    """OrderedDict 기반 LRU: 적중 시 맨 뒤로, 퇴출은 맨 앞에서."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> tuple[Any, bool]:
+        """(값, 만료 여부). 없으면 (_MISSING, False)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING, False
+        value, expires = entry
+        if expires and expires <= now:
+            del self._data[key]
+            return _MISSING, True
+        self._data.move_to_end(key)
+        return value, False
+
+    def put(self, key: Hashable, value: Any, expires: float) -> bool:
+        """저장. 퇴출이 일어났으면 True."""
+        if key in self._data:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            return False
+        self._data[key] = (value, expires)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            return True
+        return False
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class LFUStore:
+    """
+    O(1) LFU: 사용 횟수별 버킷(OrderedDict)을 두고
+    가장 낮은 횟수 버킷에서 가장 오래된 항목을 퇴출.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: dict[Hashable, list[Any]] = {}  # key → [값, 만료, 횟수]
+        self._buckets: dict[int, OrderedDict[Hashable, None]] = {}
+        self._min_freq = 0
+
+    def _unlink(self, key: Hashable, freq: int) -> None:
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+
+    def get(self, key: Hashable, now: float) -> tuple[Any, bool]:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING, False
+        value, expires, freq = entry
+        if expires and expires <= now:
+            del self._data[key]
+            self._unlink(key, freq)
+            return _MISSING, True
+        self._unlink(key, freq)
+        entry[2] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+        return value, False
+
+    def put(self, key: Hashable, value: Any, expires: float) -> bool:
+        entry = self._data.get(key)
+        if entry is not None:
+            entry[0], entry[1] = value, expires
+            return False
+        evicted = False
+        if len(self._data) >= self.maxsize:
+            if self._min_freq not in self._buckets:  # 만료 삭제로 min_freq가 낡은 경우
+                self._min_freq = min(self._buckets)
+            victim, _ = self._buckets[self._min_freq].popitem(last=False)
+            if not self._buckets[self._min_freq]:
+                del self._buckets[self._min_freq]
+            del self._data[victim]
+            evicted = True
+        self._data[key] = [value, expires, 1]
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+        return evicted
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+POLICIES: dict[str, Callable[[int], LRUStore | LFUStore]] = {"lru": LRUStore, "lfu": LFUStore}
+
+
+# =============================================================================
+# 2️⃣ BoundedCache: 샤드 + 락 + 통계
+# =============================================================================
+
+class _Shard:
+    __slots__ = ("lock", "store", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self, store: LRUStore | LFUStore) -> None:
+        self.lock = threading.Lock()
+        self.store = store
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+class BoundedCache:
+    """
+    크기 제한 + TTL + 스레드 안전 캐시.
+
+    shards>1이면 키 해시로 샤드를 고르고 샤드마다 락이 따로 있습니다
+    (서로 다른 키를 쓰는 스레드끼리 락 경합이 줄어듦).
+    maxsize는 샤드에 나눠 주되 합이 정확히 maxsize가 되도록 나머지를 앞 샤드에 1개씩 더 줍니다
+    (shards가 maxsize보다 많으면 샤드 수를 maxsize로 줄임).
+    """
+
+    def __init__(self, maxsize: int = 128, *, ttl: float | None = None,
+                 policy: str = "lru", shards: int = 1) -> None:
+        if maxsize < 1 or shards < 1:
+            raise ValueError("maxsize, shards는 1 이상이어야 합니다")
+        if policy not in POLICIES:
+            raise ValueError(f"지원하지 않는 정책: {policy} (가능: {', '.join(POLICIES)})")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.policy = policy
+        shards = min(shards, maxsize)  # 용량 0인 샤드가 생기지 않게
+        base, extra = divmod(maxsize, shards)
+        self._shards = [_Shard(POLICIES[policy](base + (i < extra))) for i in range(shards)]
+
+    def _shard(self, key: Hashable) -> _Shard:
+        shards = self._shards
+        return shards[0] if len(shards) == 1 else shards[hash(key) % len(shards)]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        shard = self._shard(key)
+        now = time.monotonic() if self.ttl is not None else 0.0
+        with shard.lock:
+            value, expired = shard.store.get(key, now)
+            if value is _MISSING:
+                shard.misses += 1
+                shard.expirations += expired
+                return default
+            shard.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        shard = self._shard(key)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with shard.lock:
+            shard.evictions += shard.store.put(key, value, expires)
+
+    def info(self) -> CacheInfo:
+        totals = [0, 0, 0, 0, 0]
+        for s in self._shards:
+            with s.lock:
+                for i, v in enumerate((s.hits, s.misses, len(s.store), s.evictions, s.expirations)):
+                    totals[i] += v
+        hits, misses, currsize, evictions, expirations = totals
+        return CacheInfo(hits, misses, self.maxsize, currsize, evictions, expirations)
+
+    def clear(self) -> None:
+        for s in self._shards:
+            with s.lock:
+                s.store.clear()
+                s.hits = s.misses = s.evictions = s.expirations = 0
+
+    def __len__(self) -> int:
+        return sum(len(s.store) for s in self._shards)
+
+
+# =============================================================================
+# 3️⃣ memoize 데코레이터
+# =============================================================================
+
+_KWARGS_MARK = object()
+_FAST_TYPES = (int, str)
+
+
+def make_key(args: tuple[Any, ...], kwargs: dict[str, Any], typed: bool = False) -> Hashable:
+    """functools.lru_cache와 같은 규칙의 캐시 키 (인자 하나가 int/str이면 그대로)."""
+    key: tuple[Any, ...] = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(kwargs.items())
+    if typed:
+        key += tuple(type(v) for v in args) + tuple(type(v) for v in kwargs.values())
+    elif len(key) == 1 and type(key[0]) in _FAST_TYPES:
+        return key[0]
+    return key
+
+
+def memoize(
+    func: Callable[..., Any] | None = None,
+    *,
+    maxsize: int = 128,
+    ttl: float | None = None,
+    policy: str = "lru",
+    shards: int = 1,
+    typed: bool = False,
+) -> Any:
+    """
+    크기 제한 메모이제이션 데코레이터.
+
+    사용 예:
+        @memoize(maxsize=1024, ttl=60, policy="lfu", shards=8)
+        def load_config(name: str) -> dict: ...
+
+        load_config.cache_info()    # CacheInfo(hits=..., misses=..., ...)
+        load_config.cache_clear()
+    """
+    def decorator(f: Callable[..., Any]) -> Callable[..., Any]:
+        cache = BoundedCache(maxsize, ttl=ttl, policy=policy, shards=shards)
+
+        @functools.wraps(f)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs, typed)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = f(*args, **kwargs)  # 락 밖에서 계산
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        wrapper.cache_info = cache.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+# =============================================================================
+# 4️⃣ 벤치마크: functools.lru_cache vs memoize
+# =============================================================================
+
+KEY_SPACE = 10_000
+MAXSIZE = 500
+CALLS = 20_000
+
+
+def zipf_keys(n: int = CALLS, key_space: int = KEY_SPACE, s: float = 1.0, seed: int = 0) -> list[int]:
+    """Zipf 분포 키 순서: k번째로 인기 있는 키의 접근 확률 ∝ 1/k^s."""
+    rng = random.Random(seed)
+    keys = list(range(key_space))
+    rng.shuffle(keys)  # 인기 순위와 키 값을 무관하게
+    weights = [1 / (rank + 1) ** s for rank in range(key_space)]
+    return rng.choices(keys, weights=weights, k=n)
+
+
+KEYS = zipf_keys()
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+CACHED: dict[str, Callable[[int], int]] = {
+    "lru_cache": functools.lru_cache(maxsize=MAXSIZE)(square),
+    "lru": memoize(square, maxsize=MAXSIZE),
+    "lfu": memoize(square, maxsize=MAXSIZE, policy="lfu"),
+    "lru_ttl": memoize(square, maxsize=MAXSIZE, ttl=60),
+    "lru_shards8": memoize(square, maxsize=MAXSIZE, shards=8),
+}
+
+
+def _register_cache_benchmarks() -> None:
+    for name, cached in CACHED.items():
+        def bench(cached: Callable[[int], int] = cached) -> None:
+            for k in KEYS:
+                cached(k)
+
+        register(f"memoize.{name}", group="memoize", repeat=5)(bench)
+
+
+_register_cache_benchmarks()
+
+
+def threaded_calls(cached: Callable[[int], int], threads: int = 4) -> float:
+    """threads개 스레드가 동시에 KEYS를 호출하는 데 걸린 시간."""
+    def work() -> None:
+        for k in KEYS:
+            cached(k)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return time.perf_counter() - start
+
+
+# =============================================================================
+# 5️⃣ 데모
+# =============================================================================
+
+def memoize_demo() -> None:
+    """LRU/LFU 퇴출, TTL, cache_info."""
+    print("\n📌 memoize: maxsize + 정책 + TTL")
+    print("-" * 50)
+
+    sequence = ["a", "a", "a", "b", "c", "a"]
+    for policy in ("lru", "lfu"):
+        calls: list[str] = []
+
+        @memoize(maxsize=2, policy=policy)
+        def load(key: str) -> str:
+            calls.append(key)
+            return key.upper()
+
+        for k in sequence:
+            load(k)
+        print(f"  {policy.upper()} 호출 {sequence} → 계산 {calls}")
+        print(f"      {load.cache_info()}")
+    print("  💡 c가 들어올 때 LRU는 최근에 안 쓴 a를, LFU는 적게 쓴 b를 퇴출")
+
+    @memoize(ttl=0.05)
+    def now_ms(_: str) -> int:
+        return int(time.time() * 1000)
+
+    first = now_ms("x")
+    same = now_ms("x")
+    time.sleep(0.06)
+    print(f"\n  TTL 0.05초: 캐시 적중 {first == same}, 만료 후 재계산 {now_ms('x') != first}")
+    print(f"  {now_ms.cache_info()}")
+    now_ms.cache_clear()
+    print(f"  cache_clear() 후 {now_ms.cache_info()}")
+
+
+def benchmark_demo() -> None:
+    """lru_cache vs memoize (단일 스레드 + 멀티스레드)."""
+    print(f"\n📌 lru_cache vs memoize (호출 {CALLS:,}번, 키 {KEY_SPACE:,}개, maxsize {MAXSIZE})")
+    print("-" * 50)
+    for cached in CACHED.values():
+        cached.cache_clear()
+    results = run_group("memoize")
+    print(format_table(results))
+
+    print(f"\n  {'구현':<20} {'적중률':>7} {'호출당':>9} {'4스레드':>9}")
+    base = next(r for r in results if r.name == "memoize.lru_cache").median
+    for r in results:
+        name = r.name.removeprefix("memoize.")
+        cached = CACHED[name]
+        info = cached.cache_info()
+        hit_rate = info.hits / (info.hits + info.misses)  # lru_cache의 CacheInfo에는 hit_rate 없음
+        elapsed = threaded_calls(cached)
+        print(f"  {name:<20} {hit_rate:>6.1%} {r.median / CALLS * 1e9:>7.0f}ns"
+              f" {elapsed * 1e3:>7.1f}ms    lru_cache의 {r.median / base:.1f}배")
+    print("\n  💡 Zipf 접근에서는 LFU가 인기 키를 지켜서 적중률이 더 높음")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🗃️ 크기 제한 메모이제이션")
+    print("=" * 60)
+
+    memoize_demo()
+    benchmark_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   메모이제이션 정리                            ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ dict에 영원히 저장 → 메모리 무제한, 스레드 안전 X         ║
+    ║                                                               ║
+    ║  ✅ TTL/통계 필요 없음 → functools.lru_cache (가장 빠름)      ║
+    ║  ✅ TTL, LFU, 퇴출 통계 → memoize(maxsize, ttl, policy)       ║
+    ║  ✅ 여러 스레드 → shards로 락 분산                            ║
+    ║                                                               ║
+    ║  💡 cache_info()로 적중률을 보고 maxsize를 정하자              ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
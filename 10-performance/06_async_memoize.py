@@ -0,0 +1,219 @@
+"""
+06_async_memoize.py - 코루틴 함수용 메모이제이션
+
+📌 핵심 개념:
+    @lru_cache나 memoize 클로저를 async 함수에 붙이면
+    "결과"가 아니라 "코루틴 객체"가 캐시됩니다.
+    코루틴은 한 번만 await할 수 있으므로 두 번째 호출에서
+    RuntimeError: cannot reuse already awaited coroutine 이 납니다.
+
+    async_memoize는 await한 결과를 캐시합니다.
+        - 저장소: 05_memoize_cache.py의 BoundedCache (maxsize, ttl, LRU/LFU, 통계)
+        - 동시 미스: 04-concurrency/11_single_flight.py의 SingleFlight로 합침
+          (같은 키를 동시에 요청하면 계산 1번, 모두 같은 결과)
+        - 예외는 캐시하지 않음, 취소는 SingleFlight 규칙을 따름
+
+🔄 다른 언어 비교:
+    - Java: Caffeine AsyncLoadingCache (CompletableFuture 캐시)
+    - JavaScript: Promise를 Map에 저장 (p-memoize)
+    - Python: async_memoize (이 예제), 서드파티 aiocache / async-lru
+
+⚠️ 주의사항:
+    - 진행 중인 호출(Task)은 이벤트 루프에 묶입니다. 완료된 결과 캐시는 루프와 무관합니다.
+    - 인자는 해시 가능해야 합니다.
+
+📚 참고: https://docs.python.org/3/library/asyncio-task.html#asyncio.shield
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench.discovery import load_example  # noqa: E402
+
+_memo = load_example(Path(__file__).with_name("05_memoize_cache.py"))
+_flight = load_example(Path(__file__).resolve().parents[1] / "04-concurrency" / "11_single_flight.py")
+BoundedCache = _memo.BoundedCache
+make_key = _memo.make_key
+SingleFlight = _flight.SingleFlight
+fetch_data = _flight.fetch_data
+
+_MISSING = object()
+
+
+# =============================================================================
+# 1️⃣ async_memoize
+# =============================================================================
+
+def async_memoize(
+    func: Callable[..., Awaitable[Any]] | None = None,
+    *,
+    maxsize: int = 128,
+    ttl: float | None = None,
+    policy: str = "lru",
+    typed: bool = False,
+) -> Any:
+    """
+    async 함수의 await 결과를 캐시하는 데코레이터.
+
+    사용 예:
+        @async_memoize(maxsize=1024, ttl=30)
+        async def load_user(user_id: int) -> dict: ...
+
+        load_user.cache_info()   # hits / misses / evictions / expirations
+        load_user.coalesced()    # 동시 미스가 합쳐진 횟수
+        load_user.cache_clear()
+    """
+    def decorator(f: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        if not asyncio.iscoroutinefunction(f):
+            raise TypeError(f"{f.__name__}은(는) async 함수가 아닙니다 (동기 함수는 memoize 사용)")
+        cache = BoundedCache(maxsize, ttl=ttl, policy=policy)
+        inflight = SingleFlight()
+
+        @functools.wraps(f)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = make_key(args, kwargs, typed)
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            async def compute() -> Any:
+                result = await f(*args, **kwargs)
+                cache.put(key, result)  # 성공한 결과만 저장 (공유 Task 안에서 1번)
+                return result
+
+            return await inflight.do(key, compute)
+
+        def cache_clear() -> None:
+            cache.clear()
+            inflight.shared = 0
+
+        wrapper.cache_info = cache.info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        wrapper.coalesced = lambda: inflight.shared  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator(func) if func is not None else decorator
+
+
+# =============================================================================
+# 2️⃣ 데모
+# =============================================================================
+
+async def lru_cache_pitfall_demo() -> None:
+    """@lru_cache를 async 함수에 붙이면?"""
+    print("\n📌 @lru_cache + async 함수 = 코루틴 객체 캐시")
+    print("-" * 50)
+
+    @functools.lru_cache(maxsize=None)
+    async def wrong(x: int) -> int:
+        await asyncio.sleep(0)
+        return x * 2
+
+    print(f"  첫 호출: {await wrong(1)}")
+    try:
+        await wrong(1)  # 같은 (이미 await된) 코루틴 객체가 반환됨
+    except RuntimeError as e:
+        print(f"  두 번째 호출: ❌ RuntimeError: {e}")
+
+
+async def async_memoize_demo() -> None:
+    """fetch_data에 async_memoize 적용."""
+    print("\n📌 async_memoize(ttl=0.3)로 fetch_data 캐시")
+    print("-" * 50)
+
+    cached_fetch = async_memoize(fetch_data, maxsize=100, ttl=0.3)
+
+    print("  [동시 미스 3개 → 실행 1번]")
+    results = await asyncio.gather(*(cached_fetch("user:1", 0.1) for _ in range(3)))
+    print(f"  결과: {results}")
+
+    print("  [캐시 적중 → 출력 없음]")
+    print(f"  결과: {await cached_fetch('user:1', 0.1)}")
+
+    await asyncio.sleep(0.35)
+    print("  [ttl 만료 → 다시 실행]")
+    await cached_fetch("user:1", 0.1)
+    print(f"  {cached_fetch.cache_info()}, 합쳐진 동시 미스 {cached_fetch.coalesced()}개")
+
+    print("\n📌 예외는 캐시하지 않음")
+    print("-" * 50)
+    attempts = 0
+
+    @async_memoize
+    async def flaky(key: str) -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise ConnectionError("일시 장애")
+        return f"{key} 성공"
+
+    first = await asyncio.gather(flaky("k"), flaky("k"), return_exceptions=True)
+    print(f"  동시 호출 2개: {[type(r).__name__ if isinstance(r, Exception) else r for r in first]}")
+    print(f"  재호출: {await flaky('k')!r}, 그다음: {await flaky('k')!r} (실행 {attempts}번)")
+
+
+async def cache_benchmark(requests: int = 5_000, keys: int = 100, waves: int = 10) -> None:
+    """캐시 없음 vs async_memoize: 백엔드 호출 수와 시간."""
+    print(f"\n📌 요청 {requests:,}개 (키 {keys}개, {waves}번 몰림)")
+    print("-" * 50)
+
+    backend_calls = 0
+
+    async def backend(key: int) -> int:
+        nonlocal backend_calls
+        backend_calls += 1
+        await asyncio.sleep(0.005)
+        return key
+
+    per_wave = requests // waves
+    for label, func in (
+        ("캐시 없음", backend),
+        ("async_memoize", async_memoize(backend, maxsize=keys)),
+        ("async_memoize(maxsize 절반)", async_memoize(backend, maxsize=keys // 2)),
+    ):
+        backend_calls = 0
+        start = time.perf_counter()
+        for _ in range(waves):
+            await asyncio.gather(*(func(i % keys) for i in range(per_wave)))
+        elapsed = time.perf_counter() - start
+        print(f"  {label:<28} 백엔드 호출 {backend_calls:>6,}번  {elapsed:5.2f}s")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("⏳ async 메모이제이션")
+    print("=" * 60)
+
+    async def run_all() -> None:
+        await lru_cache_pitfall_demo()
+        await async_memoize_demo()
+        await cache_benchmark()
+
+    asyncio.run(run_all())
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   async 메모이제이션 정리                      ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  ❌ @lru_cache + async def → 코루틴 객체 캐시 (재await 불가)   ║
+    ║                                                               ║
+    ║  ✅ await한 결과를 캐시 (maxsize + ttl)                       ║
+    ║  ✅ 동시 미스는 하나의 Task로 합침 (single-flight)            ║
+    ║  ✅ 예외는 캐시하지 않음                                      ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
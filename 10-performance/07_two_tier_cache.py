@@ -0,0 +1,274 @@
+"""
+07_two_tier_cache.py - 강한 참조 LRU + 약한 참조 캐시 (2단계 객체 캐시)
+
+📌 핵심 개념:
+    02-python-gotchas/07_circular_reference.py의 weakref_patterns_demo()는
+    WeakValueDictionary로 객체를 캐시합니다. 마지막 사용자가 참조를 놓는 순간
+    항목이 사라지므로, 요청이 띄엄띄엄 오면 같은 객체를 계속 다시 만듭니다.
+
+    TwoTierCache는 두 단계로 나눕니다.
+        - 1단계 (strong): 작은 LRU가 강한 참조로 최근 객체를 붙잡아 둠
+        - 2단계 (weak):   WeakValueDictionary가 "아직 누군가 쓰는 중인" 객체를 찾아줌
+                          → LRU에서 밀려났어도 살아 있으면 같은 객체 재사용 (중복 생성 X)
+        - 둘 다 없으면 생성 → 두 단계에 모두 등록
+
+🔄 다른 언어 비교:
+    - Java: Caffeine maximumSize + weakValues/softValues
+    - Go: 표준 weak 포인터 (Go 1.24 weak 패키지) + LRU
+    - Python: OrderedDict LRU + weakref.WeakValueDictionary (이 예제)
+
+⚠️ 주의사항:
+    - 값은 weakref를 지원해야 합니다 (int, str, tuple은 불가,
+      __slots__ 클래스는 "__weakref__" 슬롯 필요)
+    - 생성은 락 안에서 합니다 → 같은 키 객체가 동시에 두 번 만들어지지 않음
+
+📚 참고: https://docs.python.org/3/library/weakref.html#weakref.WeakValueDictionary
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Hashable, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+zipf_keys = load_example(Path(__file__).with_name("05_memoize_cache.py")).zipf_keys
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+# =============================================================================
+# 1️⃣ TwoTierCache
+# =============================================================================
+
+@dataclass
+class TierStats:
+    """단계별 적중 수."""
+    strong_hits: int = 0
+    weak_hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.strong_hits + self.weak_hits + self.misses
+
+    def rate(self, count: int) -> float:
+        return count / self.lookups if self.lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"strong {self.rate(self.strong_hits):.1%}, weak {self.rate(self.weak_hits):.1%},"
+                f" 생성 {self.rate(self.misses):.1%} ({self.misses:,}번)")
+
+
+class TwoTierCache(Generic[K, V]):
+    """
+    강한 참조 LRU(strong_size개) + WeakValueDictionary.
+
+    사용 예:
+        cache = TwoTierCache(ExpensiveObject, strong_size=64)
+        obj = cache.get(42)        # 없으면 ExpensiveObject(42) 생성
+        cache.stats                # TierStats(strong_hits, weak_hits, misses)
+    """
+
+    def __init__(self, factory: Callable[[K], V], strong_size: int = 128) -> None:
+        if strong_size < 0:
+            raise ValueError("strong_size는 0 이상이어야 합니다")
+        self.factory = factory
+        self.strong_size = strong_size
+        self._strong: OrderedDict[K, V] = OrderedDict()
+        self._weak: weakref.WeakValueDictionary[K, V] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+        self.stats = TierStats()
+
+    def get(self, key: K) -> V:
+        with self._lock:
+            obj = self._strong.get(key)
+            if obj is not None:
+                self._strong.move_to_end(key)
+                self.stats.strong_hits += 1
+                return obj
+            obj = self._weak.get(key)
+            if obj is not None:
+                self.stats.weak_hits += 1
+            else:
+                obj = self.factory(key)
+                self._weak[key] = obj
+                self.stats.misses += 1
+            self._promote(key, obj)
+            return obj
+
+    def _promote(self, key: K, obj: V) -> None:
+        if self.strong_size == 0:
+            return
+        self._strong[key] = obj
+        if len(self._strong) > self.strong_size:
+            self._strong.popitem(last=False)  # weak 단계에는 남음 (다른 곳에서 쓰는 중이면)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strong.clear()
+            self._weak.clear()
+
+    def __len__(self) -> int:
+        """살아 있는 객체 수 (weak 단계 기준)."""
+        return len(self._weak)
+
+
+class StrongLRUCache(Generic[K, V]):
+    """비교용: 강한 참조 LRU만 (밀려난 객체가 아직 쓰이는 중이면 중복 생성)."""
+
+    def __init__(self, factory: Callable[[K], V], size: int = 128) -> None:
+        self.factory = factory
+        self.size = size
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self.stats = TierStats()
+
+    def get(self, key: K) -> V:
+        obj = self._data.get(key)
+        if obj is not None:
+            self._data.move_to_end(key)
+            self.stats.strong_hits += 1
+            return obj
+        obj = self._data[key] = self.factory(key)
+        self.stats.misses += 1
+        if len(self._data) > self.size:
+            self._data.popitem(last=False)
+        return obj
+
+
+# =============================================================================
+# 2️⃣ 벤치마크: Zipf 접근 + 짧게 붙잡는 호출자
+# =============================================================================
+
+class ExpensiveObject:
+    """생성 비용이 있는 객체 (weakref_patterns_demo의 ExpensiveObject를 출력 없이)."""
+    live: weakref.WeakValueDictionary[int, ExpensiveObject] = weakref.WeakValueDictionary()
+    duplicates = 0
+
+    def __init__(self, id: int) -> None:
+        self.id = id
+        self.payload = bytes(2048)
+        self.checksum = sum(range(300))  # 생성 비용 흉내
+        if id in ExpensiveObject.live:  # 같은 id 객체가 이미 살아 있음 → 중복
+            ExpensiveObject.duplicates += 1
+        ExpensiveObject.live[id] = self
+
+
+ACCESSES = 50_000
+KEY_SPACE = 5_000
+STRONG_SIZE = 128
+HELD = 64         # 동시에 처리 중인 요청 수 (최근 객체 64개를 호출자가 잠깐 붙잡음)
+LONG_HELD = 1_000  # 10번에 1번은 세션 등에 오래 붙잡힘 (최근 1000개까지 유지)
+
+KEYS = zipf_keys(ACCESSES, KEY_SPACE, seed=1)
+
+
+CACHE_FACTORIES: dict[str, Callable[[], Any]] = {
+    "weak_only": lambda: TwoTierCache(ExpensiveObject, strong_size=0),
+    "lru_only": lambda: StrongLRUCache(ExpensiveObject, size=STRONG_SIZE),
+    "two_tier": lambda: TwoTierCache(ExpensiveObject, strong_size=STRONG_SIZE),
+}
+
+
+def bursty_run(cache: Any, keys: list[int] = KEYS) -> None:
+    """
+    키 순서대로 조회. 최근 HELD개 객체는 처리 중이고,
+    10번에 1번은 LONG_HELD 동안 다른 곳(세션 등)이 붙잡고 있음.
+    """
+    in_use: deque[ExpensiveObject] = deque(maxlen=HELD)
+    long_held: deque[ExpensiveObject] = deque(maxlen=LONG_HELD)
+    for i, k in enumerate(keys):
+        obj = cache.get(k)
+        in_use.append(obj)
+        if i % 10 == 0:
+            long_held.append(obj)
+
+
+def _register_tier_benchmarks() -> None:
+    for name, factory in CACHE_FACTORIES.items():
+        def bench(factory: Callable[[], Any] = factory) -> None:
+            bursty_run(factory())
+
+        register(f"two_tier.{name}", group="two_tier", repeat=5)(bench)
+
+
+_register_tier_benchmarks()
+
+
+# =============================================================================
+# 3️⃣ 데모
+# =============================================================================
+
+def churn_demo() -> None:
+    """WeakValueDictionary만 쓸 때의 재생성 vs 2단계 캐시."""
+    print("\n📌 참조를 놓을 때마다 재생성? (weak only vs two-tier)")
+    print("-" * 50)
+
+    class Noisy:
+        def __init__(self, id: int) -> None:
+            self.id = id
+            print(f"    Noisy({id}) 생성")
+
+    for label, cache in (("weak only", TwoTierCache(Noisy, strong_size=0)),
+                         ("two-tier", TwoTierCache(Noisy, strong_size=2))):
+        print(f"  [{label}] 요청 1 → 처리 후 참조 해제 → 요청 1 → 요청 1")
+        for _ in range(3):
+            obj = cache.get(1)
+            del obj  # 요청 처리 끝
+        print(f"    {cache.stats}")
+
+
+def tier_benchmark_demo() -> None:
+    """Zipf 접근에서 단계별 적중률, 생성 수, 중복 객체 수."""
+    print(f"\n📌 Zipf 접근 {ACCESSES:,}번 (키 {KEY_SPACE:,}개, LRU {STRONG_SIZE},"
+          f" 사용 중 {HELD}개 + 장기 보유 {LONG_HELD:,}개)")
+    print("-" * 50)
+    results = {r.name: r for r in run_group("two_tier")}
+    print(format_table(results.values()))
+    print()
+    for name, factory in CACHE_FACTORIES.items():
+        ExpensiveObject.live.clear()
+        ExpensiveObject.duplicates = 0
+        cache = factory()
+        bursty_run(cache)
+        print(f"  {name:<10} {cache.stats}  중복 객체 {ExpensiveObject.duplicates:,}개"
+              f"  {results[f'two_tier.{name}'].median * 1e3:6.1f}ms")
+        del cache
+    print("\n  💡 lru_only는 밀려난 객체를 아직 쓰는 중인데 새로 만듦 → 같은 id 객체가 둘")
+    print("     two_tier는 weak 단계가 살아 있는 객체를 찾아줘서 중복 0")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🪺 2단계 객체 캐시 (strong LRU + weak)")
+    print("=" * 60)
+
+    churn_demo()
+    tier_benchmark_demo()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   2단계 객체 캐시 정리                         ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  WeakValueDictionary만: 참조를 놓는 순간 사라짐 → 재생성 반복 ║
+    ║  강한 LRU만: 밀려난 객체가 아직 쓰이면 중복 생성              ║
+    ║                                                               ║
+    ║  ✅ strong LRU(작게) → 핫 객체 유지                           ║
+    ║  ✅ weak 단계 → 살아 있는 객체는 항상 같은 인스턴스           ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
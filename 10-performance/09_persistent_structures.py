@@ -0,0 +1,581 @@
+"""
+09_persistent_structures.py - 구조 공유 영속 자료구조 (deepcopy 대안)
+
+📌 핵심 개념:
+    02-python-gotchas/05_shallow_vs_deep_copy.py는 중첩 구조를 안전하게 복사하려면
+    copy.deepcopy를 쓰라고 합니다. 하지만 설정/상태 트리가 크면
+    "값 하나 바꾼 새 버전"을 만들 때마다 전체(노드 N개)를 복사합니다.
+
+    영속(persistent) 자료구조는 애초에 불변입니다.
+        - 수정하면 새 버전을 반환, 이전 버전은 그대로
+        - 바뀐 경로의 노드만 새로 만들고 나머지 서브트리는 공유 (path copying)
+        - 그래서 "복사"가 필요 없음 → 버전 하나 = O(log n) 노드
+
+    PVector: 32갈래 트라이 (Clojure vector)  → set / append = O(log32 n)
+    PMap:    HAMT (hash array mapped trie)   → set / delete = O(log32 n)
+    freeze() / thaw(): 중첩 dict·list ↔ PMap·PVector
+    get_in() / set_in(): 중첩 경로 읽기 / 경로만 복사한 새 버전
+
+🔄 다른 언어 비교:
+    - Java: Vavr / PCollections, Clojure의 PersistentVector / PersistentHashMap
+    - Go: 표준 없음 (benbjohnson/immutable)
+    - JavaScript: Immutable.js, Immer(구조 공유 + 프록시)
+    - Python: 서드파티 pyrsistent, immutables(HAMT, contextvars 내부 구현)
+
+⚠️ 주의사항:
+    - 순수 Python 구현이라 읽기는 dict/list보다 느립니다 (한 단계마다 비트 연산)
+    - 값 자체가 가변 객체면 공유되는 셈이므로 freeze()로 끝까지 변환할 것
+    - 키는 해시 가능해야 합니다
+
+실행:
+    python 09_persistent_structures.py          # 1만 / 10만 노드
+    python 09_persistent_structures.py --full   # + 100만 노드
+
+📚 참고: https://hypirion.com/musings/understanding-persistent-vector-pt-1
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+import sys
+import tracemalloc
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_benchmark, run_group  # noqa: E402
+
+BITS = 5
+WIDTH = 1 << BITS  # 32
+MASK = WIDTH - 1
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+
+# =============================================================================
+# 1️⃣ PVector: 32갈래 트라이
+# =============================================================================
+
+class PVector(Sequence[Any]):
+    """
+    불변 리스트. 노드는 최대 32칸 tuple, 리프에 값이 있음.
+
+    사용 예:
+        v1 = PVector.from_iterable(range(100))
+        v2 = v1.set(5, "x")       # v1은 그대로, 바뀐 경로(깊이 2)만 새 tuple
+        v3 = v2.append(100)
+    """
+
+    __slots__ = ("_root", "_size", "_shift")
+
+    def __init__(self, root: tuple[Any, ...] = (), size: int = 0, shift: int = 0) -> None:
+        self._root = root
+        self._size = size
+        self._shift = shift  # 루트 아래 단계 수 × BITS (리프만 있으면 0)
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[Any]) -> PVector:
+        """한 번에 만들기 (append 반복보다 빠름)."""
+        values = tuple(items)
+        if not values:
+            return cls()
+        level: list[tuple[Any, ...]] = [values[i:i + WIDTH] for i in range(0, len(values), WIDTH)]
+        shift = 0
+        while len(level) > 1:
+            level = [tuple(level[i:i + WIDTH]) for i in range(0, len(level), WIDTH)]
+            shift += BITS
+        return cls(level[0], len(values), shift)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("PVector index out of range")
+        return index
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return PVector.from_iterable(self[i] for i in range(*index.indices(self._size)))
+        index = self._index(index)
+        node = self._root
+        for shift in range(self._shift, 0, -BITS):
+            node = node[(index >> shift) & MASK]
+        return node[index & MASK]
+
+    def __iter__(self) -> Iterator[Any]:
+        def walk(node: tuple[Any, ...], shift: int) -> Iterator[Any]:
+            if shift == 0:
+                yield from node
+            else:
+                for child in node:
+                    yield from walk(child, shift - BITS)
+
+        return walk(self._root, self._shift)
+
+    def set(self, index: int, value: Any) -> PVector:
+        """index 값을 바꾼 새 버전 (루트→리프 경로의 tuple만 새로 만듦)."""
+        index = self._index(index)
+
+        def assoc(node: tuple[Any, ...], shift: int) -> tuple[Any, ...]:
+            k = (index >> shift) & MASK
+            child = value if shift == 0 else assoc(node[k], shift - BITS)
+            return node[:k] + (child,) + node[k + 1:]
+
+        return PVector(assoc(self._root, self._shift), self._size, self._shift)
+
+    def append(self, value: Any) -> PVector:
+        index = self._size
+        if index == 0:
+            return PVector((value,), 1, 0)
+        if index == 1 << (self._shift + BITS):  # 꽉 참 → 루트 위로 한 단계
+            return PVector((self._root, _path(self._shift, value)), index + 1, self._shift + BITS)
+
+        def push(node: tuple[Any, ...], shift: int) -> tuple[Any, ...]:
+            if shift == 0:
+                return node + (value,)
+            k = (index >> shift) & MASK
+            if k < len(node):
+                return node[:k] + (push(node[k], shift - BITS),) + node[k + 1:]
+            return node + (_path(shift - BITS, value),)
+
+        return PVector(push(self._root, self._shift), index + 1, self._shift)
+
+    def tolist(self) -> list[Any]:
+        return list(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        items = ", ".join(repr(v) for _, v in zip(range(8), self))
+        return f"PVector([{items}{', ...' if self._size > 8 else ''}], len={self._size})"
+
+
+def _path(shift: int, value: Any) -> tuple[Any, ...]:
+    """값 하나짜리 경로 (shift 단계만큼 감싼 tuple)."""
+    node: tuple[Any, ...] = (value,)
+    for _ in range(0, shift, BITS):
+        node = (node,)
+    return node
+
+
+# =============================================================================
+# 2️⃣ PMap: HAMT (hash array mapped trie)
+# =============================================================================
+
+class _Node:
+    """
+    HAMT 내부 노드. bitmap의 비트 i가 켜져 있으면 해시 조각 i에 해당하는 항목이
+    entries[popcount(bitmap & (bit - 1))] 에 있음 (빈 칸은 저장하지 않음).
+
+    항목: (key, value) tuple = 리프, _Node = 하위 노드, _Collision = 해시 완전 충돌
+    """
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def replace(self, index: int, item: Any) -> _Node:
+        return _Node(self.bitmap, self.entries[:index] + (item,) + self.entries[index + 1:])
+
+
+class _Collision:
+    """해시가 완전히 같은 키들 (선형 탐색)."""
+
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash: int, entries: tuple[tuple[Any, Any], ...]) -> None:
+        self.hash = hash
+        self.entries = entries
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & HASH_MASK
+
+
+def _merge(shift: int, leaf1: tuple[Any, Any], hash1: int, leaf2: tuple[Any, Any], hash2: int) -> Any:
+    """한 칸에 두 리프가 만났을 때 둘을 가르는 하위 노드."""
+    if hash1 == hash2 or shift >= HASH_BITS:
+        return _Collision(hash1, (leaf1, leaf2))
+    b1, b2 = (hash1 >> shift) & MASK, (hash2 >> shift) & MASK
+    if b1 == b2:
+        return _Node(1 << b1, (_merge(shift + BITS, leaf1, hash1, leaf2, hash2),))
+    pair = (leaf1, leaf2) if b1 < b2 else (leaf2, leaf1)
+    return _Node((1 << b1) | (1 << b2), pair)
+
+
+def _assoc(node: _Node, shift: int, h: int, key: Any, value: Any) -> tuple[_Node, bool]:
+    """(새 노드, 키 추가 여부). 바뀐 경로만 새로 만듦."""
+    bit = 1 << ((h >> shift) & MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    if not node.bitmap & bit:
+        entries = node.entries[:index] + ((key, value),) + node.entries[index:]
+        return _Node(node.bitmap | bit, entries), True
+    item = node.entries[index]
+    if type(item) is tuple:
+        if item[0] is key or item[0] == key:
+            if item[1] is value:
+                return node, False
+            return node.replace(index, (key, value)), False
+        return node.replace(index, _merge(shift + BITS, item, _hash(item[0]), (key, value), h)), True
+    if type(item) is _Node:
+        child, added = _assoc(item, shift + BITS, h, key, value)
+        return (node if child is item else node.replace(index, child)), added
+    # _Collision
+    if item.hash != h:  # 해시가 다르면 충돌 묶음과 새 리프를 가르는 노드로
+        sub = _Node(1 << ((item.hash >> (shift + BITS)) & MASK), (item,))
+        child, added = _assoc(sub, shift + BITS, h, key, value)
+        return node.replace(index, child), added
+    for i, (k, _) in enumerate(item.entries):
+        if k == key:
+            entries = item.entries[:i] + ((key, value),) + item.entries[i + 1:]
+            return node.replace(index, _Collision(h, entries)), False
+    return node.replace(index, _Collision(h, item.entries + ((key, value),))), True
+
+
+def _dissoc(node: _Node, shift: int, h: int, key: Any) -> tuple[Any, bool]:
+    """(새 항목 또는 None(빈 노드), 삭제 여부). 하위 노드가 리프 1개만 남으면 끌어올림."""
+    bit = 1 << ((h >> shift) & MASK)
+    if not node.bitmap & bit:
+        return node, False
+    index = (node.bitmap & (bit - 1)).bit_count()
+    item = node.entries[index]
+    if type(item) is tuple:
+        if not (item[0] is key or item[0] == key):
+            return node, False
+        replacement = None
+    elif type(item) is _Node:
+        replacement, removed = _dissoc(item, shift + BITS, h, key)
+        if not removed:
+            return node, False
+        if type(replacement) is _Node and len(replacement.entries) == 1 \
+                and type(replacement.entries[0]) is tuple:
+            replacement = replacement.entries[0]
+    else:
+        entries = tuple(e for e in item.entries if e[0] != key)
+        if len(entries) == len(item.entries):
+            return node, False
+        replacement = entries[0] if len(entries) == 1 else _Collision(item.hash, entries)
+    if replacement is not None:
+        return node.replace(index, replacement), True
+    if node.bitmap == bit:
+        return None, True
+    return _Node(node.bitmap & ~bit, node.entries[:index] + node.entries[index + 1:]), True
+
+
+def _build(items: list[tuple[int, Any, Any]], shift: int) -> Any:
+    """(hash, key, value) 목록으로 노드를 한 번에 구성 (from_mapping용)."""
+    if len(items) == 1:
+        _, k, v = items[0]
+        return (k, v)
+    if shift >= HASH_BITS or all(h == items[0][0] for h, _, _ in items):
+        return _Collision(items[0][0], tuple((k, v) for _, k, v in items))
+    buckets: dict[int, list[tuple[int, Any, Any]]] = {}
+    for item in items:
+        buckets.setdefault((item[0] >> shift) & MASK, []).append(item)
+    bitmap = 0
+    entries = []
+    for b in sorted(buckets):
+        bitmap |= 1 << b
+        entries.append(_build(buckets[b], shift + BITS))
+    return _Node(bitmap, tuple(entries))
+
+
+def _walk(node: Any) -> Iterator[tuple[Any, Any]]:
+    for item in node.entries:
+        if type(item) is tuple:
+            yield item
+        elif type(item) is _Node:
+            yield from _walk(item)
+        else:
+            yield from item.entries
+
+
+class PMap(Mapping[Any, Any]):
+    """
+    불변 dict (HAMT).
+
+    사용 예:
+        m1 = PMap.from_mapping({"a": 1, "b": 2})
+        m2 = m1.set("a", 10)        # m1["a"] == 1 그대로
+        m3 = m2.delete("b")
+        dict(m3)                    # {"a": 10}
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: _Node | None = None, size: int = 0) -> None:
+        self._root = root if root is not None else _Node(0, ())
+        self._size = size
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[Any, Any] | Iterable[tuple[Any, Any]]) -> PMap:
+        """한 번에 만들기 (set 반복 대비 경로 복사 없음)."""
+        pairs = dict(mapping)
+        if not pairs:
+            return cls()
+        root = _build([(_hash(k), k, v) for k, v in pairs.items()], 0)
+        if type(root) is not _Node:  # 항목 1개 또는 전부 충돌 → 루트 노드로 감쌈
+            h = _hash(next(iter(pairs)))
+            root = _Node(1 << (h & MASK), (root,))
+        return cls(root, len(pairs))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        return (k for k, _ in _walk(self._root))
+
+    def items(self) -> Iterator[tuple[Any, Any]]:  # type: ignore[override]
+        return _walk(self._root)
+
+    def __getitem__(self, key: Any) -> Any:
+        h = _hash(key)
+        node: Any = self._root
+        shift = 0
+        while True:
+            bit = 1 << ((h >> shift) & MASK)
+            if not node.bitmap & bit:
+                raise KeyError(key)
+            item = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if type(item) is tuple:
+                if item[0] is key or item[0] == key:
+                    return item[1]
+                raise KeyError(key)
+            if type(item) is _Collision:
+                for k, v in item.entries:
+                    if k == key:
+                        return v
+                raise KeyError(key)
+            node = item
+            shift += BITS
+
+    def set(self, key: Any, value: Any) -> PMap:
+        root, added = _assoc(self._root, 0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return PMap(root, self._size + added)
+
+    def delete(self, key: Any) -> PMap:
+        root, removed = _dissoc(self._root, 0, _hash(key), key)
+        if not removed:
+            raise KeyError(key)
+        return PMap(root, self._size - 1)
+
+    def update(self, other: Mapping[Any, Any]) -> PMap:
+        result = self
+        for k, v in other.items():
+            result = result.set(k, v)
+        return result
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{k!r}: {v!r}" for (k, v), _ in zip(self.items(), range(5)))
+        return f"PMap({{{items}{', ...' if self._size > 5 else ''}}}, len={self._size})"
+
+
+# =============================================================================
+# 3️⃣ 중첩 구조: freeze / thaw / get_in / set_in
+# =============================================================================
+
+def freeze(obj: Any) -> Any:
+    """중첩 dict / list / tuple을 PMap / PVector로 (끝까지)."""
+    if isinstance(obj, dict):
+        return PMap.from_mapping({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return PVector.from_iterable(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """freeze의 반대 (일반 dict / list로)."""
+    if isinstance(obj, PMap):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, PVector):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+def get_in(root: Any, path: Sequence[Any], default: Any = None) -> Any:
+    node = root
+    for key in path:
+        try:
+            node = node[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return node
+
+
+def set_in(root: Any, path: Sequence[Any], value: Any) -> Any:
+    """path 위치를 value로 바꾼 새 버전. 경로 위의 노드만 새로 만들고 나머지는 공유."""
+    if not path:
+        return value
+    key, rest = path[0], path[1:]
+    if isinstance(root, PVector):
+        return root.set(key, set_in(root[key], rest, value))
+    child = root[key] if rest else None
+    return root.set(key, set_in(child, rest, value))
+
+
+# =============================================================================
+# 4️⃣ 벤치마크: N노드 설정 트리에서 값 하나 바꾼 새 버전 만들기
+# =============================================================================
+
+SECTION_SIZE = 100  # 섹션당 리프: dict 50개 + list 50개
+
+
+def build_tree(nodes: int) -> dict[str, Any]:
+    """리프 약 nodes개짜리 중첩 설정 트리 {"s0": {"k0": 0, ..., "values": [..]}, ...}."""
+    half = SECTION_SIZE // 2
+    return {
+        f"s{s}": {**{f"k{j}": s * SECTION_SIZE + j for j in range(half)},
+                  "values": list(range(half))}
+        for s in range(max(1, nodes // SECTION_SIZE))
+    }
+
+
+def deepcopy_update(tree: dict[str, Any], section: str) -> dict[str, Any]:
+    """기존 방식: 전체 복사 후 값 하나 수정."""
+    new = copy.deepcopy(tree)
+    new[section]["k7"] = -1
+    new[section]["values"][3] = -1
+    return new
+
+
+def persistent_update(tree: PMap, section: str) -> PMap:
+    """영속 방식: 두 경로만 새로 만듦."""
+    new = set_in(tree, (section, "k7"), -1)
+    return set_in(new, (section, "values", 3), -1)
+
+
+def new_version_bytes(update: Any, tree: Any, section: str) -> int:
+    """원본을 살려 둔 채 새 버전이 추가로 차지하는 바이트 (tracemalloc)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        new = update(tree, section)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del new
+    return size
+
+
+SIZES = (10_000, 100_000)
+FULL_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def _label(n: int) -> str:
+    return f"{n // 1_000_000}m" if n >= 1_000_000 else f"{n // 1_000}k"
+
+
+def _register_update_benchmarks() -> None:
+    for n in SIZES:
+        middle = f"s{n // SECTION_SIZE // 2}"
+        register(f"persistent.update.deepcopy.{_label(n)}", group="persistent",
+                 setup=lambda n=n: build_tree(n), repeat=3)(
+            lambda tree, s=middle: deepcopy_update(tree, s))
+        register(f"persistent.update.set_in.{_label(n)}", group="persistent",
+                 setup=lambda n=n: freeze(build_tree(n)), number=100)(
+            lambda tree, s=middle: persistent_update(tree, s))
+
+
+_register_update_benchmarks()
+
+
+# =============================================================================
+# 5️⃣ 데모
+# =============================================================================
+
+def basics_demo() -> None:
+    """버전은 독립, 바뀌지 않은 서브트리는 같은 객체."""
+    print("\n📌 새 버전과 구조 공유")
+    print("-" * 50)
+    config = freeze({"db": {"host": "localhost", "port": 5432},
+                     "features": {"beta": False}, "hosts": ["a", "b", "c"]})
+    updated = set_in(config, ("db", "port"), 6432)
+    updated = set_in(updated, ("hosts", 1), "B")
+    print(f"  원본 db.port={config['db']['port']}, hosts={config['hosts'].tolist()}")
+    print(f"  새 버전 db.port={updated['db']['port']}, hosts={updated['hosts'].tolist()}")
+    print(f"  features 공유? {updated['features'] is config['features']}  (안 바뀐 서브트리)")
+    print(f"  db 공유?       {updated['db'] is config['db']}  (바뀐 경로)")
+    print(f"  thaw(updated) = {thaw(updated)}")
+
+    v = PVector.from_iterable(range(2000))
+    v2 = v.set(1234, "x").append(2000)
+    print(f"  PVector: len {len(v)} → {len(v2)}, v[1234]={v[1234]}, v2[1234]={v2[1234]!r}, v2[-1]={v2[-1]}")
+
+
+def update_benchmark(sizes: Sequence[int] = SIZES) -> None:
+    """deepcopy vs set_in: 값 2개 바꾼 새 버전의 시간과 추가 메모리."""
+    print("\n📌 값 2개 바꾼 새 버전 만들기 (deepcopy+수정 vs set_in)")
+    print("-" * 50)
+    results = {r.name: r for r in run_group("persistent")}
+    if sizes != SIZES:
+        for n in sizes:
+            if n in SIZES:
+                continue
+            section = f"s{n // SECTION_SIZE // 2}"
+            tree, frozen = build_tree(n), None
+            results[f"persistent.update.deepcopy.{_label(n)}"] = run_benchmark(
+                f"persistent.update.deepcopy.{_label(n)}",
+                lambda: deepcopy_update(tree, section), repeat=3, group="persistent")
+            frozen = freeze(tree)
+            results[f"persistent.update.set_in.{_label(n)}"] = run_benchmark(
+                f"persistent.update.set_in.{_label(n)}",
+                lambda: persistent_update(frozen, section), number=100, group="persistent")
+    print(format_table(results.values()))
+    print()
+    for n in sizes:
+        section = f"s{n // SECTION_SIZE // 2}"
+        tree = build_tree(n)
+        frozen = freeze(tree)
+        deep = new_version_bytes(deepcopy_update, tree, section)
+        persistent = new_version_bytes(persistent_update, frozen, section)
+        d = results[f"persistent.update.deepcopy.{_label(n)}"].median
+        p = results[f"persistent.update.set_in.{_label(n)}"].median
+        print(f"  노드 {n:>9,}  deepcopy {d * 1e3:8.1f}ms {deep / (1 << 20):7.1f}MiB"
+              f"  │ set_in {p * 1e6:6.1f}µs {persistent / 1024:5.1f}KiB  ({d / p:,.0f}배)")
+    print("\n  💡 deepcopy는 노드 수에 비례, set_in은 경로 길이(log32)에 비례")
+    print("     (int 같은 불변 값은 deepcopy도 공유 → 복사되는 것은 dict/list 컨테이너)")
+
+
+def main(sizes: Sequence[int] = SIZES) -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🌳 영속 자료구조 (구조 공유)")
+    print("=" * 60)
+
+    basics_demo()
+    update_benchmark(sizes)
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   영속 자료구조 정리                           ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  deepcopy 후 수정     → 매번 노드 N개 복사                    ║
+    ║  set_in(root, path)   → 경로 위 노드만 새로, 나머지 공유      ║
+    ║                                                               ║
+    ║  PVector (32갈래 트라이) / PMap (HAMT): 수정 O(log32 n)       ║
+    ║  이전 버전이 그대로 남음 → 되돌리기, 스냅샷, 스레드 간 공유   ║
+    ║                                                               ║
+    ║  💡 읽기 위주 + 가끔 새 버전: 영속 구조                        ║
+    ║  💡 한 곳에서 대량 수정: 일반 dict/list에 직접                 ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main(FULL_SIZES if "--full" in sys.argv[1:] else SIZES)
@@ -0,0 +1,440 @@
+"""
+10_copy_on_write.py - 중첩 dict용 copy-on-write 프록시 (deepcopy 대체)
+
+📌 핵심 개념:
+    02-python-gotchas/05_shallow_vs_deep_copy.py의 dict_copy_demo()는
+    shallow["user"]["age"] = 31 이 원본까지 바꾸는 문제를 deepcopy로 해결합니다.
+    그런데 보통은 복사본을 "대부분 읽고, 몇 군데만 씁니다".
+    deepcopy는 쓰지도 않을 서브트리까지 전부 복사합니다.
+
+    cow_copy(original):
+        - 처음에는 원본을 그대로 공유 (복사 0)
+        - 읽기: 중첩 dict / list는 하위 프록시로 감싸서 반환
+                그 밖의 변경 가능한 값(set, bytearray, 객체)은 처음 읽을 때 deepcopy해서 복사본에 저장
+        - 쓰기: 그 단계의 dict만 얕게 복사 → 부모도 자기 단계만 복사해서 새 dict를 가리킴
+                (루트까지의 "경로"만 복사, 형제 서브트리는 계속 공유)
+        - 원본은 절대 바뀌지 않음
+
+    기존 코드:  cfg = copy.deepcopy(original)
+    바꾼 코드:  cfg = cow_copy(original)      # 읽기/쓰기 코드는 그대로
+
+    09_persistent_structures.py와의 차이: 저쪽은 자료구조 자체를 불변으로 바꾸고,
+    여기는 기존 dict/list를 그대로 두고 "복사 시점"만 쓰기 직전으로 미룹니다.
+
+🔄 다른 언어 비교:
+    - JavaScript: Immer produce() (Proxy + 구조 공유)
+    - Swift: Array / Dictionary는 언어 차원의 copy-on-write
+    - Rust: Cow<'a, T>, Rc::make_mut
+    - Python: 표준 없음 → MutableMapping 프록시 (이 예제)
+
+⚠️ 주의사항:
+    - 프록시가 살아 있는 동안 원본을 직접 수정하면 안 됩니다 (공유 중이므로 보임)
+    - isinstance(cfg, dict)는 False (MutableMapping). json 등으로 넘길 땐 to_plain()
+    - 프록시를 다른 자리에 대입하면 그 시점의 복사본이 들어감
+      (deepcopy 결과처럼 두 자리가 같은 객체를 가리키지는 않음)
+
+📚 참고: https://docs.python.org/3/library/collections.abc.html#collections.abc.MutableMapping
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+from bisect import bisect_left
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator, MutableMapping, MutableSequence
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
+from bench import format_table, register, run_group  # noqa: E402
+from bench.discovery import load_example  # noqa: E402
+
+build_tree = load_example(Path(__file__).with_name("09_persistent_structures.py")).build_tree
+
+
+# =============================================================================
+# 1️⃣ 공통: 소유권과 경로 복사
+# =============================================================================
+
+# 그대로 공유해도 안전한 값 (그 밖의 값은 처음 읽을 때 deepcopy)
+_ATOMIC = frozenset({type(None), bool, int, float, complex, str, bytes, range})
+
+class _CowNode:
+    """
+    dict / list 하나를 감싼 프록시 노드.
+
+    _data는 처음에 원본 객체 자체(공유). 첫 쓰기에서 _own()이 얕은 복사로 바꾸고,
+    부모에게 "내 key 자리는 이제 이 복사본"이라고 알림 (부모도 필요하면 _own()).
+    """
+
+    __slots__ = ("_data", "_owned", "_parent", "_key", "_children")
+
+    def __init__(self, data: Any, parent: _CowNode | None = None, key: Any = None) -> None:
+        self._data = data
+        self._owned = False
+        self._parent = parent
+        self._key = key
+        self._children: dict[Any, Any] = {}  # 꺼내 준 하위 프록시 / deepcopy한 값
+
+    def _own(self) -> None:
+        if self._owned:
+            return
+        self._data = copy.copy(self._data)  # 이 단계만 얕은 복사
+        self._owned = True
+        if self._parent is not None:
+            self._parent._adopt(self._key, self._data)
+
+    def _adopt(self, key: Any, data: Any) -> None:
+        """하위 노드가 복사본을 만들었을 때: 내 것도 복사한 뒤 그 자리를 교체."""
+        self._own()
+        self._data[key] = data
+
+    def _wrap(self, key: Any, value: Any) -> Any:
+        """
+        중첩 dict / list는 하위 프록시로 (같은 key는 같은 프록시).
+
+        set, bytearray, 일반 객체처럼 프록시로 감쌀 수 없는 변경 가능한 값은
+        처음 읽을 때 deepcopy해서 내 복사본에 넣어 둠 → 꺼낸 값을 고쳐도 원본은 그대로.
+        """
+        if key in self._children:
+            return self._children[key]
+        if isinstance(value, dict):
+            child: Any = CowDict(value, self, key)
+        elif isinstance(value, list):
+            child = CowList(value, self, key)
+        elif type(value) in _ATOMIC:
+            return value
+        else:
+            child = copy.deepcopy(value)
+            if child is value:  # 불변 값만 담은 tuple / frozenset 등
+                return value
+            self._own()
+            self._data[key] = child
+        self._children[key] = child
+        return child
+
+    def _detach_child(self, key: Any) -> None:
+        """key 자리가 교체/삭제되면 꺼내 둔 하위 프록시가 그 자리를 되살리지 못하게 끊음."""
+        _detach(self._children.pop(key, None))
+
+    def _rekey(self, new_key: Callable[[Any], Any]) -> None:
+        """구조가 바뀌면(list 삽입/삭제/뒤집기) 꺼내 둔 하위 값을 새 자리로 옮김 (None → 끊음)."""
+        children, self._children = self._children, {}
+        for key, child in children.items():
+            moved = new_key(key)
+            if moved is None:
+                _detach(child)
+                continue
+            if isinstance(child, _CowNode):
+                child._key = moved
+            self._children[moved] = child
+
+    @property
+    def shared(self) -> bool:
+        """아직 원본을 그대로 공유 중인지 (이 단계 기준)."""
+        return not self._owned
+
+    def to_plain(self) -> Any:
+        """일반 dict / list로 (공유 중인 서브트리도 복사 → 외부에 넘겨도 안전)."""
+        return _plain(self)
+
+
+def _detach(child: Any) -> None:
+    if isinstance(child, _CowNode):
+        child._parent = None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, CowDict):
+        return {k: _plain(value[k]) for k in value}
+    if isinstance(value, CowList):
+        return [_plain(v) for v in value]
+    if type(value) in _ATOMIC:
+        return value
+    return copy.deepcopy(value)
+
+
+# =============================================================================
+# 2️⃣ CowDict / CowList
+# =============================================================================
+
+class CowDict(_CowNode, MutableMapping[Any, Any]):
+    """
+    dict copy-on-write 프록시.
+
+    사용 예:
+        cfg = cow_copy(original)
+        cfg["user"]["age"] = 31      # user dict와 루트 dict만 복사
+        original["user"]["age"]      # 그대로
+        cfg["settings"].shared       # True (아직 원본 공유)
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._wrap(key, self._data[key])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._own()
+        self._detach_child(key)
+        self._data[key] = _unwrap(value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._own()
+        self._detach_child(key)
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"CowDict({self._data!r})"
+
+
+class CowList(_CowNode, MutableSequence[Any]):
+    """list copy-on-write 프록시 (정수 인덱스)."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._data)))]
+        if index < 0:
+            index += len(self._data)
+        return self._wrap(index, self._data[index])
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            raise TypeError("CowList는 slice 대입을 지원하지 않습니다")
+        if index < 0:
+            index += len(self._data)
+        self._own()
+        self._detach_child(index)
+        self._data[index] = _unwrap(value)
+
+    def __delitem__(self, index: Any) -> None:
+        if isinstance(index, slice):
+            removed = sorted(range(*index.indices(len(self._data))))
+        else:
+            if index < 0:
+                index += len(self._data)
+            removed = [index]
+        self._own()
+        del self._data[index]
+        # 삭제된 자리의 프록시는 끊고, 뒤쪽 프록시는 앞으로 당김
+        gone = set(removed)
+        self._rekey(lambda i: None if i in gone else i - bisect_left(removed, i))
+
+    def insert(self, index: int, value: Any) -> None:
+        n = len(self._data)
+        index = min(max(index + n, 0) if index < 0 else index, n)  # list.insert와 같은 범위 처리
+        self._own()
+        self._data.insert(index, _unwrap(value))
+        self._rekey(lambda i: i + 1 if i >= index else i)
+
+    def reverse(self) -> None:
+        self._own()
+        self._data.reverse()
+        last = len(self._data) - 1
+        self._rekey(lambda i: last - i)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        """list와 비교 가능하게 (Sequence는 __eq__를 제공하지 않음)."""
+        if isinstance(other, (list, CowList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CowList({self._data!r})"
+
+
+def _unwrap(value: Any) -> Any:
+    """프록시를 값으로 대입하면 평범한 복사본으로 (두 프록시가 같은 _data를 공유하지 않게)."""
+    return value.to_plain() if isinstance(value, _CowNode) else value
+
+
+def cow_copy(original: Any) -> Any:
+    """copy.deepcopy(original) 자리에 그대로 (dict / list가 아니면 deepcopy)."""
+    if isinstance(original, dict):
+        return CowDict(original)
+    if isinstance(original, list):
+        return CowList(original)
+    return copy.deepcopy(original)
+
+
+# =============================================================================
+# 3️⃣ 벤치마크: 복사 + 읽기 몇 번 + 쓰기 몇 번
+# =============================================================================
+
+READS = 200
+WRITES = 3
+
+
+def _workload(cfg: Any, sections: int) -> int:
+    """복사본에서 READS번 읽고 WRITES군데 쓰기 (요청 하나가 설정을 조금 바꿔 쓰는 상황)."""
+    total = 0
+    for i in range(READS):
+        total += cfg[f"s{i * 7 % sections}"]["k3"]
+    for i in range(WRITES):
+        section = cfg[f"s{i * 13 % sections}"]
+        section["k7"] = -1
+        section["values"][3] = -1
+    return total
+
+
+def deepcopy_then_work(tree: dict[str, Any]) -> int:
+    return _workload(copy.deepcopy(tree), len(tree))
+
+
+def cow_then_work(tree: dict[str, Any]) -> int:
+    return _workload(cow_copy(tree), len(tree))
+
+
+SIZES = (10_000, 100_000)
+
+
+def _register_cow_benchmarks() -> None:
+    for n in SIZES:
+        label = f"{n // 1_000}k"
+        register(f"cow.deepcopy.{label}", group="cow", setup=lambda n=n: build_tree(n),
+                 repeat=3)(deepcopy_then_work)
+        register(f"cow.cow_copy.{label}", group="cow", setup=lambda n=n: build_tree(n),
+                 number=20)(cow_then_work)
+
+
+_register_cow_benchmarks()
+
+
+def extra_bytes(func: Any, tree: dict[str, Any]) -> int:
+    """원본을 살려 둔 채 복사본이 추가로 차지하는 바이트 (tracemalloc, 결과를 붙잡은 상태)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        cfg = copy.deepcopy(tree) if func is copy.deepcopy else cow_copy(tree)
+        _workload(cfg, len(tree))
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del cfg
+    return size
+
+
+# =============================================================================
+# 4️⃣ 데모
+# =============================================================================
+
+def aliasing_fix_demo() -> None:
+    """dict_copy_demo와 같은 상황을 cow_copy로."""
+    print("\n📌 dict_copy_demo의 shallow['user']['age'] 문제를 cow_copy로")
+    print("-" * 50)
+    original: dict[str, Any] = {
+        "user": {"name": "Kim", "age": 30},
+        "settings": {"theme": "dark"},
+        "tags": ["a", "b"],
+    }
+    cfg = cow_copy(original)  # ← copy.deepcopy(original) 자리
+    print(f"  쓰기 전: 루트 공유 {cfg.shared}, user 공유 {cfg['user'].shared}")
+    cfg["user"]["age"] = 31
+    cfg["tags"].append("c")
+    print("  cfg['user']['age'] = 31, cfg['tags'].append('c') 후:")
+    print(f"  original['user']['age'] = {original['user']['age']}, original['tags'] = {original['tags']}")
+    print(f"  cfg['user']['age'] = {cfg['user']['age']}, cfg['tags'] = {cfg['tags'][:]}")
+    print(f"  루트 공유 {cfg.shared}, user 공유 {cfg['user'].shared},"
+          f" settings 공유 {cfg['settings'].shared} ← 안 바뀐 서브트리는 여전히 원본")
+    print(f"  settings 객체가 원본과 같은가: {cfg.to_plain()['settings'] is original['settings']}"
+          " (to_plain은 전부 복사)")
+    print(f"  to_plain() = {cfg.to_plain()}")
+
+    print("\n  자리를 교체/삭제한 뒤 예전에 꺼내 둔 하위 프록시에 쓰면? (deepcopy와 같아야 함)")
+    cfg, deep = cow_copy(original), copy.deepcopy(original)
+    old_user, old_settings = cfg["user"], cfg["settings"]
+    deep_user, deep_settings = deep["user"], deep["settings"]
+    cfg["user"] = deep["user"] = {"new": True}
+    del cfg["settings"], deep["settings"]
+    for user, settings in ((old_user, old_settings), (deep_user, deep_settings)):
+        user["age"] = 5                  # 이미 떨어져 나간 dict → 복사본에 영향 없음
+        settings["theme"] = "light"
+    rows, deep_rows = cow_copy([{"n": 1}]), [{"n": 1}]
+    old_row = rows[0]
+    rows[0] = deep_rows[0] = {"n": 2}
+    old_row["n"] = 9
+    print(f"  cow  = {cfg.to_plain()}, {rows.to_plain()}")
+    print(f"  deep = {deep}, {deep_rows}")
+    print(f"  같은가: {cfg.to_plain() == deep and rows.to_plain() == deep_rows},"
+          f" 원본 그대로: {original['user']['age'] == 30}")
+
+    print("\n  list 삽입/삭제 뒤에도 꺼내 둔 하위 프록시의 쓰기는 새 자리에 반영")
+    source = {"rows": [{"n": 0}, {"n": 1}, {"n": 2}], "tags": {"a"}}
+    cfg, deep = cow_copy(source), copy.deepcopy(source)
+    for tree in (cfg, deep):
+        rows = tree["rows"]
+        first, last = rows[0], rows[2]
+        rows.insert(0, {"n": -1})
+        del rows[1:2]                    # 원래 rows[0] 삭제 → first는 떨어져 나감
+        first["n"], last["n"] = 100, 200  # last는 이제 rows[2]
+        tree["tags"].add("b")            # set은 처음 읽을 때 deepcopy → 원본 안 바뀜
+    print(f"  cow  = {cfg.to_plain()}")
+    print(f"  deep = {deep}")
+    print(f"  같은가: {cfg.to_plain() == deep}, 원본 그대로: {source == {'rows': [{'n': 0}, {'n': 1}, {'n': 2}], 'tags': {'a'}}}")
+
+
+def cow_benchmark(sizes: tuple[int, ...] = SIZES) -> None:
+    """deepcopy vs cow_copy: 복사 + 읽기 READS번 + 쓰기 WRITES군데."""
+    print(f"\n📌 복사 + 읽기 {READS}번 + 중첩 쓰기 {WRITES * 2}군데")
+    print("-" * 50)
+    results = {r.name: r for r in run_group("cow")}
+    print(format_table(results.values()))
+    print()
+    for n in sizes:
+        tree = build_tree(n)
+        label = f"{n // 1_000}k"
+        d = results[f"cow.deepcopy.{label}"].median
+        c = results[f"cow.cow_copy.{label}"].median
+        deep_mem = extra_bytes(copy.deepcopy, tree)
+        cow_mem = extra_bytes(cow_copy, tree)
+        print(f"  노드 {n:>7,}  deepcopy {d * 1e3:6.1f}ms {deep_mem / (1 << 20):5.1f}MiB"
+              f"  │ cow_copy {c * 1e3:6.2f}ms {cow_mem / 1024:6.1f}KiB  ({d / c:,.0f}배)")
+    print("\n  💡 cow_copy 비용은 트리 크기가 아니라 '읽고 쓴 경로 수'에 비례")
+    print("     (루트 dict 얕은 복사 1번 = 섹션 수에 비례하는 부분은 남음)")
+
+
+def main() -> None:
+    """메인 실행."""
+    print("=" * 60)
+    print("🐄 copy-on-write 프록시 (deepcopy 대체)")
+    print("=" * 60)
+
+    aliasing_fix_demo()
+    cow_benchmark()
+
+    print("""
+    ╔═══════════════════════════════════════════════════════════════╗
+    ║                   copy-on-write 정리                          ║
+    ╠═══════════════════════════════════════════════════════════════╣
+    ║                                                               ║
+    ║  cfg = copy.deepcopy(original)  → 전부 복사                   ║
+    ║  cfg = cow_copy(original)       → 쓸 때 그 경로만 복사        ║
+    ║                                                               ║
+    ║  ✅ 읽기 위주 + 몇 군데 쓰기: cow_copy                         ║
+    ║  ✅ 원본은 절대 안 바뀜 (프록시 사용 중 원본 직접 수정 금지)  ║
+    ║  ⚠️ dict가 필요한 API에는 to_plain()                           ║
+    ║                                                               ║
+    ╚═══════════════════════════════════════════════════════════════╝
+    """)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+bench - 섹션 예제들이 공유하는 벤치마크 하네스
+
+사용법:
+    python -m bench list                   # 등록된 벤치마크 목록
+    python -m bench run                    # 전체 실행
+    python -m bench run -k gil --json out.json
+
+예제 파일에서는 저장소 루트를 sys.path에 추가한 뒤 import합니다:
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    from bench import register, run_group, format_table
+"""
+
+from bench.core import (
+    Benchmark,
+    BenchResult,
+    environment,
+    format_table,
+    format_time,
+    measure,
+    register,
+    registry,
+    run_benchmark,
+    run_group,
+    select,
+    to_json,
+)
+
+__all__ = [
+    "Benchmark",
+    "BenchResult",
+    "environment",
+    "format_table",
+    "format_time",
+    "measure",
+    "register",
+    "registry",
+    "run_benchmark",
+    "run_group",
+    "select",
+    "to_json",
+]
@@ -0,0 +1,119 @@
+"""
+python -m bench - 벤치마크 CLI
+
+    python -m bench list
+    python -m bench run [-k 패턴] [-g 그룹] [--repeat N] [--warmup N] [--json 파일] [--save]
+    python -m bench compare [--baseline-commit C] [--baseline-python V] [--threshold 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+from bench.core import format_table, select, to_json
+from bench.discovery import discover
+from bench.store import DEFAULT_STORE, append_run, compare_runs, find_run, format_comparison, load_runs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m bench", description="섹션 예제 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    list_cmd = sub.add_parser("list", help="등록된 벤치마크 목록")
+    list_cmd.add_argument("-k", "--pattern", default="", help="이름 필터 (부분 문자열)")
+    list_cmd.add_argument("-g", "--group", default="", help="그룹 필터")
+
+    run_cmd = sub.add_parser("run", help="벤치마크 실행")
+    run_cmd.add_argument("-k", "--pattern", default="", help="이름 필터 (부분 문자열)")
+    run_cmd.add_argument("-g", "--group", default="", help="그룹 필터")
+    run_cmd.add_argument("--repeat", type=int, default=None, help="반복 측정 횟수")
+    run_cmd.add_argument("--warmup", type=int, default=None, help="워밍업 횟수")
+    run_cmd.add_argument("--json", type=Path, default=None, help="결과 JSON 저장 경로 (- 는 stdout)")
+    run_cmd.add_argument("--save", action="store_true", help="결과 저장소(JSONL)에 추가")
+    run_cmd.add_argument("--store", type=Path, default=DEFAULT_STORE, help="결과 저장소 경로")
+
+    cmp_cmd = sub.add_parser("compare", help="저장된 run 비교 (회귀 시 exit 1)")
+    cmp_cmd.add_argument("--store", type=Path, default=DEFAULT_STORE, help="결과 저장소 경로")
+    cmp_cmd.add_argument("--current", default="", help="비교 대상 run_id (기본: 가장 최근)")
+    cmp_cmd.add_argument("--baseline", default="", help="기준 run_id")
+    cmp_cmd.add_argument("--baseline-commit", default="", help="기준 커밋 (접두사)")
+    cmp_cmd.add_argument("--baseline-python", default="", help="기준 Python 버전 (접두사, 예: 3.12)")
+    cmp_cmd.add_argument("--threshold", type=float, default=0.05, help="회귀로 볼 최소 중앙값 증가율")
+    cmp_cmd.add_argument("--alpha", type=float, default=0.05, help="유의수준")
+    return parser
+
+
+def compare(args: argparse.Namespace) -> int:
+    runs = load_runs(args.store)
+    current = find_run(runs, run_id=args.current)
+    if current is None:
+        print(f"저장된 run이 없습니다: {args.store}", file=sys.stderr)
+        return 2
+    baseline = find_run(
+        runs,
+        run_id=args.baseline,
+        commit=args.baseline_commit,
+        python=args.baseline_python,
+        before=current,
+    )
+    if baseline is None:
+        print("비교할 기준 run이 없습니다", file=sys.stderr)
+        return 2
+
+    print(f"baseline: {baseline['run_id']} (commit {baseline['commit'][:10]}, Python {baseline['python']})")
+    print(f"current:  {current['run_id']} (commit {current['commit'][:10]}, Python {current['python']})\n")
+    comparisons = compare_runs(baseline, current, threshold=args.threshold, alpha=args.alpha)
+    print(format_comparison(comparisons))
+
+    insufficient = [c for c in comparisons if c.insufficient]
+    if insufficient:
+        print(f"\n⚪ 샘플 부족 {len(insufficient)}건: p < {args.alpha}가 불가능해 회귀를 판정할 수 없음"
+              " (--repeat 5 이상으로 다시 측정)", file=sys.stderr)
+
+    regressions = [c for c in comparisons if c.regression]
+    if regressions:
+        print(f"\n⚠️ 회귀 {len(regressions)}건 감지")
+        return 1
+    print("\n✅ 판정 가능한 벤치마크 중 유의미한 회귀 없음" if insufficient else "\n✅ 유의미한 회귀 없음")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.command == "compare":
+        return compare(args)
+
+    discover()
+    benchmarks = select(args.pattern, args.group)
+
+    if args.command == "list":
+        for b in benchmarks:
+            print(f"{b.name:<45} group={b.group or '-':<15} number={b.number} repeat={b.repeat}")
+        return 0
+
+    if not benchmarks:
+        print("실행할 벤치마크가 없습니다", file=sys.stderr)
+        return 1
+
+    results = []
+    for b in benchmarks:
+        print(f"  실행 중: {b.name}", file=sys.stderr)
+        results.append(b.run(repeat=args.repeat, warmup=args.warmup))
+
+    if args.json == Path("-"):
+        print(to_json(results))
+    else:
+        print(format_table(results))
+        if args.json is not None:
+            args.json.write_text(to_json(results), encoding="utf-8")
+            print(f"\n💾 저장: {args.json}")
+    if args.save:
+        record = append_run(results, args.store)
+        print(f"📦 run {record['run_id']} → {args.store}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""
+bench.core - 공통 벤치마크 하네스
+
+📌 핵심 개념:
+    timeit/perf_counter 한 번 실행 결과는 노이즈가 큽니다.
+    워밍업 → 여러 번 반복 측정 → 중앙값/p95/표준편차로 요약해야
+    인터프리터 버전이나 호스트 간에 숫자를 비교할 수 있습니다.
+
+🔄 다른 언어 비교:
+    - Java: JMH (@Benchmark, @Warmup, @Measurement)
+    - Go: testing.B (b.N 자동 조정)
+    - Python: timeit + 이 하네스 (warmup, repeat, 통계, JSON)
+
+📚 참고: https://docs.python.org/3/library/timeit.html
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+# =============================================================================
+# 1️⃣ 측정 결과
+# =============================================================================
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """정렬된 값에서 q(0~100) 백분위수를 선형 보간으로 계산."""
+    if not sorted_values:
+        raise ValueError("빈 샘플의 백분위수는 계산할 수 없습니다")
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(pos)
+    upper = math.ceil(pos)
+    frac = pos - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * frac
+
+
+@dataclass
+class BenchResult:
+    """
+    벤치마크 하나의 측정 결과.
+
+    samples는 "호출 1회당 초" 단위입니다 (number로 나눈 값).
+    """
+    name: str
+    samples: list[float]
+    number: int = 1
+    warmup: int = 0
+    group: str = ""
+    params: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def minimum(self) -> float:
+        return min(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(sorted(self.samples), 95)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON 직렬화용 dict."""
+        return {
+            "name": self.name,
+            "group": self.group,
+            "params": self.params,
+            "number": self.number,
+            "warmup": self.warmup,
+            "repeat": len(self.samples),
+            "samples": self.samples,
+            "median": self.median,
+            "mean": self.mean,
+            "min": self.minimum,
+            "p95": self.p95,
+            "stdev": self.stdev,
+        }
+
+
+# =============================================================================
+# 2️⃣ 측정 함수
+# =============================================================================
+
+def measure(
+    func: Callable[[], Any],
+    *,
+    number: int = 1,
+    repeat: int = 5,
+    warmup: int = 1,
+    timer: Callable[[], float] = time.perf_counter,
+) -> list[float]:
+    """
+    func를 warmup번 버린 뒤 repeat번 측정해 "호출 1회당 초" 리스트를 반환.
+
+    💡 timeit.repeat()과 같은 구조지만, 워밍업과 1회당 시간 환산을 포함합니다.
+    """
+    if number < 1 or repeat < 1:
+        raise ValueError("number와 repeat는 1 이상이어야 합니다")
+    for _ in range(warmup):
+        for _ in range(number):
+            func()
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = timer()
+        for _ in range(number):
+            func()
+        samples.append((timer() - start) / number)
+    return samples
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    number: int = 1,
+    repeat: int = 5,
+    warmup: int = 1,
+    group: str = "",
+    params: dict[str, Any] | None = None,
+) -> BenchResult:
+    """func를 측정해 BenchResult로 반환."""
+    samples = measure(func, number=number, repeat=repeat, warmup=warmup)
+    return BenchResult(
+        name=name,
+        samples=samples,
+        number=number,
+        warmup=warmup,
+        group=group,
+        params=dict(params or {}),
+    )
+
+
+# =============================================================================
+# 3️⃣ 레지스트리 - 각 섹션이 벤치마크를 등록
+# =============================================================================
+
+@dataclass
+class Benchmark:
+    """
+    등록된 벤치마크.
+
+    setup이 있으면 측정 전에 한 번 호출하고, 그 반환값을 func의 인자로 넘깁니다.
+    (setup 시간은 측정에 포함되지 않음)
+    """
+    name: str
+    func: Callable[..., Any]
+    group: str = ""
+    setup: Callable[[], Any] | None = None
+    number: int = 1
+    repeat: int = 5
+    warmup: int = 1
+    source: str = ""
+
+    def run(
+        self,
+        *,
+        number: int | None = None,
+        repeat: int | None = None,
+        warmup: int | None = None,
+    ) -> BenchResult:
+        if self.setup is not None:
+            arg = self.setup()
+            target: Callable[[], Any] = lambda: self.func(arg)
+        else:
+            target = self.func
+        return run_benchmark(
+            self.name,
+            target,
+            number=self.number if number is None else number,
+            repeat=self.repeat if repeat is None else repeat,
+            warmup=self.warmup if warmup is None else warmup,
+            group=self.group,
+        )
+
+
+_REGISTRY: dict[str, Benchmark] = {}
+
+
+def register(
+    name: str | None = None,
+    *,
+    group: str = "",
+    setup: Callable[[], Any] | None = None,
+    number: int = 1,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    벤치마크 등록 데코레이터.
+
+    사용 예:
+        @register("collections.search.set", group="collections",
+                  setup=lambda: set(range(10_000)), number=1000)
+        def bench_set_search(data: set[int]) -> None:
+            9999 in data
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        bench_name = name or f"{group}.{func.__name__}".lstrip(".")
+        # 같은 파일을 두 번 import해도(스크립트 실행 + 탐색) 덮어쓰기만 됨
+        _REGISTRY[bench_name] = Benchmark(
+            name=bench_name,
+            func=func,
+            group=group,
+            setup=setup,
+            number=number,
+            repeat=repeat,
+            warmup=warmup,
+            source=getattr(func, "__module__", ""),
+        )
+        return func
+
+    return decorator
+
+
+def registry() -> dict[str, Benchmark]:
+    """등록된 벤치마크 (이름 → Benchmark) 사본."""
+    return dict(_REGISTRY)
+
+
+def select(pattern: str = "", group: str = "") -> list[Benchmark]:
+    """이름에 pattern이 포함되고 group이 일치하는 벤치마크 목록 (이름순)."""
+    return [
+        b for name, b in sorted(_REGISTRY.items())
+        if pattern in name and (not group or b.group == group)
+    ]
+
+
+def run_group(group: str, **overrides: int) -> list[BenchResult]:
+    """그룹에 속한 벤치마크를 모두 실행."""
+    return [b.run(**overrides) for b in select(group=group)]
+
+
+# =============================================================================
+# 4️⃣ 실행 환경 & 출력
+# =============================================================================
+
+def git_commit() -> str:
+    """현재 git 커밋 해시 (git이 없으면 "unknown")."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    return out.stdout.strip() if out.returncode == 0 else "unknown"
+
+
+def environment() -> dict[str, Any]:
+    """결과를 호스트/인터프리터 간에 비교하기 위한 실행 환경 정보."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "gil_enabled": is_gil_enabled() if is_gil_enabled else True,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "host": socket.gethostname(),
+        "cpu_count": os.cpu_count(),
+        "commit": git_commit(),
+        "timestamp": time.time(),
+    }
+
+
+def format_time(seconds: float) -> str:
+    """초를 사람이 읽기 좋은 단위로."""
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f}ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def format_table(results: Iterable[BenchResult]) -> str:
+    """결과를 표 형태 문자열로."""
+    rows = list(results)
+    width = max([len(r.name) for r in rows] + [4])
+    lines = [
+        f"  {'name':<{width}}  {'median':>10}  {'p95':>10}  {'stdev':>10}  {'repeat':>6}",
+        "  " + "-" * (width + 44),
+    ]
+    for r in rows:
+        lines.append(
+            f"  {r.name:<{width}}  {format_time(r.median):>10}  "
+            f"{format_time(r.p95):>10}  {format_time(r.stdev):>10}  {len(r.samples):>6}"
+        )
+    return "\n".join(lines)
+
+
+def to_json(results: Iterable[BenchResult], *, indent: int | None = 2) -> str:
+    """환경 정보 + 결과를 JSON 문자열로."""
+    payload = {
+        "environment": environment(),
+        "results": [r.to_dict() for r in results],
+    }
+    return json.dumps(payload, ensure_ascii=False, indent=indent)
@@ -0,0 +1,94 @@
+"""
+bench.discovery - 섹션 예제 파일에서 벤치마크 수집
+
+📌 핵심 개념:
+    예제 파일 이름은 숫자로 시작해서(01_gil_explained.py) 일반 import가 안 됩니다.
+    importlib로 경로를 직접 로드하면 모듈 최상위의 @register가 실행되어
+    레지스트리에 벤치마크가 채워집니다.
+
+    로드한 모듈은 bench.examples.<이름>으로 등록되고, 같은 이름을 어느 프로세스에서
+    import해도 파일을 찾아주는 finder를 설치합니다. 그래서 spawn/forkserver로 만든
+    워커도 pickle된 예제 함수(cpu_bound_task 등)를 복원할 수 있습니다.
+
+📚 참고: https://docs.python.org/3/library/importlib.html#importing-a-source-file-directly
+"""
+
+from __future__ import annotations
+
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import re
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Sequence
+
+from bench.core import REPO_ROOT
+
+
+SECTION_GLOB = "[0-9][0-9]-*/*.py"
+PACKAGE = "bench.examples"
+_USES_BENCH = re.compile(r"^\s*from bench(\.\w+)* import|^\s*import bench\b", re.MULTILINE)
+
+
+def module_name_for(path: Path) -> str:
+    """파일 경로 → 모듈 이름 (04-concurrency/01_gil.py → bench.examples.s04_concurrency__01_gil)."""
+    return f"{PACKAGE}." + re.sub(r"\W", "_", f"s{path.parent.name}__{path.stem}")
+
+
+class ExampleFinder(importlib.abc.MetaPathFinder):
+    """bench.examples.* 이름을 섹션 예제 파일로 연결하는 finder."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        if not fullname.startswith(PACKAGE + "."):
+            return None
+        for file in example_files():
+            if module_name_for(file) == fullname:
+                return importlib.util.spec_from_file_location(fullname, file)
+        return None
+
+
+def install_finder() -> None:
+    """finder를 sys.meta_path에 한 번만 등록."""
+    if not any(isinstance(f, ExampleFinder) for f in sys.meta_path):
+        sys.meta_path.append(ExampleFinder())
+
+
+def load_example(path: Path) -> ModuleType:
+    """예제 파일을 모듈로 로드 (이미 로드됐으면 재사용)."""
+    name = module_name_for(path)
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"로드할 수 없는 파일: {path}")
+    module = importlib.util.module_from_spec(spec)
+    # dataclass, pickle(멀티프로세싱)이 모듈을 찾을 수 있도록 먼저 등록
+    install_finder()
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def example_files(root: Path = REPO_ROOT) -> list[Path]:
+    """모든 섹션의 예제 파일 (경로순)."""
+    return sorted(root.glob(SECTION_GLOB))
+
+
+def discover(root: Path = REPO_ROOT) -> list[ModuleType]:
+    """bench를 사용하는 예제 파일만 로드해서 반환."""
+    modules = []
+    for path in example_files(root):
+        if _USES_BENCH.search(path.read_text(encoding="utf-8")):
+            modules.append(load_example(path))
+    return modules
@@ -0,0 +1,11 @@
+"""
+bench.examples - 섹션 예제 모듈의 네임스페이스
+
+`python -m bench`나 run_examples.py가 로드한 예제는 bench.examples.<이름>으로 등록됩니다.
+이 패키지를 import하면 finder가 설치되므로, 새 프로세스에서도
+`import bench.examples.s04_concurrency__01_gil_explained`가 동작합니다.
+"""
+
+from bench.discovery import install_finder
+
+install_finder()
@@ -0,0 +1,225 @@
+"""
+bench.store - 벤치마크 결과 저장소 & 회귀 탐지
+
+📌 핵심 개념:
+    결과를 append-only JSONL 파일에 한 줄 = 한 번의 실행(run)으로 쌓습니다.
+    각 run은 git 커밋과 Python 버전을 키로 가지므로
+    "CPython 업그레이드 전후" 또는 "코드 변경 전후"를 비교할 수 있습니다.
+
+    회귀 판정은 두 조건을 모두 만족할 때만 합니다:
+        1. 중앙값이 threshold(기본 5%) 이상 느려짐
+        2. Mann-Whitney U 검정에서 p < alpha (노이즈가 아닌 유의미한 차이)
+
+⚠️ 주의사항:
+    샘플이 너무 적으면(repeat=3 → 최소 p ≈ 0.081) 검정이 유의미해질 수 없습니다.
+    compare는 이런 벤치마크를 "샘플 부족"으로 따로 표시합니다.
+    비교용 실행은 --repeat 5 이상을 권장합니다.
+
+🔄 다른 언어 비교:
+    - Java: JMH 결과 + jmh-benchmark-action
+    - Go: benchstat (같은 Mann-Whitney U 검정 사용)
+
+📚 참고: https://pkg.go.dev/golang.org/x/perf/cmd/benchstat
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import statistics
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from bench.core import REPO_ROOT, BenchResult, environment, format_time
+
+
+DEFAULT_STORE = REPO_ROOT / ".bench" / "results.jsonl"
+
+
+# =============================================================================
+# 1️⃣ 저장 / 조회
+# =============================================================================
+
+def append_run(
+    results: Iterable[BenchResult],
+    path: Path = DEFAULT_STORE,
+    env: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """결과를 run 레코드 한 줄로 추가하고, 추가한 레코드를 반환."""
+    env = env or environment()
+    record = {
+        "run_id": uuid.uuid4().hex[:12],
+        "commit": env["commit"],
+        "python": env["python"],
+        "environment": env,
+        "results": {r.name: r.to_dict() for r in results},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 한 줄 단위 append → 동시에 여러 실행이 써도 레코드가 섞이지 않음
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return record
+
+
+def load_runs(path: Path = DEFAULT_STORE) -> list[dict[str, Any]]:
+    """저장된 run 레코드 (오래된 순). 깨진 줄은 건너뜀."""
+    if not path.exists():
+        return []
+    runs = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                runs.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return runs
+
+
+def find_run(
+    runs: list[dict[str, Any]],
+    *,
+    commit: str = "",
+    python: str = "",
+    run_id: str = "",
+    before: dict[str, Any] | None = None,
+) -> dict[str, Any] | None:
+    """
+    조건에 맞는 가장 최근 run.
+
+    before가 주어지면 그 run보다 앞선 것 중에서만 찾습니다.
+    """
+    candidates = runs
+    if before is not None:
+        candidates = runs[: runs.index(before)]
+    for run in reversed(candidates):
+        if commit and not run["commit"].startswith(commit):
+            continue
+        if python and not run["python"].startswith(python):
+            continue
+        if run_id and not run["run_id"].startswith(run_id):
+            continue
+        return run
+    return None
+
+
+# =============================================================================
+# 2️⃣ 통계 검정
+# =============================================================================
+
+def mann_whitney_p(a: list[float], b: list[float]) -> float:
+    """
+    Mann-Whitney U 검정 양측 p-value (정규 근사, 동점 보정).
+
+    💡 정규분포를 가정하지 않으므로 꼬리가 긴 벤치마크 샘플에 적합합니다.
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = avg_rank
+        t = j - i + 1
+        tie_term += t**3 - t
+        i = j + 1
+
+    r1 = sum(rank for rank, (_, src) in zip(ranks, combined) if src == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    mean_u = n1 * n2 / 2
+    var_u = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if var_u <= 0:
+        return 1.0
+    # 연속성 보정
+    z = (abs(u1 - mean_u) - 0.5) / math.sqrt(var_u)
+    return min(1.0, 2 * (1 - statistics.NormalDist().cdf(max(z, 0.0))))
+
+
+def min_p_value(n1: int, n2: int) -> float:
+    """
+    샘플 수 n1, n2로 나올 수 있는 가장 작은 p-value (두 그룹이 완전히 분리된 경우).
+
+    💡 이 값이 alpha 이상이면 아무리 느려져도 회귀로 판정할 수 없습니다.
+       예: 3 vs 3 → 약 0.081, 5 vs 5 → 약 0.012
+    """
+    return mann_whitney_p([float(i) for i in range(n1)], [float(i) for i in range(n1, n1 + n2)])
+
+
+@dataclass
+class Comparison:
+    """벤치마크 하나의 baseline 대비 변화."""
+    name: str
+    baseline: float
+    current: float
+    p_value: float
+    regression: bool
+    improvement: bool
+    insufficient: bool = False  # 샘플이 적어 p < alpha가 불가능 (판정 불가)
+
+    @property
+    def change(self) -> float:
+        """중앙값 변화율 (+0.10 = 10% 느려짐)."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare_runs(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = 0.05,
+    alpha: float = 0.05,
+) -> list[Comparison]:
+    """두 run에 공통으로 있는 벤치마크를 비교."""
+    comparisons = []
+    for name in sorted(baseline["results"].keys() & current["results"].keys()):
+        base = baseline["results"][name]
+        cur = current["results"][name]
+        p = mann_whitney_p(base["samples"], cur["samples"])
+        insufficient = min_p_value(len(base["samples"]), len(cur["samples"])) >= alpha
+        # 동점 보정으로 정규 근사 p가 min_p_value 아래로 내려갈 수 있음 → 샘플 부족이면 판정 안 함
+        significant = p < alpha and not insufficient
+        change = cur["median"] / base["median"] - 1 if base["median"] else 0.0
+        comparisons.append(Comparison(
+            name=name,
+            baseline=base["median"],
+            current=cur["median"],
+            p_value=p,
+            regression=significant and change >= threshold,
+            improvement=significant and change <= -threshold,
+            insufficient=insufficient,
+        ))
+    return comparisons
+
+
+def format_comparison(comparisons: Iterable[Comparison]) -> str:
+    """비교 결과 표."""
+    rows = list(comparisons)
+    width = max([len(c.name) for c in rows] + [4])
+    lines = [
+        f"  {'name':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}  {'p':>6}",
+        "  " + "-" * (width + 44),
+    ]
+    for c in rows:
+        mark = (
+            "🔴 회귀" if c.regression
+            else "🟢 개선" if c.improvement
+            else "⚪ 샘플 부족" if c.insufficient
+            else ""
+        )
+        lines.append(
+            f"  {c.name:<{width}}  {format_time(c.baseline):>10}  {format_time(c.current):>10}  "
+            f"{c.change:>+7.1%}  {c.p_value:>6.3f}  {mark}"
+        )
+    return "\n".join(lines)
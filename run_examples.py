@@ -0,0 +1,175 @@
+"""
+run_examples.py - 모든 섹션 예제를 프로세스 풀에서 병렬 실행
+
+📌 핵심 개념:
+    `for f in *.py; do python "$f"; done`는 인터프리터를 하나씩 띄우고
+    sleep이 많은 데모(스레드 I/O, asyncio)를 순서대로 기다립니다.
+    이 러너는 각 예제의 main()을 ProcessPoolExecutor 워커에서 실행합니다.
+        - forkserver: 서버 프로세스가 한 번만 뜨고 워커는 fork로 생성
+        - max_tasks_per_child=1: 예제마다 새 워커 (전역 상태 격리)
+        - 파일 디스크립터(1, 2) 단위로 출력 캡처 → 자식 프로세스 출력까지 수집
+
+사용법:
+    python run_examples.py                      # 전체 실행
+    python run_examples.py 02-python-gotchas    # 섹션 지정
+    python run_examples.py -j 8 -q              # 워커 8개, 출력 숨김
+
+⚠️ 주의사항:
+    하나라도 실패하면 남은 예제를 취소하고 exit 1로 종료합니다.
+    워커가 죽어도(OOM, segfault) 러너는 traceback 대신 그 예제를 실패로 보고합니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from bench.discovery import example_files, load_example
+
+
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+@dataclass
+class ScriptResult:
+    """예제 하나의 실행 결과."""
+    path: str
+    ok: bool
+    elapsed: float
+    output: str
+    error: str = ""
+
+
+def run_script(path: str, marker: str | None = None) -> ScriptResult:
+    """
+    (워커) 예제 파일을 로드해 main()을 실행하고 출력을 캡처.
+
+    💡 sys.stdout만 바꾸면 예제가 만든 자식 프로세스의 출력은 놓칩니다.
+        fd 1, 2를 임시 파일로 dup2해서 모두 수집합니다.
+
+    marker 파일은 시작할 때 만들고 정상 종료하면 지웁니다.
+    워커가 죽으면 남아 있으므로 러너가 "어느 예제가 실행 중이었는지" 알 수 있습니다.
+    """
+    if marker is not None:
+        Path(marker).touch()
+    ok, error = True, ""
+    with tempfile.TemporaryFile(mode="w+b") as capture:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(capture.fileno(), 1)
+        os.dup2(capture.fileno(), 2)
+        start = time.perf_counter()
+        try:
+            os.chdir(Path(path).parent)  # 예제는 자기 디렉터리에서 실행된다고 가정
+            load_example(Path(path)).main()
+        except SystemExit as e:
+            ok = e.code in (None, 0)
+            error = "" if ok else f"SystemExit({e.code})"
+        except BaseException:
+            ok, error = False, traceback.format_exc()
+        elapsed = time.perf_counter() - start
+        sys.stdout.flush()
+        sys.stderr.flush()
+        capture.seek(0)
+        output = capture.read().decode("utf-8", errors="replace")
+    if marker is not None:
+        Path(marker).unlink(missing_ok=True)
+    return ScriptResult(path=path, ok=ok, elapsed=elapsed, output=output, error=error)
+
+
+def collect(targets: list[str]) -> list[Path]:
+    """인자(섹션 디렉터리 또는 파일) → 실행할 예제 파일 목록."""
+    if not targets:
+        return example_files(REPO_ROOT)
+    files: list[Path] = []
+    for target in targets:
+        path = (REPO_ROOT / target).resolve() if not Path(target).is_absolute() else Path(target)
+        files.extend(sorted(path.glob("*.py")) if path.is_dir() else [path])
+    return files
+
+
+def mp_context() -> multiprocessing.context.BaseContext:
+    """forkserver가 있으면 사용 (POSIX), 없으면 spawn."""
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    if "forkserver" in methods:
+        # 서버 프로세스에 미리 import → 워커는 fork만 하면 됨
+        ctx.set_forkserver_preload(["bench.discovery"])
+    return ctx
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="섹션 예제 병렬 실행")
+    parser.add_argument("targets", nargs="*", help="섹션 디렉터리 또는 파일 (기본: 전체)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="워커 수")
+    parser.add_argument("-q", "--quiet", action="store_true", help="예제 출력 숨김 (실패 시에는 출력)")
+    args = parser.parse_args(argv)
+
+    files = collect(args.targets)
+    if not files:
+        print("실행할 예제가 없습니다", file=sys.stderr)
+        return 1
+
+    print(f"🚀 예제 {len(files)}개, 워커 {args.jobs}개")
+    start = time.perf_counter()
+    results: list[ScriptResult] = []
+    failed: ScriptResult | None = None
+
+    with tempfile.TemporaryDirectory() as markers, ProcessPoolExecutor(
+        max_workers=args.jobs,
+        mp_context=mp_context(),
+        max_tasks_per_child=1,
+    ) as executor:
+        jobs: dict[Future[ScriptResult], tuple[str, Path]] = {}
+        for i, f in enumerate(files):
+            marker = Path(markers) / f"{i}.running"
+            jobs[executor.submit(run_script, str(f), str(marker))] = (str(f), marker)
+        pending = set(jobs)
+        while pending and failed is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    # 워커가 비정상 종료 (OOM, 예제 안의 segfault 등) → 풀 전체가 깨지므로
+                    # 실행 중이던(marker가 남은) 예제만 실패로 기록, 나머지는 취소와 같음
+                    path, marker = jobs[future]
+                    if not marker.exists():
+                        continue
+                    result = ScriptResult(path=path, ok=False, elapsed=0.0, output="",
+                                          error=f"워커 프로세스 비정상 종료: {e}")
+                results.append(result)
+                rel = os.path.relpath(result.path, REPO_ROOT)
+                mark = "✅" if result.ok else "❌"
+                print(f"{mark} {rel} ({result.elapsed:.2f}초)")
+                if not args.quiet or not result.ok:
+                    print(result.output.rstrip())
+                if not result.ok:
+                    print(result.error.rstrip())
+                    failed = result
+        # 첫 실패 시 아직 시작하지 않은 예제는 취소 (실행 중인 것은 끝날 때까지 대기)
+        executor.shutdown(cancel_futures=True)
+
+    total = time.perf_counter() - start
+    serial = sum(r.elapsed for r in results)
+    print("\n" + "=" * 60)
+    for r in sorted(results, key=lambda r: r.elapsed, reverse=True):
+        print(f"  {r.elapsed:7.2f}초  {'✅' if r.ok else '❌'} {os.path.relpath(r.path, REPO_ROOT)}")
+    print(f"\n  전체 {total:.2f}초 (예제 합계 {serial:.2f}초)")
+    if failed is not None:
+        print(f"  ❌ 실패: {os.path.relpath(failed.path, REPO_ROOT)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
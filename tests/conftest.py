@@ -0,0 +1,12 @@
+"""
+pytest 공통 설정
+
+예제 파일은 숫자로 시작해서 import할 수 없으므로 테스트에서도
+bench.discovery.load_example로 로드합니다:
+    memo = load_example(REPO_ROOT / "10-performance" / "05_memoize_cache.py")
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # 저장소 루트의 bench 패키지
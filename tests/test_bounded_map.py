@@ -0,0 +1,123 @@
+"""04-concurrency/06_async_bounded_map.py: 동시 실행 제한, 순서, 예외, lazy 입력."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Iterator
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+bm = load_example(REPO_ROOT / "04-concurrency" / "06_async_bounded_map.py")
+
+
+def test_results_in_input_order_with_bounded_concurrency() -> None:
+    running = peak = 0
+
+    async def work(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (i % 3))
+        running -= 1
+        return i * 2
+
+    results = asyncio.run(bm.bounded_map(work, range(50), limit=4))
+    assert results == [i * 2 for i in range(50)]
+    assert peak <= 4
+
+
+def test_first_error_is_raised_or_returned() -> None:
+    async def may_fail(i: int) -> int:
+        if i == 3:
+            raise ValueError(i)
+        return i
+
+    with pytest.raises(ValueError):
+        asyncio.run(bm.bounded_map(may_fail, range(10), limit=2))
+    results = asyncio.run(bm.bounded_map(may_fail, range(10), limit=2, return_exceptions=True))
+    assert isinstance(results[3], ValueError)
+    assert results[:3] == [0, 1, 2]
+
+
+def test_timeout_becomes_item_error() -> None:
+    async def sleepy(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    ok, errors = asyncio.run(bm.bounded_map_collect(sleepy, [0.0, 1.0, 0.0], limit=3, timeout=0.05))
+    assert ok == {0: 0.0, 2: 0.0}
+    (error,) = errors
+    assert (error.index, error.item) == (1, 1.0)
+    assert isinstance(error.error, TimeoutError)
+
+
+def test_input_is_consumed_lazily() -> None:
+    pulled = 0
+
+    def source() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(1_000_000):
+            pulled += 1
+            yield i
+
+    async def run() -> None:
+        async def echo(i: int) -> int:
+            await asyncio.sleep(0)
+            return i
+
+        stream = bm.stream_bounded(echo, source(), limit=5)
+        async for index, _ in stream:
+            if index >= 20:
+                break
+        await stream.aclose()
+
+    asyncio.run(run())
+    assert pulled < 100  # 100만 개를 미리 꺼내지 않음
+
+
+def test_collect_does_not_materialize_input() -> None:
+    pulled = 0
+
+    def source() -> Iterator[int]:
+        nonlocal pulled
+        for i in range(200):
+            pulled += 1
+            yield i
+
+    async def run() -> tuple[dict[int, int], list]:
+        seen_while_running = []
+
+        async def check(i: int) -> int:
+            seen_while_running.append(pulled)
+            await asyncio.sleep(0)
+            return i
+
+        ok, errors = await bm.bounded_map_collect(check, source(), limit=3)
+        assert min(seen_while_running) < 10  # 처리를 시작할 때 입력 전체를 읽지 않은 상태
+        return ok, errors
+
+    ok, errors = asyncio.run(run())
+    assert len(ok) == 200 and not errors
+
+
+def test_failing_source_raises_instead_of_hanging() -> None:
+    def broken() -> Iterator[int]:
+        yield 1
+        raise OSError("source failed")
+
+    async def echo(i: int) -> int:
+        return i
+
+    with pytest.raises(OSError):
+        asyncio.run(asyncio.wait_for(bm.bounded_map(echo, broken(), limit=3), 5))
+
+
+def test_invalid_limit() -> None:
+    async def echo(i: int) -> int:
+        return i
+
+    with pytest.raises(ValueError):
+        asyncio.run(bm.bounded_map(echo, [1], limit=0))
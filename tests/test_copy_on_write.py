@@ -0,0 +1,155 @@
+"""10-performance/10_copy_on_write.py: 무작위 연산 순서에서 cow_copy가 deepcopy와 같게 동작하는지."""
+
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+cow = load_example(REPO_ROOT / "10-performance" / "10_copy_on_write.py")
+
+
+class Box:
+    """프록시로 감쌀 수 없는 변경 가능한 값."""
+
+    def __init__(self, items: list[int]) -> None:
+        self.items = items
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Box) and other.items == self.items
+
+    def __repr__(self) -> str:
+        return f"Box({self.items})"
+
+
+def random_value(rng: random.Random, depth: int = 0) -> Any:
+    kind = rng.randrange(8 if depth < 3 else 4)
+    if kind == 0:
+        return rng.randrange(100)
+    if kind == 1:
+        return f"s{rng.randrange(100)}"
+    if kind == 2:
+        return (rng.randrange(10), [rng.randrange(10)])  # 변경 가능한 값을 담은 tuple
+    if kind == 3:
+        return {rng.randrange(10) for _ in range(2)}
+    if kind == 4:
+        return bytearray(b"ab")
+    if kind == 5:
+        return Box([rng.randrange(10)])
+    if kind == 6:
+        return [random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {f"k{i}": random_value(rng, depth + 1) for i in range(rng.randrange(4))}
+
+
+def plain(value: Any) -> Any:
+    return value.to_plain() if isinstance(value, cow._CowNode) else value
+
+
+def step(rng: random.Random, handles: list[tuple[Any, Any]]) -> None:
+    """같은 연산을 (cow 쪽, deepcopy 쪽)에 똑같이 적용. 꺼낸 값은 handles에 보관 (나중에 다시 씀)."""
+    c, d = rng.choice(handles)
+    if isinstance(d, dict):
+        op = rng.randrange(4)
+        if d and op == 0:
+            key = rng.choice(list(d))
+            handles.append((c[key], d[key]))
+        elif d and op == 1:
+            key = rng.choice(list(d))
+            del c[key], d[key]
+        else:
+            key = f"k{rng.randrange(6)}"
+            value = random_value(rng)
+            c[key], d[key] = copy.deepcopy(value), copy.deepcopy(value)
+    elif isinstance(d, list):
+        op = rng.randrange(8)
+        n = len(d)
+        if n and op == 0:
+            i = rng.randrange(-n, n)
+            handles.append((c[i], d[i]))
+        elif n and op == 1:
+            i = rng.randrange(-n, n)
+            del c[i], d[i]
+        elif n and op == 2:
+            sl = slice(rng.randrange(n), rng.randrange(n + 1), rng.choice([1, 1, 2, -1]))
+            del c[sl], d[sl]
+        elif n and op == 3:
+            handles.append((c.pop(), d.pop()))
+        elif op == 4:
+            c.reverse()
+            d.reverse()
+        elif n and op == 5:
+            i = rng.randrange(n)
+            value = random_value(rng)
+            c[i], d[i] = copy.deepcopy(value), copy.deepcopy(value)
+        else:
+            i = rng.randrange(-n - 2, n + 3)  # 범위 밖 인덱스도 list.insert처럼
+            value = random_value(rng)
+            c.insert(i, copy.deepcopy(value))
+            d.insert(i, copy.deepcopy(value))
+    elif isinstance(d, set):
+        value = rng.randrange(20)
+        c.add(value)
+        d.add(value)
+    elif isinstance(d, bytearray):
+        c.append(120)
+        d.append(120)
+    elif isinstance(d, Box):
+        c.items.append(7)
+        d.items.append(7)
+    elif isinstance(d, tuple):
+        handles.append((c[1], d[1]))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_deepcopy_under_random_operations(seed: int) -> None:
+    rng = random.Random(seed)
+    original = {f"k{i}": random_value(rng) for i in range(4)}
+    original["rows"] = [random_value(rng) for _ in range(4)]
+    snapshot = copy.deepcopy(original)
+
+    root_cow, root_deep = cow.cow_copy(original), copy.deepcopy(original)
+    handles: list[tuple[Any, Any]] = [(root_cow, root_deep)]
+    for _ in range(150):
+        step(rng, handles)
+        assert root_cow == root_deep
+
+    assert original == snapshot  # 원본은 절대 안 바뀜
+    assert root_cow.to_plain() == root_deep
+    for c, d in handles:  # 떨어져 나간 하위 값까지 deepcopy 쪽과 같은 상태
+        assert plain(c) == d
+
+
+def test_list_insert_keeps_held_child_proxy_live() -> None:
+    original = {"rows": [{"n": 0}, {"n": 1}]}
+    cfg = cow.cow_copy(original)
+    second = cfg["rows"][1]
+    cfg["rows"].insert(0, {"n": -1})
+    second["n"] = 10
+    assert cfg["rows"][2]["n"] == 10
+    assert cfg["rows"][2] is second
+    assert original == {"rows": [{"n": 0}, {"n": 1}]}
+
+
+def test_mutable_leaf_does_not_leak_into_original() -> None:
+    original = {"tags": {"a"}, "raw": bytearray(b"x"), "box": Box([1])}
+    cfg = cow.cow_copy(original)
+    cfg["tags"].add("LEAK")
+    cfg["raw"].append(0)
+    cfg["box"].items.append(2)
+    assert original == {"tags": {"a"}, "raw": bytearray(b"x"), "box": Box([1])}
+    assert cfg["tags"] == {"a", "LEAK"}
+    assert cfg["tags"] is cfg["tags"]  # 같은 key는 같은 복사본
+
+
+def test_untouched_subtrees_stay_shared() -> None:
+    original = {"a": {"x": 1}, "b": {"y": (1, 2)}}
+    cfg = cow.cow_copy(original)
+    cfg["a"]["x"] = 2
+    assert not cfg.shared and not cfg["a"].shared
+    assert cfg["b"].shared
+    assert cfg["b"]["y"] is original["b"]["y"]  # 불변 tuple은 복사하지 않음
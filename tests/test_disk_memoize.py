@@ -0,0 +1,166 @@
+"""10-performance/08_disk_memoize.py: 안정적인 키, DiskCache LRU 삭제, disk_memoize."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+EXAMPLE = REPO_ROOT / "10-performance" / "08_disk_memoize.py"
+disk = load_example(EXAMPLE)
+
+
+def test_argument_key_ignores_dict_and_set_order() -> None:
+    a = disk.argument_key("f", ({"x": 1, "y": {2, 3}},), {"b": 1, "a": 2})
+    b = disk.argument_key("f", ({"y": {3, 2}, "x": 1},), {"a": 2, "b": 1})
+    assert a == b
+
+
+def test_argument_key_distinguishes_types() -> None:
+    keys = {disk.argument_key("f", (v,), {}) for v in (1, 1.0, True, "1", b"1", (1,), [1])}
+    assert len(keys) == 7
+
+
+def test_argument_key_is_stable_across_processes() -> None:
+    code = (
+        f"import sys; sys.path.insert(0, {str(REPO_ROOT)!r})\n"
+        "from bench.discovery import load_example\n"
+        f"m = load_example(__import__('pathlib').Path({str(EXAMPLE)!r}))\n"
+        "print(m.argument_key('f', ({'a', 'b', 'c'}, {'k': frozenset({1, 'x'})}), {}))\n"
+    )
+    keys = set()
+    for seed in ("1", "2", "3"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True,
+                             text=True, check=True)
+        keys.add(out.stdout.strip())
+    assert len(keys) == 1
+
+
+def test_argument_key_rejects_unsupported_types() -> None:
+    with pytest.raises(TypeError):
+        disk.argument_key("f", (object(),), {})
+    with pytest.raises(TypeError):
+        disk.argument_key("f", ([{"nested": object()}],), {})
+
+
+def test_disk_cache_evicts_least_recently_accessed(tmp_path: Path) -> None:
+    cache = disk.DiskCache(tmp_path / "c.sqlite3", max_entries=2)
+    try:
+        cache.put("a", "f", 1)
+        time.sleep(0.01)
+        cache.put("b", "f", 2)
+        time.sleep(0.01)
+        assert cache.get("a") == (True, 1)  # 접근 시각은 다음 put 전에 기록됨
+        time.sleep(0.01)
+        cache.put("c", "f", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.evictions == 1
+        assert cache.stats()[0] == 2
+    finally:
+        cache.close()
+
+
+def test_disk_cache_without_touch_is_fifo(tmp_path: Path) -> None:
+    cache = disk.DiskCache(tmp_path / "c.sqlite3", max_entries=2, touch=False)
+    try:
+        cache.put("a", "f", 1)
+        time.sleep(0.01)
+        cache.put("b", "f", 2)
+        cache.get("a")
+        time.sleep(0.01)
+        cache.put("c", "f", 3)
+        assert cache.get("a") == (False, None)
+    finally:
+        cache.close()
+
+
+def test_disk_cache_respects_max_bytes(tmp_path: Path) -> None:
+    cache = disk.DiskCache(tmp_path / "c.sqlite3", max_bytes=3_000)
+    try:
+        for i in range(10):
+            cache.put(str(i), "f", b"x" * 1_000)
+        entries, size = cache.stats()
+        assert size <= 3_000
+        assert entries == 2  # 1_000바이트 + pickle 헤더 → 3개는 한도 초과
+        cache.put("big", "f", b"x" * 10_000)  # 한도보다 큰 항목은 저장하지 않음
+        assert cache.get("big") == (False, None)
+    finally:
+        cache.close()
+
+
+def test_disk_cache_clear_by_func(tmp_path: Path) -> None:
+    cache = disk.DiskCache(tmp_path / "c.sqlite3")
+    try:
+        cache.put("a", "f", 1)
+        cache.put("b", "g", 2)
+        cache.clear("f")
+        assert cache.stats("f") == (0, 0)
+        assert cache.stats("g")[0] == 1
+    finally:
+        cache.close()
+
+
+def test_disk_memoize_persists_between_instances(tmp_path: Path) -> None:
+    db = tmp_path / "m.sqlite3"
+    calls = []
+
+    def slow_add(a: int, b: int) -> int:
+        calls.append((a, b))
+        return a + b
+
+    first = disk.disk_memoize(slow_add, path=db)
+    assert first(1, 2) == 3
+    assert first(1, 2) == 3
+    first.cache.close()
+
+    second = disk.disk_memoize(slow_add, path=db)  # 새 프로세스처럼 연결부터 새로
+    assert second(1, 2) == 3
+    assert calls == [(1, 2)]
+    assert second.cache_info().hits == 1
+    second.cache.close()
+
+
+def test_disk_memoize_version_invalidates(tmp_path: Path) -> None:
+    def square(x: int) -> int:
+        return x * x
+
+    v1 = disk.disk_memoize(square, path=tmp_path / "m.sqlite3")
+    v2 = disk.disk_memoize(square, path=tmp_path / "m.sqlite3", version="v2")
+    assert v1.fingerprint != v2.fingerprint
+    v1(3)
+    v2(3)
+    assert v2.cache_info().misses == 1
+    v1.cache.close()
+    v2.cache.close()
+
+
+def test_disk_memoize_custom_key(tmp_path: Path) -> None:
+    class Model:
+        def __init__(self, name: str) -> None:
+            self.name = name
+
+    @disk.disk_memoize(path=tmp_path / "m.sqlite3", key=lambda model, x: (model.name, x))
+    def predict(model: Model, x: int) -> str:
+        return f"{model.name}:{x}"
+
+    assert predict(Model("a"), 1) == "a:1"
+    assert predict(Model("a"), 1) == "a:1"  # 다른 객체라도 key가 같으면 적중
+    assert predict.cache_info().hits == 1
+    predict.cache.close()
+
+    @disk.disk_memoize(path=tmp_path / "m.sqlite3")
+    def no_key(model: Model) -> str:
+        return model.name
+
+    with pytest.raises(TypeError):
+        no_key(Model("a"))
+    no_key.cache.close()
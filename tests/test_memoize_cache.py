@@ -0,0 +1,142 @@
+"""10-performance/05_memoize_cache.py: LRU/LFU 퇴출, TTL 만료, memoize."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+memo = load_example(REPO_ROOT / "10-performance" / "05_memoize_cache.py")
+
+
+def test_lru_evicts_least_recently_used() -> None:
+    store = memo.LRUStore(2)
+    store.put("a", 1, 0.0)
+    store.put("b", 2, 0.0)
+    store.get("a", 0.0)                    # a가 최근 → b가 가장 오래 안 씀
+    assert store.put("c", 3, 0.0) is True  # 퇴출 발생
+    assert store.get("b", 0.0) == (memo._MISSING, False)
+    assert store.get("a", 0.0) == (1, False)
+    assert store.get("c", 0.0) == (3, False)
+
+
+def test_lru_overwrite_does_not_evict() -> None:
+    store = memo.LRUStore(2)
+    store.put("a", 1, 0.0)
+    store.put("b", 2, 0.0)
+    assert store.put("a", 10, 0.0) is False
+    assert len(store) == 2
+    assert store.get("a", 0.0) == (10, False)
+
+
+def test_lfu_evicts_least_frequently_used() -> None:
+    store = memo.LFUStore(2)
+    store.put("a", 1, 0.0)
+    store.put("b", 2, 0.0)
+    for _ in range(3):
+        store.get("a", 0.0)
+    store.get("b", 0.0)
+    assert store.put("c", 3, 0.0) is True  # b(2회) < a(4회) → b 퇴출
+    assert store.get("b", 0.0)[0] is memo._MISSING
+    assert store.get("a", 0.0) == (1, False)
+
+
+def test_lfu_ties_evict_oldest() -> None:
+    store = memo.LFUStore(2)
+    store.put("a", 1, 0.0)
+    store.put("b", 2, 0.0)
+    store.put("c", 3, 0.0)  # 둘 다 1회 → 먼저 들어온 a
+    assert store.get("a", 0.0)[0] is memo._MISSING
+    assert store.get("b", 0.0) == (2, False)
+
+
+@pytest.mark.parametrize("store_cls", [memo.LRUStore, memo.LFUStore])
+def test_expired_entry_is_removed(store_cls: type) -> None:
+    store = store_cls(4)
+    store.put("a", 1, 10.0)
+    assert store.get("a", 5.0) == (1, False)
+    assert store.get("a", 10.0) == (memo._MISSING, True)
+    assert len(store) == 0
+
+
+def test_lfu_recovers_min_freq_after_expiry() -> None:
+    store = memo.LFUStore(2)
+    store.put("a", 1, 10.0)
+    store.put("b", 2, 0.0)
+    store.get("b", 0.0)
+    store.get("a", 20.0)       # 만료 삭제 → 1회 버킷이 사라짐
+    store.put("c", 3, 0.0)
+    assert store.put("d", 4, 0.0) is True
+    assert len(store) == 2
+
+
+@pytest.mark.parametrize(("maxsize", "shards"), [(10, 3), (5, 8), (128, 16)])
+def test_shard_capacities_sum_to_maxsize(maxsize: int, shards: int) -> None:
+    cache = memo.BoundedCache(maxsize, shards=shards)
+    assert sum(s.store.maxsize for s in cache._shards) == maxsize
+    for i in range(maxsize * 3):
+        cache.put(i, i)
+    assert len(cache) <= maxsize
+
+
+def test_bounded_cache_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(memo.time, "monotonic", lambda: now[0])
+    cache = memo.BoundedCache(4, ttl=1.0)
+    cache.put("k", "v")
+    assert cache.get("k") == "v"
+    now[0] += 1.0
+    assert cache.get("k") is None
+    info = cache.info()
+    assert (info.hits, info.misses, info.expirations) == (1, 1, 1)
+
+
+def test_memoize_counts_and_clear() -> None:
+    calls = []
+
+    @memo.memoize(maxsize=2)
+    def double(x: int) -> int:
+        calls.append(x)
+        return x * 2
+
+    assert [double(1), double(1), double(2), double(3), double(1)] == [2, 2, 4, 6, 2]
+    assert calls == [1, 2, 3, 1]  # 3을 넣을 때 1이 퇴출됨
+    info = double.cache_info()
+    assert (info.hits, info.misses, info.currsize, info.evictions) == (1, 4, 2, 2)
+    double.cache_clear()
+    assert double.cache_info().currsize == 0
+
+
+def test_memoize_typed_and_kwargs_keys() -> None:
+    @memo.memoize(typed=True)
+    def ident(x: object, *, tag: str = "") -> tuple[object, str]:
+        return x, tag
+
+    assert ident(1) == (1, "")
+    assert type(ident(1.0)[0]) is float  # typed: 1과 1.0은 다른 키
+    assert ident(1, tag="a") == (1, "a")
+    assert ident.cache_info().misses == 3
+
+
+def test_memoize_is_thread_safe() -> None:
+    @memo.memoize(maxsize=64, shards=4)
+    def square(x: int) -> int:
+        return x * x
+
+    errors = []
+
+    def work() -> None:
+        for i in range(2_000):
+            if square(i % 100) != (i % 100) ** 2:
+                errors.append(i)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not errors
+    assert len(square.cache) <= 64
@@ -0,0 +1,126 @@
+"""10-performance/09_persistent_structures.py: PVector / PMap을 list / dict와 무작위 비교."""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+ps = load_example(REPO_ROOT / "10-performance" / "09_persistent_structures.py")
+
+
+class Collide:
+    """해시가 전부 같은 키 (HAMT 충돌 노드 경로)."""
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def __hash__(self) -> int:
+        return 42
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Collide) and other.n == self.n
+
+    def __repr__(self) -> str:
+        return f"Collide({self.n})"
+
+
+@pytest.mark.parametrize("size", [0, 1, 31, 32, 33, 1024, 1025, 40_000])
+def test_pvector_from_iterable_and_index(size: int) -> None:
+    v = ps.PVector.from_iterable(range(size))
+    assert len(v) == size
+    assert v.tolist() == list(range(size))
+    if size:
+        assert v[-1] == size - 1
+        assert v[size // 2] == size // 2
+    with pytest.raises(IndexError):
+        v[size]
+
+
+def test_pvector_append_across_level_boundaries() -> None:
+    v = ps.PVector()
+    model = []
+    for i in range(33 * 32 + 5):  # 1단계 → 2단계 → 3단계
+        v = v.append(i)
+        model.append(i)
+    assert v.tolist() == model
+    assert v[32 * 32] == 32 * 32
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pvector_matches_list_and_keeps_old_versions(seed: int) -> None:
+    rng = random.Random(seed)
+    versions: list[tuple[Any, list[int]]] = [(ps.PVector.from_iterable(range(50)), list(range(50)))]
+    for _ in range(500):
+        v, model = versions[rng.randrange(len(versions))]  # 아무 예전 버전에서 분기
+        if rng.random() < 0.5 and model:
+            i = rng.randrange(-len(model), len(model))
+            value = rng.randrange(10_000)
+            v, model = v.set(i, value), model.copy()
+            model[i] = value
+        else:
+            value = rng.randrange(10_000)
+            v, model = v.append(value), model + [value]
+        versions.append((v, model))
+    for v, model in versions:
+        assert v == model
+        assert v[5:20:3].tolist() == model[5:20:3]
+
+
+def test_pmap_basic_and_persistence() -> None:
+    m1 = ps.PMap.from_mapping({"a": 1, "b": 2})
+    m2 = m1.set("a", 10)
+    m3 = m2.delete("b")
+    assert dict(m1) == {"a": 1, "b": 2}
+    assert dict(m2) == {"a": 10, "b": 2}
+    assert dict(m3) == {"a": 10}
+    assert dict(m1.set("a", 1)) == dict(m1)
+    with pytest.raises(KeyError):
+        m3.delete("b")
+    with pytest.raises(KeyError):
+        m3["b"]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pmap_matches_dict(seed: int) -> None:
+    rng = random.Random(seed)
+    keys: list[Any] = [*range(300), *(f"k{i}" for i in range(100)), *(Collide(i) for i in range(10))]
+    versions: list[tuple[Any, dict[Any, int]]] = [(ps.PMap(), {})]
+    for _ in range(2_000):
+        m, model = versions[rng.randrange(len(versions))] if rng.random() < 0.1 else versions[-1]
+        key = rng.choice(keys)
+        if key in model and rng.random() < 0.4:
+            m, model = m.delete(key), {k: v for k, v in model.items() if k != key}
+        else:
+            value = rng.randrange(1_000)
+            m, model = m.set(key, value), {**model, key: value}
+        versions.append((m, model))
+    for m, model in versions[::50] + versions[-1:]:
+        assert len(m) == len(model)
+        assert dict(m.items()) == model
+        for key in keys[::7]:
+            assert m.get(key) == model.get(key)
+
+
+def test_pmap_from_mapping_with_collisions() -> None:
+    pairs = {Collide(i): i for i in range(5)}
+    m = ps.PMap.from_mapping(pairs)
+    assert dict(m) == pairs
+    m2 = m.delete(Collide(2))
+    assert Collide(2) not in m2 and len(m2) == 4
+    assert Collide(2) in m
+
+
+def test_freeze_thaw_and_nested_update() -> None:
+    tree = {"a": {"b": [1, 2, {"c": 3}]}, "d": {"e": [4]}}
+    frozen = ps.freeze(tree)
+    updated = ps.set_in(frozen, ["a", "b", 2, "c"], 99)
+    assert ps.thaw(frozen) == tree
+    assert ps.get_in(updated, ["a", "b", 2, "c"]) == 99
+    assert ps.get_in(updated, ["a", "missing"], "default") == "default"
+    assert updated["d"] is frozen["d"]  # 바뀌지 않은 서브트리는 공유
+    assert updated["a"] is not frozen["a"]
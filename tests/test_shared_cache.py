@@ -0,0 +1,79 @@
+"""04-concurrency/12_shared_cache.py: shared_memory 캐시 조회/저장, 교체, 프로세스 간 공유."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+sc = load_example(REPO_ROOT / "04-concurrency" / "12_shared_cache.py")
+
+
+@pytest.fixture
+def cache(request: pytest.FixtureRequest) -> Iterator[Any]:
+    buckets = getattr(request, "param", 16)
+    cache = sc.SharedCache.create(buckets=buckets, value_size=32)
+    try:
+        yield cache
+    finally:
+        cache.close()
+        cache.unlink()
+
+
+def test_get_put_roundtrip(cache: Any) -> None:
+    assert cache.get("missing") is None
+    assert cache.put("a", b"alpha")
+    assert cache.put(("tuple", 1), b"")
+    assert cache.get("a") == b"alpha"
+    assert cache.get(("tuple", 1)) == b""
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_overwrite_same_key(cache: Any) -> None:
+    cache.put("k", b"first value")
+    cache.put("k", b"2nd")
+    assert cache.get("k") == b"2nd"
+
+
+def test_value_larger_than_slot_is_not_cached(cache: Any) -> None:
+    assert not cache.put("big", b"x" * 33)
+    assert cache.get("big") is None
+    assert cache.put("fits", b"x" * 32)
+
+
+@pytest.mark.parametrize("cache", [1], indirect=True)
+def test_full_bucket_replaces_without_corruption(cache: Any) -> None:
+    values = {i: f"value-{i}".encode() for i in range(50)}
+    for key, value in values.items():
+        cache.put(key, value)
+    found = {key: cache.get(key) for key in values}
+    present = {k: v for k, v in found.items() if v is not None}
+    assert 0 < len(present) <= sc.WAYS  # 버킷 1개 × WAYS 슬롯
+    assert all(values[k] == v for k, v in present.items())  # 남은 값은 모두 정확
+    assert cache.get(49) == values[49]  # 마지막에 쓴 값은 항상 남음
+
+
+def test_key_digest_is_process_independent() -> None:
+    assert sc.key_digest(("a", 1)) == sc.key_digest(("a", 1))
+    assert len(sc.key_digest(1)) == 16
+    assert sc.key_digest(1) != sc.key_digest("1")
+
+
+def test_workers_share_results() -> None:
+    ctx = sc.default_context()
+    cache = sc.SharedCache.create(buckets=64, value_size=32, ctx=ctx)
+    try:
+        with ProcessPoolExecutor(2, mp_context=ctx, initializer=sc.attach_worker,
+                                 initargs=(cache.spec(),)) as pool:
+            first = list(pool.map(sc.shared_task, range(20)))
+            second = list(pool.map(sc.shared_task, range(20)))
+        assert not any(first)
+        assert all(second)  # 어느 워커가 계산했든 적중
+        assert all(cache.get(k) == sc.expensive(k) for k in range(20))
+    finally:
+        cache.close()
+        cache.unlink()
@@ -0,0 +1,126 @@
+"""04-concurrency/11_single_flight.py: 합치기, 예외, 취소, ttl."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+sf = load_example(REPO_ROOT / "04-concurrency" / "11_single_flight.py")
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    calls = 0
+
+    async def load(key: str) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def run() -> list[str]:
+        shared = sf.single_flight(load)
+        results = await asyncio.gather(*(shared("a") for _ in range(10)), shared("b"))
+        assert shared.group.shared == 9
+        return results
+
+    assert asyncio.run(run()) == ["A"] * 10 + ["B"]
+    assert calls == 2
+
+
+def test_exception_reaches_every_waiter_and_is_not_cached() -> None:
+    attempts = 0
+
+    @sf.single_flight(ttl=60)
+    async def flaky() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise ValueError("boom")
+        return "ok"
+
+    async def run() -> None:
+        results = await asyncio.gather(*(flaky() for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert await flaky() == "ok"
+        assert await flaky() == "ok"
+
+    asyncio.run(run())
+    assert attempts == 2
+    assert flaky.group.cache_hits == 1
+
+
+def test_partial_cancel_keeps_shared_task() -> None:
+    async def run() -> None:
+        @sf.single_flight
+        async def slow() -> str:
+            await asyncio.sleep(0.05)
+            return "done"
+
+        a = asyncio.create_task(slow())
+        b = asyncio.create_task(slow())
+        await asyncio.sleep(0.01)
+        a.cancel()
+        assert await b == "done"
+        with pytest.raises(asyncio.CancelledError):
+            await a
+
+    asyncio.run(run())
+
+
+def test_all_cancelled_then_new_call_starts_fresh() -> None:
+    async def run() -> None:
+        started = 0
+
+        async def slow() -> int:
+            nonlocal started
+            started += 1
+            await asyncio.sleep(0.05)
+            return started
+
+        group = sf.SingleFlight()
+        first = asyncio.create_task(group.do("k", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert group.inflight == 0
+        # 취소된 Task의 done 콜백이 돌기 전에 새 호출이 같은 키를 차지
+        second = asyncio.create_task(group.do("k", slow))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert group.inflight == 1  # 예전 호출의 정리가 새 호출을 지우지 않음
+        third = asyncio.create_task(group.do("k", slow))
+        assert await second == await third == 2
+        assert group.executions == 2
+
+    asyncio.run(run())
+
+
+def test_ttl_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(sf.time, "monotonic", lambda: now[0])
+    calls = 0
+
+    @sf.single_flight(ttl=1.0)
+    async def value() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    async def run() -> list[int]:
+        out = [await value(), await value()]
+        now[0] = 2.0
+        out.append(await value())
+        return out
+
+    assert asyncio.run(run()) == [1, 1, 2]
+
+
+def test_make_key_separates_args_and_kwargs() -> None:
+    assert sf.make_key((1,), {}) != sf.make_key((), {"x": 1})
+    assert sf.make_key((), {"a": 1, "b": 2}) == sf.make_key((), {"b": 2, "a": 1})
@@ -0,0 +1,71 @@
+"""bench.store: Mann-Whitney U 검정과 run 비교."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from bench.store import compare_runs, mann_whitney_p, min_p_value
+
+
+def _run(**medians_and_samples: list[float]) -> dict[str, Any]:
+    """compare_runs가 읽는 모양의 run 레코드 (samples만 있으면 됨)."""
+    results = {}
+    for name, samples in medians_and_samples.items():
+        ordered = sorted(samples)
+        results[name] = {"samples": samples, "median": ordered[len(ordered) // 2]}
+    return {"results": results}
+
+
+def test_identical_samples_are_not_significant() -> None:
+    assert mann_whitney_p([1.0, 2.0, 3.0, 4.0], [1.0, 2.0, 3.0, 4.0]) == 1.0
+
+
+def test_separated_samples_are_significant() -> None:
+    a = [1.0 + i * 0.01 for i in range(10)]
+    b = [2.0 + i * 0.01 for i in range(10)]
+    assert mann_whitney_p(a, b) < 0.001
+    assert mann_whitney_p(a, b) == pytest.approx(mann_whitney_p(b, a))
+
+
+def test_empty_sample_gives_p_one() -> None:
+    assert mann_whitney_p([], [1.0, 2.0]) == 1.0
+
+
+def test_all_ties_gives_p_one() -> None:
+    assert mann_whitney_p([5.0] * 5, [5.0] * 5) == 1.0
+
+
+@pytest.mark.parametrize(("n", "expected"), [(3, 0.081), (5, 0.012)])
+def test_min_p_value_matches_docstring(n: int, expected: float) -> None:
+    assert min_p_value(n, n) == pytest.approx(expected, abs=0.001)
+
+
+def test_compare_runs_flags_regression_and_improvement() -> None:
+    fast = [1.0, 1.01, 1.02, 1.03, 1.04, 1.05]
+    slow = [1.5, 1.51, 1.52, 1.53, 1.54, 1.55]
+    baseline = _run(a=fast, b=slow, c=fast, only_base=fast)
+    current = _run(a=slow, b=fast, c=list(fast), only_current=fast)
+
+    result = {c.name: c for c in compare_runs(baseline, current)}
+
+    assert sorted(result) == ["a", "b", "c"]  # 양쪽에 다 있는 것만
+    assert result["a"].regression and not result["a"].improvement
+    assert result["a"].change == pytest.approx(0.5, abs=0.05)
+    assert result["b"].improvement and not result["b"].regression
+    assert not result["c"].regression and not result["c"].improvement
+
+
+def test_compare_runs_ignores_change_below_threshold() -> None:
+    base = [1.0, 1.001, 1.002, 1.003, 1.004, 1.005]
+    cur = [v * 1.02 for v in base]  # 유의미하지만 2% → threshold 5% 미만
+    (c,) = compare_runs(_run(a=base), _run(a=cur))
+    assert c.p_value < 0.05
+    assert not c.regression
+
+
+def test_compare_runs_marks_insufficient_samples() -> None:
+    (c,) = compare_runs(_run(a=[1.0, 1.0, 1.0]), _run(a=[9.0, 9.0, 9.0]))
+    assert c.insufficient
+    assert not c.regression  # repeat=3으로는 p < 0.05가 불가능
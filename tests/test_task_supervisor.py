@@ -0,0 +1,131 @@
+"""04-concurrency/09_task_supervisor.py: backpressure, 재시작, 취소, 종료 후 제출 거부."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from bench.core import REPO_ROOT
+from bench.discovery import load_example
+
+ts = load_example(REPO_ROOT / "04-concurrency" / "09_task_supervisor.py")
+
+
+def test_runs_all_jobs_with_bounded_concurrency() -> None:
+    running = peak = done = 0
+
+    async def job() -> None:
+        nonlocal running, peak, done
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        done += 1
+
+    async def run() -> ts.SupervisorStats:
+        async with ts.Supervisor(max_running=5, max_queued=10) as sup:
+            for _ in range(100):
+                await sup.submit(job)
+                assert sup.stats.queued <= 10
+        return sup.stats
+
+    stats = asyncio.run(run())
+    assert done == 100
+    assert peak <= 5
+    assert (stats.completed, stats.failed, stats.running, stats.queued) == (100, 0, 0, 0)
+
+
+def test_try_submit_reports_full_queue() -> None:
+    async def run() -> list[bool]:
+        gate = asyncio.Event()
+        async with ts.Supervisor(max_running=1, max_queued=2) as sup:
+            accepted = [sup.try_submit(gate.wait)]
+            await asyncio.sleep(0)  # 워커가 첫 작업을 가져감
+            accepted += [sup.try_submit(gate.wait) for _ in range(3)]
+            gate.set()
+        return accepted
+
+    assert asyncio.run(run()) == [True, True, True, False]
+
+
+def test_failed_job_is_restarted_then_recorded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ts, "backoff_delay", lambda attempt, base, cap: 0)
+    attempts = {"flaky": 0, "broken": 0}
+
+    def failing(name: str, fail_times: int) -> ts.JobFactory:
+        async def job() -> None:
+            attempts[name] += 1
+            if attempts[name] <= fail_times:
+                raise RuntimeError(name)
+        return job
+
+    async def run() -> ts.Supervisor:
+        async with ts.Supervisor(max_running=2, max_restarts=3) as sup:
+            await sup.submit(failing("flaky", 2), name="flaky")
+            await sup.submit(failing("broken", 99), name="broken")
+        return sup
+
+    sup = asyncio.run(run())
+    assert attempts == {"flaky": 3, "broken": 4}
+    assert (sup.stats.completed, sup.stats.failed, sup.stats.restarts) == (1, 1, 5)
+    (failure,) = sup.failures
+    assert (failure.name, failure.attempts) == ("broken", 4)
+    assert isinstance(failure.error, RuntimeError)
+
+
+def test_backoff_delay_is_capped() -> None:
+    assert all(0 <= ts.backoff_delay(attempt, 0.1, 1.0) <= 1.0 for attempt in range(20))
+
+
+def test_cancel_stops_long_running_jobs_and_rejects_new_ones() -> None:
+    async def run() -> ts.Supervisor:
+        async def forever() -> None:
+            while True:
+                await asyncio.sleep(0.001)
+
+        async with ts.Supervisor(max_running=2, max_queued=4) as sup:
+            for _ in range(5):
+                await sup.submit(forever)
+            await asyncio.sleep(0.01)
+            sup.cancel()
+            with pytest.raises(RuntimeError):
+                await sup.submit(forever)
+            with pytest.raises(RuntimeError):
+                sup.try_submit(forever)
+        return sup
+
+    sup = asyncio.run(asyncio.wait_for(run(), 5))
+    assert sup.stats.queued == 0
+    assert sup.stats.completed == 0
+
+
+def test_submit_after_exit_is_rejected() -> None:
+    async def run() -> None:
+        async with ts.Supervisor(max_running=1) as sup:
+            pass
+        with pytest.raises(RuntimeError):
+            await sup.submit(asyncio.sleep, name="late")
+
+    asyncio.run(run())
+
+
+def test_exception_in_block_cancels_workers() -> None:
+    async def run() -> bool:
+        seen = asyncio.Event()
+
+        async def slow() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                seen.set()
+                raise
+
+        with pytest.raises(ExceptionGroup):  # TaskGroup이 블록의 예외를 묶어서 다시 raise
+            async with ts.Supervisor(max_running=1) as sup:
+                await sup.submit(slow)
+                await asyncio.sleep(0.01)
+                raise ValueError("stop")
+        return seen.is_set()
+
+    assert asyncio.run(asyncio.wait_for(run(), 5))